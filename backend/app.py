@@ -1,39 +1,69 @@
 import re
-import threading
+from itertools import islice
 from datetime import datetime
-import random
+import zipfile
 from urllib.parse import unquote
-import pytesseract
-import unicodedata
-from PIL import Image
-from cryptography.hazmat.primitives import padding
-from werkzeug.utils import secure_filename
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
-from models import db, init_db, Reviewer, Article, Review, Log, Message, BlurData, Keyword
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import joinedload, selectinload
+from crypto import encrypt_data, decrypt_data, encrypt_many, decrypt_many, blind_index, email_blind_index
+from record_cache import decrypted_article, decrypted_articles, decrypted_reviewer, decrypted_reviewers, \
+    invalidate_article, cache_stats
+from config import configure_database
+from models import db, init_db, create_schema, run_migrations, Reviewer, Article, Review, Log, Message, BlurData, \
+    Keyword, Job, PdfVersion
+from jobs import job_handler, enqueue_job
+from pagination import page_size_from, encode_cursor, decode_cursor, parse_datetime, paginate
+from redaction import RedactionEngine
+from text_store import document_pages
+from pdf_delivery import send_pdf
+from artifacts import new_working_path, add_version, add_upload_versions, collect_garbage, artifact_path, \
+    source_version, discard_artifacts
+from ingestion import BULK_UPLOAD_MAX_ITEMS, generate_tracking_codes, parse_metadata, stage_multipart_files, \
+    stage_zip_archive, discard_staged, validate_item, referenced_files
+from renditions import fields_key, rendition_key, get_rendition, put_rendition
+from classification import get_category_index, normalize_text, extract_org_keywords
+from keyword_matcher import get_keyword_matcher
+from messaging import AUTHOR, REVIEWER, sender_role_for, record_message, mark_read, \
+    backfill_sender_roles, backfill_articles, unread_counts
+from log_events import log_event, log_events, render_events
+from log_segments import list_segments, segment_path, iter_segment_rows, iter_segment_rows_desc, segment_log_stats
+from events import get_broker, publish_article_event, stream_events
+from recommendation import get_recommendation_index, score_matrix, top_k, balanced_assignment, reviewer_loads
 import fitz
 import spacy
-import base64
 import os
 from fpdf import FPDF
 from fitz import Rect
-from unidecode import unidecode  #pdfteki türkçe karakterleri ingilizceye benzetme
-from rapidfuzz import fuzz  #iki string arasındaki benzerliği bulma ilgi alanı için
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 CORS(app, supports_credentials=True, origins=["http://localhost:3000"])
-app.config["SQLALCHEMY_DATABASE_URI"] = "mysql+pymysql://root@localhost/yazlab2_1"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+configure_database(app)
 
 init_db(app)
 
-UPLOAD_FOLDER = 'uploads/papers'
+
+@app.cli.command("init-db")
+def init_db_command():
+    # TABLOLAR İÇE AKTARMA SIRASINDA DEĞİL, KURULUMDA BİR KEZ OLUŞTURULUR:  flask --app app init-db
+    create_schema(app)
+    print("Veritabanı tabloları oluşturuldu.")
+
+
+@app.cli.command("migrate-db")
+def migrate_db_command():
+    # ESKİ ŞEMAYLA OLUŞTURULMUŞ VERİTABANINA YENİ SÜTUN VE İNDEKSLER EKLENİR:  flask --app app migrate-db
+    applied = run_migrations(app, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations.sql'))
+    print(f"{applied} şema değişikliği uygulandı.")
+
 ALLOWED_EXTENSIONS = {'pdf'}
 
 nlp = spacy.load("en_core_web_sm")
+NLP_BATCH_SIZE = int(os.environ.get("NLP_BATCH_SIZE", 8))
+NLP_N_PROCESS = int(os.environ.get("NLP_N_PROCESS", 1))
+KEYWORD_MIN_SCORE = float(os.environ.get("KEYWORD_MIN_SCORE", 2))
 
 INTEREST_CATEGORIES = {
     "Artificial Intelligence": ["derin öğrenme", "deep learning", "cnn", "rnn", "natural language processing", "NLP",
@@ -51,39 +81,21 @@ INTEREST_CATEGORIES = {
 }
 
 
-def encrypt_data(data: str):
-    key = b'asdfghjklqwertyu'  # 16 BYTE UZUNLUĞUNDA ANAHTAR
-    iv = os.urandom(16)  # 16 RASTGELE BİR IV
-
-    # PADDING: VERİ UZUNLUĞUNU 16 BYTE'A TAMAMLA
-    padder = padding.PKCS7(128).padder()
-    padded_data = padder.update(data.encode()) + padder.finalize()
-
-    # ŞİFRELE
-    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).encryptor()
-    encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
-
-    # ŞİFRELİ VERİYİ BASE64'E DÖNÜŞTÜR
-    return base64.b64encode(iv + encrypted_data).decode()  # IV'I DA ŞİFRELİ VERİYLE DÖNDÜR
+def find_reviewer_by_name(name):
+    reviewer = Reviewer.query.filter_by(name_index=blind_index(name)).first()
+    if reviewer:
+        return reviewer
 
+    # İNDEKSİ HENÜZ OLUŞTURULMAMIŞ ESKİ KAYITLAR ARANIRKEN İNDEKSLERİ DOLDURULUR
+    for legacy_reviewer in Reviewer.query.filter(Reviewer.name_index.is_(None)).all():
+        decrypted_name = decrypt_data(legacy_reviewer.name)
+        legacy_reviewer.name_index = blind_index(decrypted_name)
+        if decrypted_name == name:
+            reviewer = legacy_reviewer
+            break
 
-def decrypt_data(encrypted_data: str):
-    key = b'asdfghjklqwertyu'  # 16 BYTE UZUNLUĞUNDA ANAHTAR
-    encrypted_data_bytes = base64.b64decode(encrypted_data)
-
-    # IV'I BAŞINDAN AYIR
-    iv = encrypted_data_bytes[:16]  # IV'IN İLK 16 BYTEINI AL
-    encrypted_data_bytes = encrypted_data_bytes[16:]  # KALAN KISIM ŞİFRELİ VERİ
-
-    # DEŞİFRE ET
-    decryptor = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).decryptor()
-    decrypted_data = decryptor.update(encrypted_data_bytes) + decryptor.finalize()
-
-    # PADDING'İ KALDIR
-    unpadder = padding.PKCS7(128).unpadder()
-    data = unpadder.update(decrypted_data) + unpadder.finalize()
-
-    return data.decode()
+    db.session.commit()
+    return reviewer
 
 
 def allowed_file(filename):
@@ -91,19 +103,11 @@ def allowed_file(filename):
 
 
 def generate_tracking_code():
-    while True:
-        tracking_code = ''.join([str(random.randint(0, 9)) for _ in range(8)])
-        existing_article = Article.query.filter_by(id=tracking_code).first()
-
-        if not existing_article:
-            return tracking_code
+    return generate_tracking_codes(1)[0]
 
 
 @app.route("/upload", methods=["POST"])
 def upload_paper():
-    if not os.path.exists(UPLOAD_FOLDER):
-        os.makedirs(UPLOAD_FOLDER)
-
     email = request.form.get('email')
     title = request.form.get('title')
     authors = request.form.get('authors', '')
@@ -118,15 +122,13 @@ def upload_paper():
     if not file or not allowed_file(file.filename):
         return jsonify({"message": "Geçersiz dosya formatı veya dosya seçilmedi!"}), 400
 
-    filename = secure_filename(file.filename)
-    file_extension = filename.rsplit('.', 1)[1].lower()
-
     tracking_code = generate_tracking_code()
-    file_path = os.path.join(UPLOAD_FOLDER, f"{tracking_code}.{file_extension}")
+    file_path = new_working_path()
 
     new_article = Article(
         id=tracking_code,
         email=encrypted_email,
+        email_index=email_blind_index(email),
         title=encrypted_title,
         authors=encrypted_authors,
         pdf_path=file_path,
@@ -135,31 +137,115 @@ def upload_paper():
         institution=encrypted_institution,
     )
 
-    new_log = Log(
-        article_id=tracking_code,
-        event=encrypt_data(f"{tracking_code} kodlu ve {title} başlıklı bir makale yüklendi. Yazarlar: {authors}."),
-    )
-
     try:
+        file.save(file_path)
         db.session.add(new_article)
-        db.session.add(new_log)
+        log_event("article_uploaded", article_id=tracking_code, title=title, authors=authors)
+        add_version(new_article, file_path, "upload", anonymized_fields="")
+        classification_job = enqueue_job("classify_interests", tracking_code)
         db.session.commit()
-        file.save(file_path)
-
-        classification_thread = threading.Thread(target=classify_and_save_interests, args=(tracking_code,))
-        classification_thread.daemon = True
-        classification_thread.start()
+        publish_article_event(new_article, "article_created")
 
         return jsonify({
             "message": "Makale başarıyla yüklendi!",
-            "tracking_code": tracking_code
+            "tracking_code": tracking_code,
+            "job_id": classification_job.id,
         }), 201
     except Exception as e:
         db.session.rollback()
+        discard_artifacts([file_path, new_article.pdf_path])
         print(f"Hata: {e}")
         return jsonify({"message": "Makale yüklenirken bir hata oluştu!"}), 500
 
 
+@app.route("/bulk_upload", methods=["POST"])
+def bulk_upload():
+    # ÇOK PARÇALI (files + metadata JSON) VEYA ZIP (archive, içinde PDF'ler ve metadata.json) KABUL EDİLİR
+    staged = {}
+    try:
+        archive = request.files.get('archive')
+        if archive:
+            staged, items = stage_zip_archive(archive.stream, request.form.get('metadata'))
+        else:
+            items = parse_metadata(request.form.get('metadata'))
+            wanted = referenced_files(items)
+            staged = stage_multipart_files([file for file in request.files.getlist('files')
+                                            if file.filename in wanted and allowed_file(file.filename)])
+    except (ValueError, zipfile.BadZipFile) as e:
+        discard_staged(staged.values())
+        return jsonify({"message": f"Geçersiz toplu yükleme isteği: {e}"}), 400
+
+    if not items or len(items) > BULK_UPLOAD_MAX_ITEMS:
+        discard_staged(staged.values())
+        return jsonify({"message": f"1 ile {BULK_UPLOAD_MAX_ITEMS} arasında makale gönderilmelidir!"}), 400
+
+    results = [{"index": i, "file": item.get('file')} for i, item in enumerate(items)]
+    valid = []
+    used_files = set()
+    for result, item in zip(results, items):
+        error = validate_item(item, staged)
+        if not error and item['file'] in used_files:
+            error = "Aynı PDF birden fazla makalede kullanılamaz"
+        if error:
+            result.update(status="error", message=error)
+        else:
+            used_files.add(item['file'])
+            valid.append((result, item))
+
+    discard_staged(path for name, path in staged.items() if name not in used_files)
+    if not valid:
+        return jsonify({"results": results}), 400
+
+    articles = []
+    try:
+        tracking_codes = generate_tracking_codes(len(valid))
+        now = datetime.utcnow()
+
+        # ALANLAR SÜTUN SÜTUN TOPLU ŞİFRELENİR
+        columns = {field: encrypt_many([item.get(field) or '' for _, item in valid])
+                   for field in ('email', 'title', 'authors', 'institution')}
+
+        articles = [
+            Article(
+                id=code,
+                email=columns['email'][i],
+                email_index=email_blind_index(item['email']),
+                title=columns['title'][i],
+                authors=columns['authors'][i],
+                institution=columns['institution'][i],
+                pdf_path=staged[item['file']],
+                created_at=now,
+                updated_at=now,
+            )
+            for i, (code, (_, item)) in enumerate(zip(tracking_codes, valid))
+        ]
+
+        db.session.add_all(articles)
+        log_events("article_uploaded",
+                   [{'article_id': code, 'title': item['title'], 'authors': item.get('authors') or ''}
+                    for code, (_, item) in zip(tracking_codes, valid)])
+        add_upload_versions([(article, staged[item['file']]) for article, (_, item) in zip(articles, valid)])
+        jobs = [enqueue_job("classify_interests", code) for code in tracking_codes]
+        db.session.flush()
+        job_ids = [job.id for job in jobs]
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        discard_staged(staged.values())
+        discard_artifacts([article.pdf_path for article in articles])
+        print(f"Hata: {e}")
+        return jsonify({"message": "Makaleler yüklenirken bir hata oluştu!"}), 500
+
+    for (result, _), code, job_id in zip(valid, tracking_codes, job_ids):
+        result.update(status="created", tracking_code=code, job_id=job_id)
+
+    # COMMIT İLE SÜRESİ DOLAN MAKALELER OLAYLAR İÇİN TEK SORGUYLA YENİLENİR
+    for article in Article.query.filter(Article.id.in_(tracking_codes)).all():
+        publish_article_event(article, "article_created")
+
+    return jsonify({"message": f"{len(valid)} makale başarıyla yüklendi!", "results": results}), 201
+
+
 @app.route('/paper_status', methods=['POST'])
 def paper_status():
     data = request.get_json()
@@ -177,16 +263,17 @@ def paper_status():
 
     if article:
         try:
-            decrypted_email = decrypt_data(article.email)
-            decrypted_title = decrypt_data(article.title)
-            decrypted_authors = decrypt_data(article.authors)
-            decrypted_institution = decrypt_data(article.institution)
+            decrypted = decrypted_article(article)
+            decrypted_email = decrypted['email']
+            decrypted_title = decrypted['title']
+            decrypted_authors = decrypted['authors']
+            decrypted_institution = decrypted['institution']
 
             if article.editor_id:
                 reviewer = Reviewer.query.filter_by(id=article.editor_id).first()
-                decrypted_reviewer = decrypt_data(reviewer.name)
+                decrypted_reviewer_name = decrypted_reviewer(reviewer)['name']
             else:
-                decrypted_reviewer = None
+                decrypted_reviewer_name = None
 
             review = Review.query.filter_by(article_id=article.id).first()
 
@@ -207,8 +294,9 @@ def paper_status():
                 'title': decrypted_title,
                 'authors': decrypted_authors,
                 'status': status,
-                'reviewer': decrypted_reviewer,
+                'reviewer': decrypted_reviewer_name,
                 'institution': decrypted_institution,
+                'unread_messages': article.author_unread,
             }
             return jsonify(response_data), 200
         except Exception as e:
@@ -221,24 +309,54 @@ def paper_status():
 @app.route('/get_papers', methods=['GET'])
 def get_papers():
     try:
-        articles = Article.query.order_by(Article.authors).all()
-
-        articles_data = []
-        for article in articles:
-            decrypted_title = decrypt_data(article.title)
-            decrypted_authors = decrypt_data(article.authors)
-            decrypted_email = decrypt_data(article.email)
-            decrypted_institution = decrypt_data(article.institution)
+        limit = page_size_from(request.args)
+        created_from = parse_datetime(request.args.get('created_from'))
+        created_to = parse_datetime(request.args.get('created_to'))
+        reviewer_id = int(request.args['reviewer']) if request.args.get('reviewer') else None
+        cursor = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        if cursor:
+            cursor_created_at, cursor_id = parse_datetime(cursor[0]), int(cursor[1])
+    except (ValueError, TypeError, IndexError) as e:
+        return jsonify({'error': f'Geçersiz sorgu parametresi: {e}'}), 400
 
-            reviewer = Reviewer.query.filter_by(id=article.editor_id).first()
+    try:
+        query = Article.query.options(joinedload(Article.reviewer), selectinload(Article.keywords))
+
+        if request.args.get('status'):
+            query = query.filter(Article.status == request.args['status'])
+        if reviewer_id:
+            query = query.filter(Article.editor_id == reviewer_id)
+        if request.args.get('keyword'):
+            keyword_article_ids = db.session.query(Keyword.article_id).filter(
+                Keyword.keyword == request.args['keyword'])
+            query = query.filter(Article.id.in_(keyword_article_ids))
+        if created_from:
+            query = query.filter(Article.created_at >= created_from)
+        if created_to:
+            query = query.filter(Article.created_at <= created_to)
+
+        # EN YENİ MAKALELER ÖNCE, (created_at, id) ÇİFTİ ÜZERİNDEN KEYSET SAYFALAMA
+        if cursor:
+            query = query.filter(or_(Article.created_at < cursor_created_at,
+                                     and_(Article.created_at == cursor_created_at, Article.id < cursor_id)))
+
+        query = query.order_by(Article.created_at.desc(), Article.id.desc())
+        articles, next_cursor = paginate(query, limit, lambda article: (article.created_at, article.id))
+
+        decrypted = decrypted_articles(articles)
+        reviewers = {article.reviewer.id: article.reviewer for article in articles if article.reviewer}
+        reviewer_names = {reviewer.id: record['name'] for reviewer, record in
+                          zip(reviewers.values(), decrypted_reviewers(list(reviewers.values())))}
 
-            if reviewer:
-                decrypted_reviewer_name = decrypt_data(reviewer.name)
-            else:
-                decrypted_reviewer_name = None
+        articles_data = []
+        for article, record in zip(articles, decrypted):
+            decrypted_title = record['title']
+            decrypted_authors = record['authors']
+            decrypted_email = record['email']
+            decrypted_institution = record['institution']
+            decrypted_reviewer_name = reviewer_names.get(article.editor_id)
 
-            keywords = Keyword.query.filter_by(article_id=article.id).all()
-            interests = [keyword.keyword for keyword in keywords]
+            interests = [keyword.keyword for keyword in article.keywords]
 
             articles_data.append({
                 'id': article.id,
@@ -257,7 +375,7 @@ def get_papers():
                 'interests': interests,
             })
 
-        return jsonify(articles_data), 200
+        return jsonify({'papers': articles_data, 'next_cursor': next_cursor}), 200
     except Exception as e:
         return jsonify({'error': 'Makaleler alınırken hata oluştu.'}), 500
 
@@ -270,18 +388,14 @@ def add_reviewer():
 
     new_reviewer = Reviewer(
         name=encrypted_name,
+        name_index=blind_index(data['name']),
         interests=encrypted_interests
     )
 
     db.session.add(new_reviewer)
     db.session.commit()
 
-    new_log = Log(
-        reviewer_id=new_reviewer.id,
-        event=encrypt_data(f"{data['name']} adlı hakem kaydı yapıldı.")
-    )
-
-    db.session.add(new_log)
+    log_event("reviewer_added", reviewer_id=new_reviewer.id, name=data['name'])
     db.session.commit()
 
     return jsonify({'name': encrypted_name, 'interests': encrypted_interests})
@@ -290,15 +404,15 @@ def add_reviewer():
 @app.route('/get_reviewers', methods=['GET'])
 def get_reviewers():
     reviewers = Reviewer.query.all()
-    decrypted_reviewers = [
+    reviewers_data = [
         {
             'id': reviewer.id,
-            'name': decrypt_data(reviewer.name),
-            'interests': decrypt_data(reviewer.interests)
+            'name': record['name'],
+            'interests': record['interests']
         }
-        for reviewer in reviewers
+        for reviewer, record in zip(reviewers, decrypted_reviewers(reviewers))
     ]
-    return jsonify(decrypted_reviewers)
+    return jsonify(reviewers_data)
 
 
 @app.route('/assign_reviewer/<int:paper_id>', methods=['POST'])
@@ -314,18 +428,56 @@ def assign_reviewer(paper_id):
 
     article.editor_id = reviewer.id
     article.status = 'İncelemede'
-    new_log = Log(
-        article_id=article.id,
-        reviewer_id=reviewer.id,
-        event=encrypt_data(f"{article.id} kodlu makaleye {decrypt_data(reviewer.name)} adlı hakem ataması yapıldı."),
-    )
-    db.session.add(new_log)
+    log_event("reviewer_assigned", article_id=article.id, reviewer_id=reviewer.id,
+              reviewer_name=decrypt_data(reviewer.name))
 
     db.session.commit()
+    invalidate_article(article.id)
+    publish_article_event(article, "reviewer_assigned", reviewer_id=reviewer.id)
 
     return jsonify({'message': 'Hakem başarıyla atandı!'})
 
 
+@app.route('/recommend_reviewers', methods=['GET'])
+def recommend_reviewers():
+    try:
+        k = max(1, min(int(request.args.get('k', 3)), 20))
+    except ValueError:
+        return jsonify({'error': 'Geçersiz k değeri'}), 400
+
+    query = Article.query.filter(Article.status == 'Beklemede', Article.editor_id.is_(None))
+    if request.args.get('article_id'):
+        query = query.filter(Article.id == request.args.get('article_id', type=int))
+    article_ids = [article_id for article_id, in query.with_entities(Article.id).order_by(Article.id).all()]
+
+    index = get_recommendation_index(INTEREST_CATEGORIES)
+    reviewer_ids, reviewer_matrix = index.refresh()
+    if not article_ids or not reviewer_ids:
+        return jsonify({'recommendations': [], 'assignment': []})
+
+    scores = score_matrix(index.article_matrix(article_ids), reviewer_matrix)
+    best = top_k(scores, k)
+    assignment = balanced_assignment(scores, reviewer_loads(reviewer_ids))
+
+    reviewers = {reviewer.id: reviewer for reviewer in Reviewer.query.filter(Reviewer.id.in_(reviewer_ids)).all()}
+    names = {reviewer_id: record['name'] for reviewer_id, record
+             in zip(reviewers, decrypted_reviewers(list(reviewers.values())))}
+
+    recommendations = []
+    for i, article_id in enumerate(article_ids):
+        recommendations.append({
+            'article_id': article_id,
+            'reviewers': [{'id': reviewer_ids[j], 'name': names.get(reviewer_ids[j]), 'score': float(scores[i, j])}
+                          for j in best[i] if scores[i, j] > 0],
+        })
+
+    suggested = [{'article_id': article_id, 'reviewer_id': reviewer_ids[j], 'name': names.get(reviewer_ids[j]),
+                  'score': float(scores[i, j])}
+                 for i, (article_id, j) in enumerate(zip(article_ids, assignment)) if j >= 0]
+
+    return jsonify({'recommendations': recommendations, 'assignment': suggested})
+
+
 @app.route('/update_article/<int:article_id>', methods=['PATCH'])
 def update_article(article_id):
     data = request.get_json()
@@ -343,13 +495,11 @@ def update_article(article_id):
     if 'is_institution_anonymous' in data:
         article.is_institution_anonymous = data['is_institution_anonymous']
 
-    new_log = Log(
-        article_id=article.id,
-        event=encrypt_data(f"{article.id} kodlu makalenin anonimlik bilgisi güncellendi."),
-    )
-    db.session.add(new_log)
+    log_event("anonymity_updated", article_id=article.id)
 
     db.session.commit()
+    invalidate_article(article.id)
+    publish_article_event(article, "article_updated")
     return jsonify({'message': 'Makale anonimlik bilgisi güncellendi'}), 200
 
 
@@ -361,7 +511,7 @@ def get_article_pdf(article_id):
         return jsonify({'error': 'Makale bulunamadı'}), 404
 
     try:
-        return send_file(article.pdf_path, mimetype='application/pdf', as_attachment=False)
+        return send_pdf(article.pdf_path)
 
     except Exception as e:
         print(f"Hata: {e}")
@@ -371,16 +521,11 @@ def get_article_pdf(article_id):
 @app.route('/reviewer_articles', methods=['GET'])
 def get_reviewer_articles():
     reviewer_name = request.args.get('name')
-    reviewer = None
 
     if not reviewer_name:
         return jsonify({"error": "Hakem adı gerekli"}), 400
 
-    reviewers = Reviewer.query.all()
-
-    for reviewer1 in reviewers:
-        if reviewer_name == decrypt_data(reviewer1.name):
-            reviewer = reviewer1
+    reviewer = find_reviewer_by_name(reviewer_name)
 
     if not reviewer:
         return jsonify({"error": "Hakem bulunamadı"}), 404
@@ -388,11 +533,11 @@ def get_reviewer_articles():
     articles = Article.query.filter_by(editor_id=reviewer.id).all()
 
     articles_data = []
-    for article in articles:
-        decrypted_title = decrypt_data(article.title)
-        decrypted_authors = decrypt_data(article.authors)
-        decrypted_email = decrypt_data(article.email)
-        decrypted_institution = decrypt_data(article.institution)
+    for article, record in zip(articles, decrypted_articles(articles)):
+        decrypted_title = record['title']
+        decrypted_authors = record['authors']
+        decrypted_email = record['email']
+        decrypted_institution = record['institution']
 
         if article.is_authors_anonymous:
             authors_list = decrypted_authors.split(',')
@@ -423,193 +568,345 @@ def get_reviewer_articles():
             'created_at': article.created_at,
             'updated_at': article.updated_at,
             'institution': decrypted_institution,
+            'unread_messages': article.reviewer_unread,
         })
 
     return jsonify(articles_data), 200
 
 
+def filtered_logs(article_id=None, reviewer_id=None, timestamp_from=None, timestamp_to=None):
+    query = Log.query
+
+    if article_id:
+        query = query.filter(Log.article_id == article_id)
+    if reviewer_id:
+        query = query.filter(Log.reviewer_id == reviewer_id)
+    if timestamp_from:
+        query = query.filter(Log.timestamp >= timestamp_from)
+    if timestamp_to:
+        query = query.filter(Log.timestamp <= timestamp_to)
+
+    return query
+
+
+def log_row(log):
+    return {'id': log.id, 'article_id': log.article_id, 'reviewer_id': log.reviewer_id,
+            'event_type': log.event_type, 'actor': log.actor, 'event': log.event,
+            'payload': log.payload, 'timestamp': log.timestamp}
+
+
+def log_dicts(rows):
+    # rows: TABLO VE SEGMENT KAYITLARI; CÜMLELER TOPLU ÜRETİLİR, ŞİFRELİ payload DÖNMEZ
+    for row, event in zip(rows, render_events(rows)):
+        row['event'] = event
+        row.pop('payload', None)
+
+    return rows
+
+
 @app.route('/get_logs', methods=['GET'])
 def get_logs():
-    logs = Log.query.all()
-    logs_data = []
-
-    for log in logs:
-        logs_data.append({
-            'id': log.id,
-            'article_id': log.article_id,
-            'reviewer_id': log.reviewer_id,
-            'event': decrypt_data(log.event),
-            'timestamp': log.timestamp,
-        })
+    try:
+        limit = page_size_from(request.args)
+        timestamp_from = parse_datetime(request.args.get('from'))
+        timestamp_to = parse_datetime(request.args.get('to'))
+        article_id = int(request.args['article_id']) if request.args.get('article_id') else None
+        reviewer_id = int(request.args['reviewer_id']) if request.args.get('reviewer_id') else None
+        cursor = decode_cursor(request.args['cursor']) if request.args.get('cursor') else None
+        if cursor:
+            cursor_id = int(cursor[0])
+    except (ValueError, TypeError, IndexError) as e:
+        return jsonify({"error": f"Geçersiz sorgu parametresi: {e}"}), 400
+
+    try:
+        query = filtered_logs(article_id, reviewer_id, timestamp_from, timestamp_to)
+
+        # LOG ID'LERİ ARTARAK VERİLDİĞİ İÇİN id TEK BAŞINA KEYSET OLARAK YETERLİ
+        if cursor:
+            query = query.filter(Log.id < cursor_id)
+
+        logs, next_cursor = paginate(query.order_by(Log.id.desc()), limit, lambda log: (log.id,))
+        rows = [log_row(log) for log in logs]
+
+        # TABLO BİTTİYSE SAYFA SEGMENTLERE TAŞINMIŞ ESKİ KAYITLARLA DEVAM EDER
+        if next_cursor is None:
+            needed = limit - len(rows)
+            before_id = rows[-1]['id'] if rows else (cursor_id if cursor else None)
+            archived = list(islice(iter_segment_rows_desc(before_id, article_id, reviewer_id, timestamp_from,
+                                                          timestamp_to), needed + 1))
+            rows.extend(archived[:needed])
+            if len(archived) > needed:
+                next_cursor = encode_cursor(rows[-1]['id'])
+
+        return jsonify({'logs': log_dicts(rows), 'next_cursor': next_cursor}), 200
+
+    except Exception as e:
+        print(f"Hata: {e}")
+        return jsonify({"error": "Loglar alınamadı."}), 500
+
+
+@app.route('/logs', methods=['GET'])
+def tail_logs():
+    # after_id SONRASINDAKİ KAYITLAR ARTAN id SIRASIYLA DÖNER; İSTEMCİ DÖNEN last_id İLE DEVAM EDER.
+    # TABLODAN TAŞINMIŞ ESKİ KAYITLAR ÖNCE SEGMENT DOSYALARINDAN OKUNUR
+    try:
+        limit = page_size_from(request.args)
+        after_id = int(request.args.get('after_id', 0))
+        article_id = int(request.args['article_id']) if request.args.get('article_id') else None
+        reviewer_id = int(request.args['reviewer_id']) if request.args.get('reviewer_id') else None
+    except (ValueError, TypeError) as e:
+        return jsonify({"error": f"Geçersiz sorgu parametresi: {e}"}), 400
 
     try:
-        return jsonify(logs_data), 200
+        rows = []
+        for row in iter_segment_rows(after_id, article_id, reviewer_id):
+            rows.append(row)
+            if len(rows) == limit:
+                break
+
+        if len(rows) < limit:
+            last_archived_id = rows[-1]['id'] if rows else after_id
+            logs = (filtered_logs(article_id, reviewer_id).filter(Log.id > last_archived_id)
+                    .order_by(Log.id.asc()).limit(limit - len(rows)).all())
+            rows.extend(log_row(log) for log in logs)
 
-    except:
+        return jsonify({'logs': log_dicts(rows), 'last_id': rows[-1]['id'] if rows else after_id}), 200
+
+    except Exception as e:
+        print(f"Hata: {e}")
         return jsonify({"error": "Loglar alınamadı."}), 500
 
 
+@app.route('/log_stats', methods=['GET'])
+def get_log_stats():
+    # OLAY TİPİ SAYILARI VE GÜNLÜK ZAMAN ÇİZELGESİ DOĞRUDAN SQL GROUP BY İLE HESAPLANIR, ŞİFRE ÇÖZÜLMEZ
+    try:
+        timestamp_from = parse_datetime(request.args.get('from'))
+        timestamp_to = parse_datetime(request.args.get('to'))
+        article_id = int(request.args['article_id']) if request.args.get('article_id') else None
+        reviewer_id = int(request.args['reviewer_id']) if request.args.get('reviewer_id') else None
+    except (ValueError, TypeError) as e:
+        return jsonify({"error": f"Geçersiz sorgu parametresi: {e}"}), 400
+
+    query = filtered_logs(article_id, reviewer_id, timestamp_from, timestamp_to).filter(Log.event_type.isnot(None))
+
+    day = func.date(Log.timestamp)
+    # SEGMENTLERE TAŞINMIŞ KAYITLAR DA SAYIMA KATILIR
+    counts, timeline = segment_log_stats(article_id, reviewer_id, timestamp_from, timestamp_to)
+    for event_type, actor, count in (query.with_entities(Log.event_type, Log.actor, func.count(Log.id))
+                                     .group_by(Log.event_type, Log.actor).all()):
+        counts[(event_type, actor)] += count
+    for date, event_type, count in (query.with_entities(day, Log.event_type, func.count(Log.id))
+                                    .group_by(day, Log.event_type).all()):
+        timeline[(str(date), event_type)] += count
+
+    return jsonify({
+        'counts': [{'event_type': event_type, 'actor': actor, 'count': count}
+                   for (event_type, actor), count in counts.items()],
+        'timeline': [{'date': date, 'event_type': event_type, 'count': count}
+                     for (date, event_type), count in sorted(timeline.items())],
+    })
+
+
+@app.route('/log_segments', methods=['GET'])
+def get_log_segments():
+    return jsonify([{'name': name, 'first_id': first_id, 'last_id': last_id,
+                     'size': os.path.getsize(segment_path(name))}
+                    for first_id, last_id, name in list_segments()])
+
+
+@app.route('/log_segments/<name>', methods=['GET'])
+def download_log_segment(name):
+    # SEGMENTLER DEĞİŞMEZ, SIKIŞTIRILMIŞ HALİYLE AKITILIR; event ALANLARI ŞİFRELİDİR
+    try:
+        path = segment_path(name)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if not os.path.exists(path):
+        return jsonify({'error': 'Segment bulunamadı'}), 404
+
+    return send_file(path, mimetype='application/gzip', as_attachment=True, download_name=name,
+                     conditional=True, max_age=365 * 24 * 60 * 60)
+
+
+def classify_article(article):
+    pages = document_pages(article.pdf_path)
+    page_texts = [(page_num, normalize_text(page["text"])) for page_num, page in enumerate(pages) if page is not None]
+    extracted_keywords = extract_org_keywords(nlp, page_texts, batch_size=NLP_BATCH_SIZE, n_process=NLP_N_PROCESS)
+
+    category_index = get_category_index(nlp, INTEREST_CATEGORIES)
+    classified_interests = category_index.classify(extracted_keywords, threshold=0.9)
+
+    # TAM METİNDE GEÇEN ALAN TERİMLERİ (TAM VE BULANIK EŞLEŞME) DE SINIFLANDIRMAYA KATILIR
+    keyword_matches = get_keyword_matcher(INTEREST_CATEGORIES).match(page_texts)
+    for category, result in keyword_matches.items():
+        print(f"Terim eşleşmesi: {category} (Puan: {result['score']:.2f}, "
+              f"Terimler: {sorted({match['term'] for match in result['matches']})})")
+        if result["score"] >= KEYWORD_MIN_SCORE:
+            classified_interests.add(category)
+
+    print(f"Sınıflandırılmış ilgi alanları: {classified_interests}")
+
+    # YENİDEN SINIFLANDIRMADA ESKİ ANAHTAR KELİMELER AYNI İŞLEMDE SİLİNİR, TEKRAR EDEN KAYIT OLUŞMAZ
+    Keyword.query.filter_by(article_id=article.id).delete(synchronize_session=False)
+    for interest in classified_interests:
+        new_keyword = Keyword(article_id=article.id, keyword=interest)
+        db.session.add(new_keyword)
+
+    db.session.commit()
+
+    return classified_interests
+
+
+@job_handler("classify_interests")
+def classify_interests_job(job):
+    article = Article.query.get(job.article_id)
+    if not article:
+        raise LookupError(f"{job.article_id} kodlu makale bulunamadı")
+
+    classify_article(article)
+
+
 @app.route('/classify_and_save_interests/<int:article_id>', methods=['GET'])
 def classify_and_save_interests(article_id):
-    with app.app_context():
-        print("classify_and_save_interests fonksiyonu çağrıldı.")
+    print("classify_and_save_interests fonksiyonu çağrıldı.")
 
-        article = Article.query.get(article_id)
-        if not article:
-            return jsonify({'error': 'Makale bulunamadı'}), 404
+    article = Article.query.get(article_id)
+    if not article:
+        return jsonify({'error': 'Makale bulunamadı'}), 404
 
-        try:
-            doc = fitz.open(article.pdf_path)
-            extracted_keywords = []
-
-            def normalize_text(text):
-                return unicodedata.normalize("NFKC", text)
-
-            for page in doc:
-                try:
-                    text = page.get_text("text")
-                    text = normalize_text(text)
-
-                    if not text.strip():
-                        print(f"Sayfa {page.number + 1} için OCR çalıştırılıyor...")
-                        pix = page.get_pixmap()
-                        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                        text = pytesseract.image_to_string(img)
-                        text = normalize_text(text)
-
-                    print(f"Sayfa {page.number + 1} metni: {text}")
-
-                    spacy_doc = nlp(text)
-                    for ent in spacy_doc.ents:
-                        print(
-                            f"Bulunan varlık: {ent.text} - Etiket: {ent.label_}")
-                        if ent.label_ == "ORG":
-                            extracted_keywords.append(ent.text.lower())
-
-                except Exception as e:
-                    print(f"Metin çıkarılırken hata oluştu: {e}")
-                    continue
+    try:
+        classified_interests = classify_article(article)
+        return jsonify({'classified_interests': list(classified_interests)}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"Hata: {e}")
+        return jsonify({'message': 'İlgi alanları sınıflandırılırken bir hata oluştu!'}), 500
+
+
+@app.route('/job_status/<int:job_id>', methods=['GET'])
+def job_status(job_id):
+    job = Job.query.get(job_id)
+    if not job:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+
+    return jsonify({
+        'id': job.id,
+        'kind': job.kind,
+        'article_id': job.article_id,
+        'status': job.status,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'run_after': job.run_after,
+        'created_at': job.created_at,
+        'updated_at': job.updated_at,
+        'download_url': f"/job_result/{job.id}" if job.status == "done" and job.result_data.get('pdf_path') else None,
+    }), 200
+
+
+@app.route('/job_result/<int:job_id>', methods=['GET'])
+def job_result(job_id):
+    job = Job.query.get(job_id)
+    if not job:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+
+    pdf_path = job.result_data.get('pdf_path')
+    if job.status != "done" or not pdf_path:
+        return jsonify({'error': 'İşin indirilebilir bir sonucu yok', 'status': job.status}), 409
+
+    try:
+        return send_pdf(pdf_path)
 
-            doc.close()
+    except Exception as e:
+        print(f"Hata: {e}")
+        return jsonify({'message': 'Makale verisi okunurken bir hata oluştu!'}), 500
 
-            classified_interests = set()
 
-            for keyword in extracted_keywords:
-                keyword_doc = nlp(keyword)
-                for category, keywords in INTEREST_CATEGORIES.items():
-                    for k in keywords:
-                        category_doc = nlp(k)
-                        similarity = keyword_doc.similarity(category_doc)
-                        if similarity > 0.9:
-                            print(f"Semantik eşleşme bulundu: {keyword} -> {category} (Benzerlik: {similarity})")
-                            classified_interests.add(category)
+def event_channels_from(args):
+    # channels=article:12,reviewer:3,admin
+    channels = [channel for channel in args.get('channels', '').split(',') if channel]
+    for channel in channels:
+        kind, _, value = channel.partition(':')
+        if not (channel == 'admin' or kind in ('article', 'reviewer') and value.isdigit()):
+            raise ValueError(channel)
+    return channels
 
-            print(f"Sınıflandırılmış ilgi alanları: {classified_interests}")
 
-            for interest in classified_interests:
-                new_keyword = Keyword(article_id=article_id, keyword=interest)
-                db.session.add(new_keyword)
+def last_event_id_from(value):
+    return int(value) if value and value.isdigit() else None
 
-            db.session.commit()
 
-            return jsonify({'classified_interests': list(classified_interests)}), 200
+@app.route('/events', methods=['GET'])
+def event_stream():
+    try:
+        channels = event_channels_from(request.args)
+    except ValueError as e:
+        return jsonify({'error': f'Geçersiz kanal: {e}'}), 400
+    if not channels:
+        return jsonify({'error': 'En az bir kanal gereklidir'}), 400
 
-        except Exception as e:
-            print(f"Hata: {e}")
-            return jsonify({'message': 'İlgi alanları sınıflandırılırken bir hata oluştu!'}), 500
+    after_id = last_event_id_from(request.headers.get('Last-Event-ID') or request.args.get('after'))
+    return Response(stream_events(channels, after_id), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
-def blur_sensitive_info_in_pdf(pdf_path, article_id, user_email, authors, institution=None):
-    print("Blurlama işlemine başlandı.")
-    email_pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    author_patterns = [re.compile(rf"\b{re.escape(author)}\b", re.IGNORECASE) for author in authors] if authors else []
-    institution_pattern = re.compile(
-        r'(?:[A-Z][a-z]+(?:\s[A-Z][a-z]+)*\s(?:University of|Institute|College|Academy|Center|School|Laboratory|Foundation|Organization|Corporation|Society|Group|Association|Lab|Dept|Division|Campus|Faculty|Henley))',
-        re.IGNORECASE
-    )
+@app.route('/events/poll', methods=['GET'])
+def poll_events():
+    # SSE KULLANAMAYAN İSTEMCİLER İÇİN UZUN SORGULAMA; İSTEMCİ DÖNEN last_id'Yİ after OLARAK GERİ GÖNDERİR
+    try:
+        channels = event_channels_from(request.args)
+        timeout = min(max(float(request.args.get('timeout', 25)), 0), 60)
+    except ValueError as e:
+        return jsonify({'error': f'Geçersiz parametre: {e}'}), 400
+    if not channels:
+        return jsonify({'error': 'En az bir kanal gereklidir'}), 400
 
-    doc = fitz.open(pdf_path)
-    blur_data = []
+    events, last_id = get_broker().wait(channels, last_event_id_from(request.args.get('after')), timeout)
+    return jsonify({'events': events, 'last_id': last_id})
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        page_text = page.get_text("text")
 
-        normalized_text = " ".join(page_text.splitlines())
+@app.route('/cache_stats', methods=['GET'])
+def get_cache_stats():
+    return jsonify(cache_stats()), 200
 
-        if user_email:
-            for match in email_pattern.finditer(normalized_text):
-                found_email = match.group(0)
-                blurred_email = "*" * len(found_email)
-                rects = page.search_for(found_email)
-                if not rects:
-                    print(f"E-posta bulunamadı: {found_email}")
-                    continue
-                for rect in rects:
-                    print(f"Redaksiyon uygulanıyor: {rect}")
-                    page.add_redact_annot(rect, text=blurred_email, fill=(1, 1, 1))
-                    blur_data.append({
-                        "page": page_num,
-                        "rect": str(rect),
-                        "original_text": found_email,
-                        "blurred_text": blurred_email
-                    })
-            page.apply_redactions()
-
-        if authors:
-            for author_pattern in author_patterns:
-                for match in author_pattern.finditer(normalized_text):
-                    found_author = match.group(0)
-                    blurred_author = "*" * len(found_author)
-                    rects = page.search_for(found_author)
-                    if not rects:
-                        print(f"Yazar adı bulunamadı: {found_author}")
-                        continue
-                    for rect in rects:
-                        print(f"Redaksiyon uygulanıyor: {rect}")
-                        page.add_redact_annot(rect, text=blurred_author, fill=(1, 1, 1))
-                        blur_data.append({
-                            "page": page_num,
-                            "rect": str(rect),
-                            "original_text": found_author,
-                            "blurred_text": blurred_author
-                        })
-            page.apply_redactions()
-
-        if institution:
-            for match in institution_pattern.finditer(normalized_text):
-                found_institution = match.group(0)
-                print(f"Bulunan kurum: {found_institution}")
-                blurred_institution = "*" * len(found_institution)
-                rects = page.search_for(found_institution)
-                if not rects:
-                    print(f"Kurum adı bulunamadı: {found_institution}")
-                    continue
-                for rect in rects:
-                    print(f"Kurum redaksiyon uygulanıyor: {rect}")
-                    page.add_redact_annot(rect, text=blurred_institution, fill=(1, 1, 1))
-                    blur_data.append({
-                        "page": page_num,
-                        "rect": str(rect),
-                        "original_text": found_institution,
-                        "blurred_text": blurred_institution
-                    })
-            page.apply_redactions()
-
-        print("Blurlanmış veriler:", blur_data)
+
+def add_blur_data(article_id, blur_data):
+    for data in blur_data:
+        x0, y0, x1, y1 = data["rect"]
+        db.session.add(BlurData(
+            article_id=article_id,
+            page=data["page"],
+            x0=x0, y0=y0, x1=x1, y1=y1,
+            original_text=data["original_text"],
+            blurred_text=data["blurred_text"]
+        ))
+
+
+def replace_blur_data(article_id, blur_data):
+    BlurData.query.filter_by(article_id=article_id).delete(synchronize_session=False)
+    add_blur_data(article_id, blur_data)
+
+
+def stored_matches(engine, pdf_path):
+    # SAYFA KELİMELERİ METİN DEPOSUNDAN GELİR; TARANMIŞ SAYFALAR OCR KELİME KUTULARIYLA GİZLENİR
+    return [engine.find_in_words(page["words"]) if page else [] for page in document_pages(pdf_path)]
+
+
+def blur_sensitive_info_in_pdf(pdf_path, article_id, user_email, authors, institution=None):
+    print("Blurlama işlemine başlandı.")
+    engine = RedactionEngine(email=bool(user_email), authors=authors, institution=bool(institution))
+
+    matches_by_page = stored_matches(engine, pdf_path)
+
+    doc = fitz.open(pdf_path)
+    blur_data = engine.redact_document(doc, matches_by_page)
+    print("Blurlanmış veriler:", blur_data)
 
     try:
-        for data in blur_data:
-            new_blur_data = BlurData(
-                article_id=article_id,
-                page=data["page"],
-                rect=data["rect"],
-                original_text=data["original_text"],
-                blurred_text=data["blurred_text"]
-            )
-            db.session.add(new_blur_data)
+        add_blur_data(article_id, blur_data)
 
-        blurred_pdf_path = pdf_path.replace(".pdf", "_blurred.pdf")
+        blurred_pdf_path = new_working_path()
         doc.save(blurred_pdf_path)
         print(f"PDF başarıyla kaydedildi: {blurred_pdf_path}")
         doc.close()
@@ -623,19 +920,127 @@ def blur_sensitive_info_in_pdf(pdf_path, article_id, user_email, authors, instit
     return blurred_pdf_path, blur_data
 
 
-def get_blur_data_from_db(article_id):
-    blur_data = BlurData.query.filter_by(article_id=article_id).all()
-    blur_data_list = []
+def get_blur_data_by_page(article_id):
+    blur_data = BlurData.query.filter_by(article_id=article_id).order_by(BlurData.page, BlurData.id).all()
+    blur_data_by_page = {}
 
     for data in blur_data:
-        blur_data_list.append({
+        blur_data_by_page.setdefault(data.page, []).append({
             "page": data.page,
-            "rect": eval(data.rect),
+            "rect": data.rect_tuple,
             "original_text": data.original_text,
             "blurred_text": data.blurred_text
         })
 
-    return blur_data_list
+    return blur_data_by_page
+
+
+ANONYMIZATION_FIELDS = ("is_authors_anonymous", "is_mail_anonymous", "is_institution_anonymous")
+
+
+def anonymization_targets(article, fields):
+    decrypted = decrypted_article(article)
+    email = decrypted['email'] if "is_mail_anonymous" in fields else None
+    authors = None
+    if "is_authors_anonymous" in fields:
+        authors = [author.strip() for author in decrypted['authors'].split(",")]
+    institution = decrypted['institution'] if "is_institution_anonymous" in fields else None
+
+    return email, authors, institution
+
+
+def render_anonymized(article, source, fields):
+    # KAYNAK PDF İSTENEN ALANLARIN HEPSİ İÇİN TEK SEFERDE ANONİMLEŞTİRİLİR, SONUÇ ÖNBELLEKTEN GELEBİLİR
+    email, authors, institution = anonymization_targets(article, fields)
+    targets_digest = blind_index(repr((email, authors, institution)))
+    key = rendition_key(source.sha256, fields, targets_digest)
+
+    cached = get_rendition(key)
+    if cached:
+        print(f"Önbellekteki anonim sürüm kullanılıyor: {key}")
+        rendition_path, blur_data = cached
+    else:
+        source_path = artifact_path(source.sha256)
+        engine = RedactionEngine(email=bool(email), authors=authors, institution=bool(institution))
+        matches_by_page = stored_matches(engine, source_path)
+
+        doc = fitz.open(source_path)
+        blur_data = engine.redact_document(doc, matches_by_page)
+        rendition_path = new_working_path()
+        doc.save(rendition_path)
+        doc.close()
+
+        put_rendition(key, rendition_path, blur_data)
+
+    replace_blur_data(article.id, blur_data)
+    return rendition_path
+
+
+def anonymize_from_source(article, field, operation):
+    # GÜNCEL SÜRÜM KAYNAKTAN TÜRETİLMİŞ BİR ANONİM SÜRÜMSE SONUÇ KAYNAKTAN YENİDEN ÜRETİLİR,
+    # DEĞİLSE (ESKİ KAYITLAR, HAKEM YORUMU EKLENMİŞ PDF) None DÖNER VE ARTIMLI YÖNTEM KULLANILIR
+    current = PdfVersion.query.get(article.current_version_id) if article.current_version_id else None
+    if not current or current.anonymized_fields is None:
+        return None
+
+    fields = set(filter(None, current.anonymized_fields.split(",")))
+    fields = fields | {field} if operation == "blur" else fields - {field}
+    source = source_version(current)
+
+    if fields:
+        path = render_anonymized(article, source, fields)
+    else:
+        path = artifact_path(source.sha256)
+        replace_blur_data(article.id, [])
+
+    add_version(article, path, operation, anonymized_fields=fields_key(fields))
+    return article.pdf_path
+
+
+def blur_article(article, field):
+    if anonymize_from_source(article, field, "blur") is None:
+        email, authors, institution = anonymization_targets(article, {field})
+        blurred_pdf_path, replacements = blur_sensitive_info_in_pdf(article.pdf_path, article.id, email, authors,
+                                                                    institution)
+        add_version(article, blurred_pdf_path, "blur")
+
+    db.session.commit()
+    invalidate_article(article.id)
+    collect_garbage(article)
+
+    return article.pdf_path
+
+
+def unblur_article(article, field):
+    if anonymize_from_source(article, field, "unblur") is None:
+        email, authors, institution = anonymization_targets(article, {field})
+        unblurred_pdf_path = unblur_sensitive_info_in_pdf(article.pdf_path, article.id, field, email, authors,
+                                                          institution)
+        add_version(article, unblurred_pdf_path, "unblur")
+
+    db.session.commit()
+    invalidate_article(article.id)
+    collect_garbage(article)
+
+    return article.pdf_path
+
+
+@job_handler("blur_pdf")
+def blur_pdf_job(job):
+    article = Article.query.get(job.article_id)
+    if not article:
+        raise LookupError(f"{job.article_id} kodlu makale bulunamadı")
+
+    return {'pdf_path': blur_article(article, job.payload_data['field'])}
+
+
+@job_handler("unblur_pdf")
+def unblur_pdf_job(job):
+    article = Article.query.get(job.article_id)
+    if not article:
+        raise LookupError(f"{job.article_id} kodlu makale bulunamadı")
+
+    return {'pdf_path': unblur_article(article, job.payload_data['field'])}
 
 
 @app.route('/blur_article_pdf/<int:article_id>', methods=['POST'])
@@ -643,7 +1048,7 @@ def blur_article_pdf(article_id):
     data = request.get_json()
     field = data.get("field")
 
-    if not field:
+    if field not in ANONYMIZATION_FIELDS:
         return jsonify({'error': 'Hangi alanın blurlanacağı belirtilmedi'}), 400
 
     article = Article.query.get(article_id)
@@ -651,21 +1056,14 @@ def blur_article_pdf(article_id):
         return jsonify({'error': 'Makale bulunamadı'}), 404
 
     try:
-        email = decrypt_data(article.email) if field == "is_mail_anonymous" else None
-        authors = decrypt_data(article.authors).split(",") if field == "is_authors_anonymous" else None
-        institution = decrypt_data(article.institution) if field == "is_institution_anonymous" else None
-
-        blurred_pdf_path, replacements = blur_sensitive_info_in_pdf(article.pdf_path, article_id, email, authors,
-                                                                    institution)
-
-        article.pdf_path = blurred_pdf_path
-
-        db.session.commit()
+        if data.get("async"):
+            job = enqueue_job("blur_pdf", article.id, payload={'field': field}, max_attempts=1)
+            db.session.commit()
+            return jsonify({'job_id': job.id, 'message': 'Blurlama işi kuyruğa alındı.'}), 202
 
-        with open(blurred_pdf_path, 'rb') as pdf_file:
-            pdf_data = base64.b64encode(pdf_file.read()).decode('utf-8')
+        blur_article(article, field)
 
-        return jsonify({'pdf_data': pdf_data, 'message': 'Blurlanmış PDF oluşturuldu!'}), 200
+        return jsonify({'pdf_url': f"/get_article_pdf/{article.id}", 'message': 'Blurlanmış PDF oluşturuldu!'}), 200
 
     except Exception as e:
         print(f"Hata: {e}")
@@ -676,27 +1074,34 @@ def unblur_sensitive_info_in_pdf(pdf_path, article_id, field, email=None, author
     try:
         doc = fitz.open(pdf_path)
 
-        blur_data = get_blur_data_from_db(article_id)
-        print("Unblur işlemi için blur_data:", blur_data)
+        blur_data_by_page = get_blur_data_by_page(article_id)
+        print("Unblur işlemi için blur_data:", blur_data_by_page)
 
-        for data in blur_data:
-            page = doc[data["page"]]
-            rect = fitz.Rect(data["rect"])
-            original_text = data["original_text"]
+        # GERİ YÜKLEMELER SAYFA BAZINDA TOPLANIR, apply_redactions HER SAYFA İÇİN BİR KEZ ÇALIŞIR
+        for page_num, page_blur_data in blur_data_by_page.items():
+            page = doc[page_num]
+            restored = 0
+
+            for data in page_blur_data:
+                rect = fitz.Rect(data["rect"])
+                original_text = data["original_text"]
+
+                if field == "is_mail_anonymous" and email and "@" in original_text:
+                    print(f"E-posta unblur işlemi: {data['blurred_text']} -> {original_text}")
+                elif field == "is_authors_anonymous" and authors and any(author in original_text for author in authors):
+                    print(f"Yazar unblur işlemi: {data['blurred_text']} -> {original_text}")
+                elif field == "is_institution_anonymous" and institution and institution in original_text:
+                    print(f"Kurum adı unblur işlemi: {data['blurred_text']} -> {original_text}")
+                else:
+                    continue
 
-            if field == "is_mail_anonymous" and email and "@" in original_text:
-                print(f"E-posta unblur işlemi: {data['blurred_text']} -> {original_text}")
-                page.add_redact_annot(rect, text=original_text, fill=(1, 1, 1))
-            elif field == "is_authors_anonymous" and authors and any(author in original_text for author in authors):
-                print(f"Yazar unblur işlemi: {data['blurred_text']} -> {original_text}")
-                page.add_redact_annot(rect, text=original_text, fill=(1, 1, 1))
-            elif field == "is_institution_anonymous" and institution and institution in original_text:
-                print(f"Kurum adı unblur işlemi: {data['blurred_text']} -> {original_text}")
                 page.add_redact_annot(rect, text=original_text, fill=(1, 1, 1))
+                restored += 1
 
-            page.apply_redactions()
+            if restored:
+                page.apply_redactions()
 
-        unblurred_pdf_path = pdf_path.replace(".pdf", "_unblurred.pdf")
+        unblurred_pdf_path = new_working_path()
         doc.save(unblurred_pdf_path, incremental=False)
         doc.close()
 
@@ -713,7 +1118,7 @@ def unblur_article_pdf(article_id):
     data = request.get_json()
     field = data.get("field")
 
-    if not field:
+    if field not in ANONYMIZATION_FIELDS:
         return jsonify({'error': 'Hangi alanın unblurlanacağı belirtilmedi'}), 400
 
     article = Article.query.get(article_id)
@@ -721,20 +1126,15 @@ def unblur_article_pdf(article_id):
         return jsonify({'error': 'Makale bulunamadı'}), 404
 
     try:
-        email = decrypt_data(article.email) if field == "is_mail_anonymous" else None
-        authors = decrypt_data(article.authors).split(",") if field == "is_authors_anonymous" else None
-        institution = decrypt_data(article.institution) if field == "is_institution_anonymous" else None
-
-        unblurred_pdf_path = unblur_sensitive_info_in_pdf(article.pdf_path, article_id, field, email, authors,
-                                                          institution)
-
-        article.pdf_path = unblurred_pdf_path
-        db.session.commit()
+        if data.get("async"):
+            job = enqueue_job("unblur_pdf", article.id, payload={'field': field}, max_attempts=1)
+            db.session.commit()
+            return jsonify({'job_id': job.id, 'message': 'Unblur işi kuyruğa alındı.'}), 202
 
-        with open(unblurred_pdf_path, 'rb') as pdf_file:
-            pdf_data = base64.b64encode(pdf_file.read()).decode('utf-8')
+        unblur_article(article, field)
 
-        return jsonify({'pdf_data': pdf_data, 'message': 'Unblurlanmış PDF oluşturuldu!'}), 200
+        return jsonify({'pdf_url': f"/get_article_pdf/{article.id}",
+                        'message': 'Unblurlanmış PDF oluşturuldu!'}), 200
 
     except Exception as e:
         print(f"Hata: {e}")
@@ -747,26 +1147,45 @@ def get_messages(article_id):
     if not article:
         return jsonify({"message": "Makale bulunamadı!"}), 404
 
-    reviewer_name = Reviewer.query.filter_by(id=article.editor_id).first().name
+    # YAZAR MESAJLARI AÇTIĞINDA HAKEMDEN GELENLER OKUNDU SAYILIR
+    backfill_sender_roles(article)
+    if mark_read(article.id, REVIEWER):
+        db.session.commit()
+        publish_article_event(article, "messages_read", sender_role=REVIEWER)
+    else:
+        db.session.commit()
 
     messages = Message.query.filter_by(article_id=article.id).order_by(Message.created_at.asc()).all()
-
-    for msg in messages:
-        if decrypt_data(msg.sender_email) == decrypt_data(reviewer_name):
-            msg.is_read = True
-            db.session.commit()
+    senders = decrypt_many([msg.sender_email for msg in messages])
+    texts = decrypt_many([msg.message for msg in messages])
 
     messages_data = [{
         "id": msg.id,
-        "sender": decrypt_data(msg.sender_email),
-        "text": decrypt_data(msg.message),
+        "sender": sender,
+        "text": text,
         "created_at": msg.created_at.strftime("%Y-%m-%d %H:%M:%S"),
         "is_read": msg.is_read
-    } for msg in messages]
+    } for msg, sender, text in zip(messages, senders, texts)]
 
     return jsonify({"messages": messages_data})
 
 
+@app.route('/unread_counts', methods=['GET'])
+def get_unread_counts():
+    try:
+        article_ids = [int(article_id) for article_id in request.args.get('article_ids', '').split(',') if article_id]
+    except ValueError:
+        return jsonify({"message": "Geçersiz makale numarası!"}), 400
+
+    if not article_ids:
+        return jsonify({"message": "Makale numarası gereklidir!"}), 400
+
+    if backfill_articles(article_ids):
+        db.session.commit()
+
+    return jsonify({"counts": unread_counts(article_ids)})
+
+
 @app.route('/send_message', methods=['POST'])
 def send_message():
     data = request.json
@@ -785,26 +1204,24 @@ def send_message():
     if not reviewer:
         return jsonify({"message": "Makale için hakem atanmadı!"}), 404
 
+    sender_role = sender_role_for(article, sender_email)
     new_message = Message(
         article_id=article.id,
         reviewer_id=reviewer.id,
         sender_email=encrypt_data(sender_email),
+        sender_role=sender_role,
         message=encrypt_data(text),
         created_at=datetime.utcnow(),
         is_read=False
     )
 
     db.session.add(new_message)
+    record_message(article.id, sender_role)
 
-    new_log = Log(
-        article_id=article.id,
-        reviewer_id=article.editor_id,
-        event=encrypt_data(f"Mesaj gönderildi."),
-        timestamp=datetime.utcnow()
-    )
-    db.session.add(new_log)
+    log_event("message_sent", article_id=article.id, reviewer_id=article.editor_id, actor=sender_role)
 
     db.session.commit()
+    publish_article_event(article, "message", message_id=new_message.id, sender_role=sender_role)
 
     return jsonify({"message": "Mesaj başarıyla kaydedildi!"}), 201
 
@@ -815,20 +1232,25 @@ def get_messages_for_reviewer(article_id):
     if not article:
         return jsonify({"message": "Makale bulunamadı!"}), 404
 
-    messages = Message.query.filter_by(article_id=article.id).order_by(Message.created_at.asc()).all()
+    # HAKEM MESAJLARI AÇTIĞINDA YAZARDAN GELENLER OKUNDU SAYILIR
+    backfill_sender_roles(article)
+    if mark_read(article.id, AUTHOR):
+        db.session.commit()
+        publish_article_event(article, "messages_read", sender_role=AUTHOR)
+    else:
+        db.session.commit()
 
-    for msg in messages:
-        if decrypt_data(msg.sender_email) == decrypt_data(article.email):
-            msg.is_read = True
-            db.session.commit()
+    messages = Message.query.filter_by(article_id=article.id).order_by(Message.created_at.asc()).all()
+    senders = decrypt_many([msg.sender_email for msg in messages])
+    texts = decrypt_many([msg.message for msg in messages])
 
     messages_data = [{
         "id": msg.id,
-        "sender": decrypt_data(msg.sender_email),
-        "text": decrypt_data(msg.message),
+        "sender": sender,
+        "text": text,
         "created_at": msg.created_at.strftime("%Y-%m-%d %H:%M:%S"),
         "is_read": msg.is_read
-    } for msg in messages]
+    } for msg, sender, text in zip(messages, senders, texts)]
 
     return jsonify({"messages": messages_data})
 
@@ -865,23 +1287,20 @@ def submit_review():
         doc.insert_page(-1,text=f"Hakem Yorumları:\n\n{comments}")
 
 
-        updated_pdf_path = article.pdf_path.replace(".pdf", "_reviewed.pdf")
+        updated_pdf_path = new_working_path()
         doc.save(updated_pdf_path)
         doc.close()
 
 
-        article.pdf_path = updated_pdf_path
+        add_version(article, updated_pdf_path, "review")
         article.status = status
 
-        new_log = Log(
-            article_id=article.id,
-            reviewer_id=reviewer_id,
-            event=encrypt_data(f"{article.id} kodlu makalenin değerlendirmesi tamamlandı."),
-            timestamp=datetime.utcnow()
-        )
-        db.session.add(new_log)
+        log_event("review_submitted", article_id=article.id, reviewer_id=reviewer_id)
 
         db.session.commit()
+        invalidate_article(article.id)
+        publish_article_event(article, "review_submitted")
+        collect_garbage(article)
 
         return jsonify({"message": "Yorum başarıyla kaydedildi, PDF güncellendi ve durum güncellendi!"}), 200
     except Exception as e:
@@ -909,9 +1328,6 @@ def get_reviews(article_id):
 
 @app.route("/revise_article/<int:article_id>", methods=["PATCH"])
 def revise_article(article_id):
-    if not os.path.exists(UPLOAD_FOLDER):
-        os.makedirs(UPLOAD_FOLDER)
-
     article = Article.query.get(article_id)
     if not article:
         return jsonify({"message": "Makale bulunamadı!"}), 404
@@ -923,32 +1339,21 @@ def revise_article(article_id):
         article.title = encrypt_data(title)
 
     if file and allowed_file(file.filename):
-        try:
-            if os.path.exists(article.pdf_path):
-                os.remove(article.pdf_path)
-        except Exception as e:
-            return jsonify({"message": "Eski dosya silinirken hata oluştu!"}), 500
-
-        filename = secure_filename(file.filename)
-        file_extension = filename.rsplit('.', 1)[1].lower()
-
-        new_file_path = os.path.join(UPLOAD_FOLDER, f"{article.id}.{file_extension}")
+        # ESKİ SÜRÜMLER ARTIK DOĞRUDAN SİLİNMEZ, collect_garbage TARAFINDAN TEMİZLENİR
+        new_file_path = new_working_path()
         file.save(new_file_path)
 
-        article.pdf_path = new_file_path
+        add_version(article, new_file_path, "revise", anonymized_fields="")
         article.status = 'İncelemede'
         article.updated_at = datetime.utcnow()
 
-        new_log = Log(
-            article_id=article.id,
-            reviewer_id=article.editor_id,
-            event=encrypt_data(f"{article.id} kodlu makalenin revizesi yapıldı."),
-            timestamp=datetime.utcnow()
-        )
-        db.session.add(new_log)
+        log_event("article_revised", article_id=article.id, reviewer_id=article.editor_id)
 
     try:
         db.session.commit()
+        invalidate_article(article.id)
+        publish_article_event(article, "article_revised")
+        collect_garbage(article)
         return jsonify({"message": "Makale başarıyla revize edildi!"}), 200
     except Exception as e:
         db.session.rollback()
@@ -957,6 +1362,5 @@ def revise_article(article_id):
 
 
 if __name__ == "__main__":
-    with app.app_context():
-        db.create_all()
+    create_schema(app)
     app.run(debug=True, host="0.0.0.0", port=3000)
@@ -0,0 +1,150 @@
+import os
+import shutil
+import uuid
+from models import db, Article, PdfVersion
+from pdf_delivery import file_sha256
+from text_store import discard_document
+
+ARTIFACT_FOLDER = 'uploads/artifacts'
+WORKING_FOLDER = os.path.join(ARTIFACT_FOLDER, 'tmp')
+SOURCE_OPERATIONS = ("upload", "revise")
+
+
+def artifact_path(digest):
+    return os.path.join(ARTIFACT_FOLDER, digest[:2], f"{digest}.pdf")
+
+
+def new_working_path():
+    # İŞLEMLER ÇIKTILARINI ÖNCE GEÇİCİ BİR DOSYAYA YAZAR, add_version İÇERİK ÖZETİNE GÖRE DEPOYA TAŞIR
+    os.makedirs(WORKING_FOLDER, exist_ok=True)
+    return os.path.join(WORKING_FOLDER, f"{uuid.uuid4().hex}.pdf")
+
+
+def store_file(src_path):
+    digest = file_sha256(src_path)
+    target_path = artifact_path(digest)
+
+    if os.path.abspath(src_path) == os.path.abspath(target_path):
+        return digest, target_path
+
+    if os.path.exists(target_path):
+        # AYNI İÇERİK ZATEN DEPODA, TEKRAR YAZILMAZ
+        if os.path.abspath(src_path).startswith(os.path.abspath(WORKING_FOLDER)):
+            os.remove(src_path)
+        return digest, target_path
+
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    if os.path.abspath(src_path).startswith(os.path.abspath(WORKING_FOLDER)):
+        os.replace(src_path, target_path)
+    else:
+        shutil.copyfile(src_path, target_path)
+
+    return digest, target_path
+
+
+def discard_artifacts(paths):
+    # BAŞARISIZ COMMIT SONRASI ÇAĞRILIR: GEÇİCİ DOSYALAR VE HİÇBİR SÜRÜMÜN GÖSTERMEDİĞİ DEPO DOSYALARI SİLİNİR
+    for path in {path for path in paths if path}:
+        if not os.path.exists(path):
+            continue
+        if not os.path.abspath(path).startswith(os.path.abspath(WORKING_FOLDER)):
+            digest = os.path.splitext(os.path.basename(path))[0]
+            if (PdfVersion.query.filter_by(sha256=digest).first() or
+                    Article.query.filter_by(pdf_path=path).first()):
+                continue
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Dosya silinemedi: {e}")
+
+
+def add_version(article, src_path, operation, anonymized_fields=None):
+    # YENİ SÜRÜM OTURUMA EKLENİR VE MAKALENİN GÜNCEL PDF'İ YAPILIR, ÇAĞIRAN TARAF COMMIT EDER
+    digest, path = store_file(src_path)
+    current = PdfVersion.query.get(article.current_version_id) if article.current_version_id else None
+
+    if current and current.sha256 == digest and operation not in SOURCE_OPERATIONS:
+        # İÇERİK DEĞİŞMEDİYSE YENİ SÜRÜM AÇILMAZ
+        current.anonymized_fields = anonymized_fields
+        article.pdf_path = path
+        return current
+
+    version = PdfVersion(
+        article_id=article.id,
+        parent_id=current.id if current else None,
+        source_id=source_version(current).id if current else None,
+        operation=operation,
+        anonymized_fields=anonymized_fields,
+        sha256=digest,
+        size=os.path.getsize(path),
+    )
+    db.session.add(version)
+    db.session.flush()
+
+    if operation in SOURCE_OPERATIONS or version.source_id is None:
+        version.source_id = version.id
+
+    article.current_version_id = version.id
+    article.pdf_path = path
+    return version
+
+
+def add_upload_versions(uploads):
+    # TOPLU YÜKLEME: uploads (makale, dosya_yolu) ÇİFTLERİDİR. SÜRÜMLER TEK flush İLE EKLENİR,
+    # ÇAĞIRAN TARAF COMMIT EDER
+    versions = []
+    for article, src_path in uploads:
+        digest, path = store_file(src_path)
+        versions.append(PdfVersion(article_id=article.id, operation="upload", anonymized_fields="",
+                                   sha256=digest, size=os.path.getsize(path)))
+        article.pdf_path = path
+
+    db.session.add_all(versions)
+    db.session.flush()
+
+    for (article, _), version in zip(uploads, versions):
+        version.source_id = version.id
+        article.current_version_id = version.id
+
+    return versions
+
+
+def source_version(version):
+    # SÜRÜMÜN TÜRETİLDİĞİ ORİJİNAL YÜKLEME (VEYA REVİZYON)
+    if version.source_id in (None, version.id):
+        return version
+
+    return PdfVersion.query.get(version.source_id)
+
+
+def collect_garbage(article):
+    # GÜNCEL SÜRÜM, BİR ÖNCEKİ SÜRÜM VE ORİJİNAL KAYNAK TUTULUR; DİĞER SÜRÜMLER VE
+    # HİÇBİR SÜRÜMÜN GÖSTERMEDİĞİ DOSYALAR SİLİNİR
+    current = PdfVersion.query.get(article.current_version_id) if article.current_version_id else None
+    if not current:
+        return 0
+
+    source = source_version(current)
+    keep_ids = {current.id, current.parent_id, source.id if source else None} - {None}
+    stale_versions = PdfVersion.query.filter(PdfVersion.article_id == article.id,
+                                             ~PdfVersion.id.in_(keep_ids)).all()
+    if not stale_versions:
+        return 0
+
+    stale_ids = [version.id for version in stale_versions]
+    stale_digests = {version.sha256 for version in stale_versions}
+
+    PdfVersion.query.filter(PdfVersion.parent_id.in_(stale_ids)).update({"parent_id": None},
+                                                                        synchronize_session=False)
+    PdfVersion.query.filter(PdfVersion.id.in_(stale_ids)).delete(synchronize_session=False)
+    db.session.commit()
+
+    referenced = {digest for digest, in db.session.query(PdfVersion.sha256)
+                  .filter(PdfVersion.sha256.in_(stale_digests)).distinct()}
+    for digest in stale_digests - referenced:
+        path = artifact_path(digest)
+        if os.path.exists(path) and not Article.query.filter_by(pdf_path=path).first():
+            os.remove(path)
+            discard_document(digest)
+
+    return len(stale_versions)
@@ -0,0 +1,48 @@
+import base64
+import time
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+from crypto import AES_KEY, encrypt_many, decrypt_many
+
+# SATIR SATIR (ESKİ YÖNTEM) VE TOPLU DEŞİFRELEMEYİ 10.000 ALAN ÜZERİNDE KARŞILAŞTIRIR:
+#   python bench_crypto.py
+
+FIELD_COUNT = 10_000
+REPEAT = 5
+
+
+def legacy_decrypt_data(encrypted_data: str):
+    # HER ÇAĞRIDA Cipher VE UNPADDER OLUŞTURAN ESKİ decrypt_data
+    encrypted_data_bytes = base64.b64decode(encrypted_data)
+    iv = encrypted_data_bytes[:16]
+    decryptor = Cipher(algorithms.AES(AES_KEY), modes.CBC(iv), backend=default_backend()).decryptor()
+    decrypted_data = decryptor.update(encrypted_data_bytes[16:]) + decryptor.finalize()
+    unpadder = padding.PKCS7(128).unpadder()
+    return (unpadder.update(decrypted_data) + unpadder.finalize()).decode()
+
+
+def best_of(func, values):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(values)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    values = encrypt_many([f"Yazar {i}, Kocaeli Üniversitesi, yazar{i}@example.com" for i in range(FIELD_COUNT)])
+
+    assert [legacy_decrypt_data(value) for value in values] == decrypt_many(values)
+
+    per_row = best_of(lambda rows: [legacy_decrypt_data(value) for value in rows], values)
+    batched = best_of(decrypt_many, values)
+
+    print(f"{FIELD_COUNT} alan, en iyi {REPEAT} deneme")
+    print(f"satır satır : {per_row * 1000:.1f} ms")
+    print(f"toplu       : {batched * 1000:.1f} ms ({per_row / batched:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
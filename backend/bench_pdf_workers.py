@@ -0,0 +1,42 @@
+import argparse
+import time
+from text_store import extract_page
+from ocr import ocr_page, OCR_DPI, OCR_GRAYSCALE
+from page_pool import map_pages
+from redaction import RedactionEngine, find_page_matches
+
+# BÜYÜK BİR PDF ÜZERİNDE SAYFA İŞLEMLERİNİ 1 VE N WORKER İLE KARŞILAŞTIRIR:
+#   python bench_pdf_workers.py makale.pdf --workers 4 --authors "Ada Lovelace,Alan Turing"
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pdf_path")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--authors", default="")
+    args = parser.parse_args()
+
+    engine = RedactionEngine(email=True, authors=args.authors.split(",") if args.authors else None, institution=True)
+
+    for name, page_func, func_args in (("metin çıkarma", extract_page, ()),
+                                       ("OCR", ocr_page, (OCR_DPI, OCR_GRAYSCALE)),
+                                       ("redaksiyon tespiti", find_page_matches, (engine,))):
+        # İLK ÇAĞRI WORKER İŞLEMLERİNİ ISITIR, ÖLÇÜMLERE DAHİL EDİLMEZ
+        map_pages(args.pdf_path, page_func, *func_args, workers=args.workers)
+
+        single, single_result = timed(map_pages, args.pdf_path, page_func, *func_args, workers=1)
+        parallel, parallel_result = timed(map_pages, args.pdf_path, page_func, *func_args, workers=args.workers)
+        assert single_result == parallel_result
+
+        print(f"{name}: 1 worker {single:.2f} s, {args.workers} worker {parallel:.2f} s "
+              f"({single / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
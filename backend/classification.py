@@ -0,0 +1,129 @@
+import threading
+import unicodedata
+import numpy as np
+
+
+class CategoryIndex:
+    # INTEREST_CATEGORIES TERİMLERİNİN VEKTÖRLERİ TEK SEFERDE HESAPLANIR,
+    # ANAHTAR KELİMELER TEK BİR MATRİS ÇARPIMIYLA TÜM TERİMLERLE KARŞILAŞTIRILIR
+    def __init__(self, nlp, categories):
+        self.nlp = nlp
+        self.categories = list(categories.keys())
+        self.terms = []
+        self.term_categories = []
+
+        for category_idx, category in enumerate(self.categories):
+            for term in categories[category]:
+                self.terms.append(term)
+                self.term_categories.append(category_idx)
+
+        self.term_categories = np.array(self.term_categories, dtype=np.intp)
+
+        term_docs = list(nlp.pipe(self.terms))
+        self.term_orths = [tuple(token.orth for token in doc) for doc in term_docs]
+        self.dim = max((len(doc.vector) for doc in term_docs if doc.vector_norm), default=0)
+        self.matrix = self._normalized_matrix(term_docs)
+
+    def _normalized_matrix(self, docs):
+        matrix = np.zeros((len(docs), self.dim), dtype=np.float32)
+        for i, doc in enumerate(docs):
+            norm = doc.vector_norm
+            # spaCy'DE OLDUĞU GİBİ VEKTÖRÜ OLMAYAN DOKÜMANIN BENZERLİĞİ 0 KABUL EDİLİR
+            if norm and len(doc.vector) == self.dim:
+                matrix[i] = doc.vector / norm
+        return matrix
+
+    def similarities(self, keywords):
+        keyword_docs = list(self.nlp.pipe(keywords))
+        scores = self._normalized_matrix(keyword_docs) @ self.matrix.T
+
+        # Doc.similarity AYNI TOKENLARDAN OLUŞAN DOKÜMANLAR İÇİN DOĞRUDAN 1.0 DÖNDÜRÜR
+        term_positions = {}
+        for j, orths in enumerate(self.term_orths):
+            term_positions.setdefault(orths, []).append(j)
+        for i, doc in enumerate(keyword_docs):
+            for j in term_positions.get(tuple(token.orth for token in doc), []):
+                scores[i, j] = 1.0
+
+        return scores
+
+    def classify(self, keywords, threshold=0.9):
+        keywords = list(dict.fromkeys(keywords))
+        classified_interests = set()
+        if not keywords or not self.terms:
+            return classified_interests
+
+        scores = self.similarities(keywords)
+        for i, j in zip(*np.nonzero(scores > threshold)):
+            category = self.categories[self.term_categories[j]]
+            print(f"Semantik eşleşme bulundu: {keywords[i]} -> {category} (Benzerlik: {scores[i, j]})")
+            classified_interests.add(category)
+
+        return classified_interests
+
+
+_category_index = None
+_category_index_lock = threading.Lock()
+
+
+def get_category_index(nlp, categories):
+    global _category_index
+
+    if _category_index is None:
+        with _category_index_lock:
+            if _category_index is None:
+                _category_index = CategoryIndex(nlp, categories)
+
+    return _category_index
+
+
+def normalize_text(text):
+    return unicodedata.normalize("NFKC", text)
+
+
+def pipes_not_needed_for(nlp, component):
+    needed = {component}
+    for name, proc in nlp.pipeline:
+        if component in getattr(proc, "listening_components", []):
+            needed.add(name)
+
+    return [name for name in nlp.pipe_names if name not in needed]
+
+
+def org_entities(spacy_doc):
+    keywords = []
+    for ent in spacy_doc.ents:
+        print(f"Bulunan varlık: {ent.text} - Etiket: {ent.label_}")
+        if ent.label_ == "ORG":
+            keywords.append(ent.text.lower())
+
+    return keywords
+
+
+def extract_org_keywords(nlp, page_texts, batch_size=8, n_process=1):
+    page_texts = iter(page_texts)
+    disabled = pipes_not_needed_for(nlp, "ner")
+    extracted_keywords = []
+    fed_pages = []
+    processed = 0
+
+    def stream_texts():
+        for page_number, text in page_texts:
+            fed_pages.append((page_number, text))
+            yield text
+
+    try:
+        for spacy_doc in nlp.pipe(stream_texts(), batch_size=batch_size, n_process=n_process, disable=disabled):
+            extracted_keywords.extend(org_entities(spacy_doc))
+            processed += 1
+    except Exception as e:
+        # TOPLU İŞLEMDE HATA OLURSA KALAN SAYFALAR TEK TEK İŞLENİR
+        print(f"Sayfalar toplu işlenirken hata oluştu, sayfa sayfa devam ediliyor: {e}")
+        for page_number, text in fed_pages[processed:] + list(page_texts):
+            try:
+                extracted_keywords.extend(org_entities(nlp(text, disable=disabled)))
+            except Exception as e:
+                print(f"Sayfa {page_number + 1} işlenirken hata oluştu: {e}")
+                continue
+
+    return extracted_keywords
@@ -0,0 +1,77 @@
+import json
+import os
+
+# VERİTABANI AYARLARI ÖNCE APP_CONFIG_FILE İLE VERİLEN JSON DOSYASINDAN, SONRA ORTAM DEĞİŞKENLERİNDEN OKUNUR
+# (ORTAM DEĞİŞKENİ DOSYAYI EZER). ÖRNEK DOSYA:
+#   {"database_url": "mysql+pymysql://app@db/yazlab2_1", "pool_size": 10, "max_overflow": 5}
+# YEREL ÖLÇÜM İÇİN: DATABASE_URL=sqlite:///bench.db
+
+DEFAULT_DATABASE_URL = "mysql+pymysql://root@localhost/yazlab2_1"
+
+# AYAR ADI -> (ORTAM DEĞİŞKENİ, TİP, VARSAYILAN)
+DB_SETTINGS = {
+    "database_url": ("DATABASE_URL", str, DEFAULT_DATABASE_URL),
+    # WSGI WORKER BAŞINA BAĞLANTI SAYISI: pool_size + max_overflow. TOPLAM, MySQL max_connections'I AŞMAMALI
+    "pool_size": ("DB_POOL_SIZE", int, 5),
+    "max_overflow": ("DB_MAX_OVERFLOW", int, 10),
+    "pool_timeout": ("DB_POOL_TIMEOUT", int, 30),
+    "pool_pre_ping": ("DB_POOL_PRE_PING", bool, True),
+    # MySQL wait_timeout'UNDAN (VARSAYILAN 8 SAAT) KISA TUTULUR, SUNUCUNUN KAPATTIĞI BAĞLANTI KULLANILMAZ
+    "pool_recycle": ("DB_POOL_RECYCLE", int, 1800),
+    # 0 İSE SINIR YOK. MySQL'DE SELECT'LERE max_execution_time OLARAK UYGULANIR
+    "statement_timeout_ms": ("DB_STATEMENT_TIMEOUT_MS", int, 0),
+    "echo": ("DB_ECHO", bool, False),
+}
+
+
+def _parse(value, value_type):
+    if value_type is bool and isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    return value_type(value)
+
+
+def load_db_config(path=None):
+    path = path or os.environ.get("APP_CONFIG_FILE")
+    file_config = {}
+    if path:
+        with open(path) as f:
+            file_config = json.load(f)
+
+    config = {}
+    for name, (env_name, value_type, default) in DB_SETTINGS.items():
+        value = os.environ.get(env_name, file_config.get(name, default))
+        config[name] = _parse(value, value_type)
+
+    return config
+
+
+def engine_options(config):
+    url = config["database_url"]
+    options = {"pool_pre_ping": config["pool_pre_ping"], "echo": config["echo"]}
+
+    if url.startswith("sqlite"):
+        # SQLite TEK DOSYA; HAVUZ BOYUTU AYARLARI UYGULANMAZ, FLASK THREAD'LERİ AYNI BAĞLANTIYI PAYLAŞABİLİR
+        options["connect_args"] = {"check_same_thread": False, "timeout": 30}
+        return options
+
+    options.update(
+        pool_size=config["pool_size"],
+        max_overflow=config["max_overflow"],
+        pool_timeout=config["pool_timeout"],
+        pool_recycle=config["pool_recycle"],
+    )
+
+    timeout = config["statement_timeout_ms"]
+    if timeout and url.startswith("mysql"):
+        options["connect_args"] = {"init_command": f"SET SESSION max_execution_time={timeout}"}
+    elif timeout and url.startswith("postgresql"):
+        options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+
+    return options
+
+
+def configure_database(app, path=None):
+    config = load_db_config(path)
+    app.config["SQLALCHEMY_DATABASE_URI"] = config["database_url"]
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(config)
+    return config
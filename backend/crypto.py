@@ -0,0 +1,58 @@
+import base64
+import hashlib
+import hmac
+import os
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.backends import default_backend
+
+AES_KEY = b'asdfghjklqwertyu'  # 16 BYTE UZUNLUĞUNDA ANAHTAR
+BLIND_INDEX_KEY = os.environ.get("BLIND_INDEX_KEY", "zxcvbnmqwertyuiopasdfghj").encode()
+BLOCK_SIZE = 16
+
+# ANAHTAR VE BACKEND BİR KEZ HAZIRLANIR, HER ÇAĞRIDA SADECE IV'E ÖZEL CBC MODU OLUŞTURULUR
+_algorithm = algorithms.AES(AES_KEY)
+_backend = default_backend()
+
+
+def encrypt_data(data: str):
+    iv = os.urandom(BLOCK_SIZE)  # 16 RASTGELE BİR IV
+
+    # PKCS7 PADDING: VERİ UZUNLUĞUNU 16 BYTE'IN KATINA TAMAMLA
+    padder = padding.PKCS7(128).padder()
+    padded_data = padder.update(data.encode()) + padder.finalize()
+
+    encryptor = Cipher(_algorithm, modes.CBC(iv), backend=_backend).encryptor()
+    encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+
+    # ŞİFRELİ VERİYİ BASE64'E DÖNÜŞTÜR, IV'I DA ŞİFRELİ VERİYLE DÖNDÜR
+    return base64.b64encode(iv + encrypted_data).decode()
+
+
+def decrypt_data(encrypted_data: str):
+    encrypted_data_bytes = base64.b64decode(encrypted_data)
+
+    # IV'I BAŞINDAN AYIR, KALAN KISIM ŞİFRELİ VERİ
+    iv = encrypted_data_bytes[:BLOCK_SIZE]
+    decryptor = Cipher(_algorithm, modes.CBC(iv), backend=_backend).decryptor()
+    decrypted_data = decryptor.update(encrypted_data_bytes[BLOCK_SIZE:]) + decryptor.finalize()
+
+    unpadder = padding.PKCS7(128).unpadder()
+    return (unpadder.update(decrypted_data) + unpadder.finalize()).decode()
+
+
+def encrypt_many(values):
+    return [encrypt_data(value) if value is not None else None for value in values]
+
+
+def decrypt_many(values):
+    return [decrypt_data(value) if value is not None else None for value in values]
+
+
+def blind_index(data: str):
+    # ŞİFRELİ ALANLARDA TAM EŞLEŞME ARAMASI İÇİN ANAHTARLI HMAC-SHA256 ÖZETİ
+    return hmac.new(BLIND_INDEX_KEY, data.encode(), hashlib.sha256).hexdigest()
+
+
+def email_blind_index(email: str):
+    return blind_index(email.strip().lower())
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+from collections import deque
+
+EVENT_BUFFER_SIZE = 1000
+EVENT_HEARTBEAT = 15  # SANİYE
+
+
+class InProcessBroker:
+    # OLAYLAR SON EVENT_BUFFER_SIZE KAYITLIK HALKADA TUTULUR; İSTEMCİ SON GÖRDÜĞÜ id İLE
+    # KALDIĞI YERDEN DEVAM EDER. SADECE AYNI SÜREÇTEKİ YAYINLARI GÖRÜR, BİRDEN FAZLA SÜREÇ
+    # İÇİN AYNI ARAYÜZLE BAŞKA BİR BROKER TAKILMALIDIR (set_broker)
+    def __init__(self, buffer_size=EVENT_BUFFER_SIZE):
+        self.events = deque(maxlen=buffer_size)
+        self.last_id = 0
+        self.condition = threading.Condition()
+
+    def publish(self, channels, event_type, data):
+        with self.condition:
+            self.last_id += 1
+            self.events.append((self.last_id, set(channels), event_type, data))
+            self.condition.notify_all()
+            return self.last_id
+
+    def _pending(self, channels, after_id):
+        return [{'id': event_id, 'type': event_type, 'data': data}
+                for event_id, event_channels, event_type, data in self.events
+                if event_id > after_id and event_channels & channels]
+
+    def wait(self, channels, after_id, timeout):
+        # after_id SONRASINDAKİ OLAYLAR DÖNER; YOKSA timeout SANİYEYE KADAR BEKLENİR.
+        # after_id None İSE SADECE BUNDAN SONRAKİ OLAYLAR BEKLENİR
+        channels = set(channels)
+        deadline = time.monotonic() + timeout
+
+        with self.condition:
+            if after_id is None or after_id > self.last_id:
+                after_id = self.last_id
+            while True:
+                events = self._pending(channels, after_id)
+                remaining = deadline - time.monotonic()
+                if events or remaining <= 0:
+                    return events, max([after_id] + [event['id'] for event in events])
+                self.condition.wait(remaining)
+
+
+_broker = InProcessBroker()
+
+
+def get_broker():
+    return _broker
+
+
+def set_broker(broker):
+    # publish(channels, event_type, data) VE wait(channels, after_id, timeout) SAĞLAYAN HERHANGİ BİR NESNE
+    global _broker
+    _broker = broker
+
+
+def article_channels(article):
+    channels = [f"article:{article.id}", "admin"]
+    if article.editor_id:
+        channels.append(f"reviewer:{article.editor_id}")
+    return channels
+
+
+def publish_article_event(article, event_type, **data):
+    # OLAYLAR KÜÇÜK TUTULUR (KİMLİK VE DURUM); ŞİFRELİ ALANLAR YAYINLANMAZ,
+    # İSTEMCİ GEREKİRSE AYRINTIYI ÇEKER
+    data = dict(data, article_id=article.id, status=article.status)
+    try:
+        return get_broker().publish(article_channels(article), event_type, data)
+    except Exception as e:
+        print(f"Olay yayınlanamadı: {e}")
+        return None
+
+
+def format_sse(event):
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+def stream_events(channels, after_id, heartbeat=EVENT_HEARTBEAT):
+    # SSE AKIŞI: OLAY YOKSA PROXY'LER BAĞLANTIYI KAPATMASIN DİYE ARALIKLI YORUM SATIRI GÖNDERİLİR
+    while True:
+        events, after_id = get_broker().wait(channels, after_id, heartbeat)
+        if not events:
+            yield ": keep-alive\n\n"
+        for event in events:
+            yield format_sse(event)
@@ -0,0 +1,146 @@
+import json
+import os
+import random
+import zipfile
+from contextlib import nullcontext
+from models import Article
+from artifacts import new_working_path
+
+BULK_UPLOAD_MAX_ITEMS = int(os.environ.get("BULK_UPLOAD_MAX_ITEMS", 200))
+METADATA_MAX_BYTES = 1024 * 1024
+# TEK PDF VE İSTEK BAŞINA TOPLAM YAZILACAK BOYUT SINIRLARI; ZIP BOMBASI DİSKİ DOLDURAMAZ
+BULK_UPLOAD_MAX_FILE_BYTES = int(os.environ.get("BULK_UPLOAD_MAX_FILE_BYTES", 50 * 1024 * 1024))
+BULK_UPLOAD_MAX_TOTAL_BYTES = int(os.environ.get("BULK_UPLOAD_MAX_TOTAL_BYTES", 500 * 1024 * 1024))
+PDF_MAGIC = b"%PDF"
+COPY_CHUNK_SIZE = 1024 * 1024
+REQUIRED_FIELDS = ('email', 'title', 'institution')
+TEXT_FIELDS = ('file', 'email', 'title', 'authors', 'institution')
+
+
+def generate_tracking_codes(count):
+    # ADAYLAR TOPLU ÜRETİLİR VE TEK SORGUYLA KONTROL EDİLİR;
+    # ÇAKIŞMA OLURSA SADECE EKSİK KADAR YENİ ADAY DENENİR
+    codes = set()
+    while len(codes) < count:
+        candidates = {random.randint(10000000, 99999999) for _ in range((count - len(codes)) * 2)} - codes
+        existing = {article_id for article_id, in
+                    Article.query.with_entities(Article.id).filter(Article.id.in_(list(candidates))).all()}
+        codes.update(list(candidates - existing)[:count - len(codes)])
+
+    return [str(code) for code in codes]
+
+
+def parse_metadata(raw):
+    # METADATA: [{"file": "makale.pdf", "email": ..., "title": ..., "authors": ..., "institution": ...}, ...]
+    items = json.loads(raw) if raw else []
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError("metadata bir nesne listesi olmalıdır")
+
+    return items
+
+
+def referenced_files(items):
+    # SADECE METADATADA ADI GEÇEN DOSYALAR DİSKE YAZILIR; MAKALE SAYISI SINIRI AŞILDIYSA HİÇBİRİ
+    if len(items) > BULK_UPLOAD_MAX_ITEMS:
+        return set()
+
+    return {item['file'] for item in items if isinstance(item.get('file'), str)}
+
+
+def _copy_stream(src, dest_path, name, max_bytes):
+    # DOSYA BELLEĞE ALINMADAN PARÇA PARÇA DİSKE YAZILIR; SINIR BAŞLIKTAKİ BOYUTA DEĞİL GERÇEKTE
+    # YAZILAN BYTE'LARA UYGULANIR. %PDF İLE BAŞLAMAYAN DOSYA REDDEDİLİR
+    written = 0
+    with open(dest_path, 'wb') as dest:
+        while True:
+            chunk = src.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            if written == 0 and not chunk.startswith(PDF_MAGIC):
+                raise ValueError(f"{name} bir PDF dosyası değil")
+            written += len(chunk)
+            if written > max_bytes:
+                raise ValueError(f"{name} izin verilen boyutu aşıyor")
+            dest.write(chunk)
+
+    if written == 0:
+        raise ValueError(f"{name} boş")
+
+    return written
+
+
+def _stage_streams(entries):
+    # entries: (dosya_adı, boyut VEYA None, akış_açıcı). DOSYA VE TOPLAM BOYUT SINIRLARI HEM BİLDİRİLEN
+    # BOYUTLA AÇMADAN ÖNCE HEM YAZILAN BYTE'LARLA KONTROL EDİLİR
+    staged = {}
+    remaining = BULK_UPLOAD_MAX_TOTAL_BYTES
+    try:
+        for name, size, open_stream in entries:
+            if name in staged:
+                continue
+            max_bytes = min(BULK_UPLOAD_MAX_FILE_BYTES, remaining)
+            if size is not None and size > max_bytes:
+                raise ValueError(f"{name} izin verilen boyutu aşıyor")
+
+            path = new_working_path()
+            staged[name] = path
+            with open_stream() as src:
+                remaining -= _copy_stream(src, path, name, max_bytes)
+    except Exception:
+        # YARIDA KALAN AKTARIMDA O ANA KADAR YAZILAN DOSYALAR SİLİNİR
+        discard_staged(staged.values())
+        raise
+
+    return staged
+
+
+def stage_multipart_files(files):
+    # ÇOK PARÇALI İSTEKTEKİ DOSYALAR GEÇİCİ ÇALIŞMA ALANINA YAZILIR: {dosya_adı: yol}
+    return _stage_streams((file.filename, None, lambda file=file: nullcontext(file.stream)) for file in files)
+
+
+def stage_zip_archive(archive, raw_metadata=None):
+    # METADATA FORMDAN GELMEDİYSE ZIP İÇİNDEKİ metadata.json OKUNUR. SADECE METADATADA ADI GEÇEN
+    # PDF'LER TEK TEK AÇILIP AKITILIR: ({dosya_adı: yol}, metadata)
+    with zipfile.ZipFile(archive) as zf:
+        entries = [info for info in zf.infolist() if not info.is_dir()]
+        if not raw_metadata:
+            metadata_info = next((info for info in entries if os.path.basename(info.filename) == 'metadata.json'),
+                                 None)
+            if metadata_info:
+                if metadata_info.file_size > METADATA_MAX_BYTES:
+                    raise ValueError("metadata.json çok büyük")
+                with zf.open(metadata_info) as f:
+                    raw_metadata = f.read(METADATA_MAX_BYTES + 1)
+                if len(raw_metadata) > METADATA_MAX_BYTES:
+                    raise ValueError("metadata.json çok büyük")
+                raw_metadata = raw_metadata.decode('utf-8')
+
+        items = parse_metadata(raw_metadata)
+        wanted = referenced_files(items)
+
+        staged = _stage_streams((os.path.basename(info.filename), info.file_size,
+                                 lambda info=info: zf.open(info))
+                                for info in entries
+                                if os.path.basename(info.filename) in wanted and info.filename.lower().endswith('.pdf'))
+
+    return staged, items
+
+
+def discard_staged(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def validate_item(item, staged):
+    wrong_types = [field for field in TEXT_FIELDS if item.get(field) is not None and not isinstance(item[field], str)]
+    if wrong_types:
+        return f"Metin olması gereken alanlar: {', '.join(wrong_types)}"
+    missing = [field for field in REQUIRED_FIELDS if not item.get(field)]
+    if missing:
+        return f"Eksik alanlar: {', '.join(missing)}"
+    if item.get('file') not in staged:
+        return "PDF dosyası bulunamadı"
+
+    return None
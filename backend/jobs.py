@@ -0,0 +1,135 @@
+import json
+import time
+import traceback
+from datetime import datetime, timedelta
+from models import db, Article, Job
+
+JOB_HANDLERS = {}
+JOB_RETRY_DELAY = 30  # SANİYE, HER DENEMEDE KATLANARAK ARTAR
+JOB_LOCK_TIMEOUT = 15 * 60  # BU SÜREDEN UZUN "running" KALAN İŞ, ÇÖKMÜŞ WORKER'DAN KALMIŞ SAYILIR
+
+
+def job_handler(kind):
+    def register(func):
+        JOB_HANDLERS[kind] = func
+        return func
+
+    return register
+
+
+def enqueue_job(kind, article_id, payload=None, max_attempts=3):
+    # İŞ SADECE OTURUMA EKLENİR, ÇAĞIRAN TARAF KENDİ KAYDIYLA BİRLİKTE COMMIT EDER
+    job = Job(kind=kind, article_id=article_id, max_attempts=max_attempts, run_after=datetime.utcnow(),
+              payload=json.dumps(payload) if payload is not None else None)
+    db.session.add(job)
+    return job
+
+
+def claim_next_job(worker_name):
+    skipped_articles = set()
+
+    while True:
+        now = datetime.utcnow()
+        # AYNI MAKALENİN PDF'İ ÜZERİNDE İŞLER SIRAYLA ÇALIŞSIN DİYE ÇALIŞAN İŞİ OLAN MAKALELER ATLANIR
+        busy_articles = db.session.query(Job.article_id).filter(Job.status == "running")
+        candidate = (Job.query.filter(Job.status == "queued", Job.run_after <= now,
+                                      ~Job.article_id.in_(busy_articles),
+                                      ~Job.article_id.in_(list(skipped_articles)))
+                     .order_by(Job.run_after, Job.id).first())
+        if not candidate:
+            db.session.rollback()
+            return None
+
+        candidate_id, article_id = candidate.id, candidate.article_id
+        db.session.rollback()
+
+        # MAKALE SATIRI KİLİTLENİR: AYNI MAKALE İÇİN İKİ WORKER AYNI ANDA İŞ ALAMAZ. KİLİT ALINDIKTAN
+        # SONRA ÇALIŞAN İŞ KONTROLÜ TEKRARLANIR, ÇÜNKÜ İLK SORGU ESKİ BİR DURUMU GÖRMÜŞ OLABİLİR
+        locked = (Article.query.filter_by(id=article_id)
+                  .with_for_update(skip_locked=True).with_entities(Article.id).first())
+        running = Job.query.filter_by(article_id=article_id, status="running").first() if locked else None
+        if not locked or running:
+            db.session.rollback()
+            skipped_articles.add(article_id)
+            continue
+
+        # AYNI İŞİ İKİ WORKER ALMASIN DİYE DURUM KOŞULLU GÜNCELLENİR
+        claimed = Job.query.filter_by(id=candidate_id, status="queued").update({
+            "status": "running",
+            "attempts": Job.attempts + 1,
+            "locked_by": worker_name,
+            "locked_at": now,
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if claimed:
+            return Job.query.get(candidate_id)
+
+
+def finish_job(job, result=None):
+    job.status = "done"
+    job.result = json.dumps(result) if result is not None else None
+    job.last_error = None
+    job.locked_by = None
+    job.locked_at = None
+    db.session.commit()
+
+
+def fail_job(job, error):
+    job.last_error = error
+    job.locked_by = None
+    job.locked_at = None
+
+    if job.attempts >= job.max_attempts:
+        # DEAD-LETTER: TEKRAR DENENMEZ, job_status İLE İNCELENEBİLİR
+        job.status = "dead"
+        print(f"{job.id} numaralı iş {job.attempts} denemeden sonra dead-letter'a taşındı.")
+    else:
+        job.status = "queued"
+        job.run_after = datetime.utcnow() + timedelta(seconds=JOB_RETRY_DELAY * 2 ** (job.attempts - 1))
+        print(f"{job.id} numaralı iş tekrar denenecek ({job.attempts}/{job.max_attempts}).")
+
+    db.session.commit()
+
+
+def run_job(job):
+    handler = JOB_HANDLERS.get(job.kind)
+
+    try:
+        if not handler:
+            raise LookupError(f"Bilinmeyen iş türü: {job.kind}")
+        result = handler(job)
+    except Exception:
+        db.session.rollback()
+        error = traceback.format_exc()
+        print(f"{job.id} numaralı iş çalıştırılırken hata oluştu: {error}")
+        fail_job(Job.query.get(job.id), error)
+        return False
+
+    finish_job(job, result)
+    return True
+
+
+def requeue_stale_jobs():
+    stale_before = datetime.utcnow() - timedelta(seconds=JOB_LOCK_TIMEOUT)
+    stale_jobs = Job.query.filter(Job.status == "running", Job.locked_at < stale_before).all()
+
+    for job in stale_jobs:
+        fail_job(job, f"{job.locked_by} worker'ı işi zamanında bitirmedi.")
+
+    return len(stale_jobs)
+
+
+def work_forever(worker_name, poll_interval=2.0):
+    print(f"{worker_name} worker'ı başlatıldı.")
+
+    while True:
+        requeue_stale_jobs()
+        job = claim_next_job(worker_name)
+
+        if not job:
+            time.sleep(poll_interval)
+            continue
+
+        print(f"{worker_name}: {job.id} numaralı {job.kind} işi çalıştırılıyor.")
+        run_job(job)
@@ -0,0 +1,163 @@
+import re
+import threading
+from collections import deque
+from rapidfuzz import fuzz, process
+from unidecode import unidecode
+
+FUZZY_THRESHOLD = 90
+FUZZY_MIN_LENGTH = 6
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-/][a-z0-9]+)*")
+
+
+def normalize_term(text):
+    # TÜRKÇE VE DİĞER AKSANLI KARAKTERLER ASCII'YE ÇEVRİLİR ("ınteraction" -> "interaction")
+    return " ".join(unidecode(text).casefold().split())
+
+
+class AhoCorasick:
+    # TÜM TERİMLER TEK OTOMATTA TUTULUR, METİN TERİM SAYISINDAN BAĞIMSIZ OLARAK TEK GEÇİŞTE TARANIR
+    def __init__(self, terms):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for term_idx, term in enumerate(terms):
+            state = 0
+            for char in term:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append(term_idx)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail_state = self.fail[state]
+                while fail_state and char not in self.goto[fail_state]:
+                    fail_state = self.fail[fail_state]
+                self.fail[next_state] = self.goto[fail_state].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter(self, text):
+        # (bitiş_konumu, terim_indeksi) ÇİFTLERİ; bitiş_konumu DAHİLDİR
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for term_idx in self.output[state]:
+                yield i, term_idx
+
+
+class KeywordMatcher:
+    def __init__(self, categories, fuzzy_threshold=FUZZY_THRESHOLD):
+        self.categories = list(categories.keys())
+        self.fuzzy_threshold = fuzzy_threshold
+        self.terms = []
+        self.term_categories = []
+
+        # AYNI TERİM BİRDEN FAZLA KATEGORİDE GEÇEBİLİR, OTOMATTA BİR KEZ YER ALIR
+        term_indices = {}
+        for category in self.categories:
+            for term in categories[category]:
+                term = normalize_term(term)
+                if term not in term_indices:
+                    term_indices[term] = len(self.terms)
+                    self.terms.append(term)
+                    self.term_categories.append(set())
+                self.term_categories[term_indices[term]].add(category)
+
+        self.automaton = AhoCorasick(self.terms)
+        # KISA KISALTMALAR ("mr", "cnn") BULANIK EŞLEŞMEDE HER KELİMEYE BENZEDİĞİ İÇİN YALNIZ TAM EŞLEŞİR
+        self.fuzzy_terms = [i for i, term in enumerate(self.terms) if len(term) >= FUZZY_MIN_LENGTH]
+        self.max_term_words = max((len(term.split()) for term in self.terms), default=0)
+
+    @staticmethod
+    def is_boundary(text, start, end):
+        return ((start == 0 or not text[start - 1].isalnum()) and
+                (end == len(text) or not text[end].isalnum()))
+
+    def exact_matches(self, text):
+        matches = []
+        for end, term_idx in self.automaton.iter(text):
+            start = end - len(self.terms[term_idx]) + 1
+            if self.is_boundary(text, start, end + 1):
+                matches.append((term_idx, start, end + 1, 100.0))
+
+        return matches
+
+    def fuzzy_matches(self, text, covered):
+        # TAM EŞLEŞMEYE GİRMEYEN KELİME n-GRAMLARI TÜM TERİMLERLE TEK cdist ÇAĞRISIYLA KARŞILAŞTIRILIR
+        if not self.fuzzy_terms:
+            return []
+
+        covered_chars = bytearray(len(text))
+        for start, end in covered:
+            covered_chars[start:end] = b"\x01" * (end - start)
+
+        tokens = [(m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+        candidates = {}
+        for i in range(len(tokens)):
+            for n in range(1, self.max_term_words + 1):
+                # n-GRAM TAM EŞLEŞEN BİR TERİMİN ÜZERİNDEN GEÇEMEZ
+                if i + n > len(tokens) or any(covered_chars[slice(*tokens[i + n - 1])]):
+                    break
+                start, end = tokens[i][0], tokens[i + n - 1][1]
+                ngram = " ".join(text[s:e] for s, e in tokens[i:i + n])
+                if len(ngram) >= FUZZY_MIN_LENGTH:
+                    candidates.setdefault(ngram, []).append((start, end))
+
+        if not candidates:
+            return []
+
+        ngrams = list(candidates)
+        fuzzy_terms = [self.terms[i] for i in self.fuzzy_terms]
+        scores = process.cdist(ngrams, fuzzy_terms, scorer=fuzz.ratio, score_cutoff=self.fuzzy_threshold,
+                               workers=-1)
+
+        matches = []
+        for i, j in zip(*scores.nonzero()):
+            for start, end in candidates[ngrams[i]]:
+                matches.append((self.fuzzy_terms[j], start, end, float(scores[i, j])))
+
+        return matches
+
+    def match_page(self, text):
+        text = normalize_term(text)
+        exact = self.exact_matches(text)
+        fuzzy = self.fuzzy_matches(text, [(start, end) for _, start, end, _ in exact])
+        return exact + fuzzy
+
+    def match(self, page_texts):
+        # page_texts: (sayfa_no, metin) LİSTESİ. KATEGORİ BAŞINA PUAN (TAM EŞLEŞME 1, BULANIK
+        # EŞLEŞME BENZERLİK/100) VE EŞLEŞEN TERİMLERİN KONUMLARI DÖNER; KONUMLAR NORMALİZE METNE GÖREDİR
+        results = {}
+        for page_num, text in page_texts:
+            for term_idx, start, end, score in self.match_page(text):
+                for category in self.term_categories[term_idx]:
+                    result = results.setdefault(category, {"score": 0.0, "matches": []})
+                    result["score"] += score / 100
+                    result["matches"].append({"term": self.terms[term_idx], "page": page_num,
+                                              "start": start, "end": end, "score": score})
+
+        return results
+
+
+_keyword_matcher = None
+_keyword_matcher_lock = threading.Lock()
+
+
+def get_keyword_matcher(categories):
+    global _keyword_matcher
+
+    if _keyword_matcher is None:
+        with _keyword_matcher_lock:
+            if _keyword_matcher is None:
+                _keyword_matcher = KeywordMatcher(categories)
+
+    return _keyword_matcher
@@ -0,0 +1,66 @@
+import json
+from models import db, Log
+from crypto import encrypt_many, decrypt_many
+
+# OLAY TİPİ -> (VARSAYILAN AKTÖR, CÜMLE ŞABLONU). ŞABLONDAKİ article_id VE reviewer_id SATIRDAN,
+# DİĞER ALANLAR ŞİFRELİ payload'DAN GELİR
+EVENT_TEMPLATES = {
+    "article_uploaded": ("author",
+                         "{article_id} kodlu ve {title} başlıklı bir makale yüklendi. Yazarlar: {authors}."),
+    "reviewer_added": ("editor", "{name} adlı hakem kaydı yapıldı."),
+    "reviewer_assigned": ("editor", "{article_id} kodlu makaleye {reviewer_name} adlı hakem ataması yapıldı."),
+    "anonymity_updated": ("editor", "{article_id} kodlu makalenin anonimlik bilgisi güncellendi."),
+    "message_sent": ("author", "Mesaj gönderildi."),
+    "review_submitted": ("reviewer", "{article_id} kodlu makalenin değerlendirmesi tamamlandı."),
+    "article_revised": ("author", "{article_id} kodlu makalenin revizesi yapıldı."),
+}
+
+
+def log_event(event_type, article_id=None, reviewer_id=None, actor=None, **sensitive):
+    # KAYIT SADECE OTURUMA EKLENİR, ÇAĞIRAN TARAF COMMIT EDER
+    return log_events(event_type, [dict(sensitive, article_id=article_id, reviewer_id=reviewer_id)], actor)[0]
+
+
+def log_events(event_type, items, actor=None):
+    # AYNI TİPTE BİRDEN FAZLA OLAY; HASSAS ALANLAR TOPLU ŞİFRELENİR
+    actor = actor or EVENT_TEMPLATES[event_type][0]
+    sensitive = [{key: value for key, value in item.items() if key not in ('article_id', 'reviewer_id')}
+                 for item in items]
+    payloads = encrypt_many([json.dumps(fields, ensure_ascii=False, separators=(',', ':')) if fields else None
+                             for fields in sensitive])
+
+    logs = [Log(article_id=item.get('article_id'), reviewer_id=item.get('reviewer_id'), event_type=event_type,
+                actor=actor, payload=payload)
+            for item, payload in zip(items, payloads)]
+    db.session.add_all(logs)
+    return logs
+
+
+class _Missing(dict):
+    def __missing__(self, key):
+        return "?"
+
+
+def render_event(event_type, article_id, reviewer_id, fields):
+    template = EVENT_TEMPLATES.get(event_type, (None, event_type or ""))[1]
+    return template.format_map(_Missing(fields, article_id=article_id, reviewer_id=reviewer_id))
+
+
+def render_events(rows):
+    # rows: Log NESNELERİ VEYA AYNI ALANLARI TAŞIYAN SÖZLÜKLER. ESKİ KAYITLARIN CÜMLESİ ÇÖZÜLÜR,
+    # YENİLERİN CÜMLESİ ŞABLONDAN ÜRETİLİR; ŞİFRE ÇÖZME TOPLU YAPILIR
+    def field(row, name):
+        return row.get(name) if isinstance(row, dict) else getattr(row, name)
+
+    legacy = decrypt_many([field(row, 'event') if not field(row, 'event_type') else None for row in rows])
+    payloads = decrypt_many([field(row, 'payload') if field(row, 'event_type') else None for row in rows])
+
+    rendered = []
+    for row, legacy_event, payload in zip(rows, legacy, payloads):
+        if legacy_event is not None:
+            rendered.append(legacy_event)
+        else:
+            rendered.append(render_event(field(row, 'event_type'), field(row, 'article_id'),
+                                         field(row, 'reviewer_id'), json.loads(payload) if payload else {}))
+
+    return rendered
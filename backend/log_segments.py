@@ -0,0 +1,173 @@
+import argparse
+import gzip
+import json
+import os
+import re
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from models import db, Log
+
+# ESKİ LOG KAYITLARI SIKIŞTIRILMIŞ, DEĞİŞMEZ DOSYALARA TAŞINIR, log TABLOSU KÜÇÜK KALIR:
+#   python log_segments.py --older-than-days 30
+
+LOG_SEGMENT_FOLDER = 'uploads/log_segments'
+LOG_SEGMENT_ROWS = int(os.environ.get("LOG_SEGMENT_ROWS", 10000))
+LOG_HOT_DAYS = int(os.environ.get("LOG_HOT_DAYS", 30))
+SEGMENT_PATTERN = re.compile(r"^segment-(\d{12})-(\d{12})\.jsonl\.gz$")
+
+
+def segment_name(first_id, last_id):
+    return f"segment-{first_id:012d}-{last_id:012d}.jsonl.gz"
+
+
+def list_segments():
+    # (ilk_id, son_id, dosya_adı) LİSTESİ, id SIRASIYLA; ARALIK DOSYA ADINDAN OKUNUR
+    if not os.path.isdir(LOG_SEGMENT_FOLDER):
+        return []
+
+    segments = []
+    for name in os.listdir(LOG_SEGMENT_FOLDER):
+        match = SEGMENT_PATTERN.match(name)
+        if match:
+            segments.append((int(match.group(1)), int(match.group(2)), name))
+
+    return sorted(segments)
+
+
+def segment_path(name):
+    if not SEGMENT_PATTERN.match(name):
+        raise ValueError(f"Geçersiz segment adı: {name}")
+    return os.path.join(LOG_SEGMENT_FOLDER, name)
+
+
+def log_row(log):
+    # event VE payload ŞİFRELİ HALİYLE SAKLANIR, SEGMENTLER DE TABLO KADAR KORUNUR
+    return {
+        'id': log.id,
+        'article_id': log.article_id,
+        'reviewer_id': log.reviewer_id,
+        'event': log.event,
+        'event_type': log.event_type,
+        'actor': log.actor,
+        'payload': log.payload,
+        'timestamp': log.timestamp.isoformat() if log.timestamp else None,
+    }
+
+
+def write_segment(logs):
+    os.makedirs(LOG_SEGMENT_FOLDER, exist_ok=True)
+    path = os.path.join(LOG_SEGMENT_FOLDER, segment_name(logs[0].id, logs[-1].id))
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        for log in logs:
+            f.write(json.dumps(log_row(log)) + "\n")
+
+    os.chmod(tmp_path, 0o444)
+    os.replace(tmp_path, path)
+    return path
+
+
+def compact_logs(older_than=None, segment_rows=LOG_SEGMENT_ROWS):
+    # ESKİ KAYITLAR segment_rows'LUK PARÇALAR HALİNDE YAZILIR; DOSYA DİSKE YAZILMADAN SATIRLAR SİLİNMEZ
+    older_than = older_than or datetime.utcnow() - timedelta(days=LOG_HOT_DAYS)
+    written = []
+
+    # SEGMENT ARALIKLARI TABLODA KALAN KAYITLARLA ÇAKIŞMASIN DİYE SINIR id ÜZERİNDEN BELİRLENİR:
+    # older_than'DAN YENİ İLK KAYDIN ÖNCESİNDEKİ HER ŞEY TAŞINIR
+    boundary_id = (db.session.query(db.func.min(Log.id)).filter(Log.timestamp >= older_than).scalar() or
+                   (db.session.query(db.func.max(Log.id)).scalar() or 0) + 1)
+
+    while True:
+        logs = Log.query.filter(Log.id < boundary_id).order_by(Log.id.asc()).limit(segment_rows).all()
+        if not logs:
+            break
+
+        written.append(write_segment(logs))
+        Log.query.filter(Log.id.in_([log.id for log in logs])).delete(synchronize_session=False)
+        db.session.commit()
+        print(f"{len(logs)} log kaydı {written[-1]} dosyasına taşındı.")
+
+        if len(logs) < segment_rows:
+            break
+
+    return written
+
+
+def _read_segment(name):
+    with gzip.open(segment_path(name), 'rt', encoding='utf-8') as f:
+        for line in f:
+            row = json.loads(line)
+            if row['timestamp']:
+                row['timestamp'] = datetime.fromisoformat(row['timestamp'])
+            yield row
+
+
+def _row_matches(row, article_id=None, reviewer_id=None, timestamp_from=None, timestamp_to=None):
+    if article_id and row['article_id'] != article_id:
+        return False
+    if reviewer_id and row['reviewer_id'] != reviewer_id:
+        return False
+    if timestamp_from and (not row['timestamp'] or row['timestamp'] < timestamp_from):
+        return False
+    if timestamp_to and (not row['timestamp'] or row['timestamp'] > timestamp_to):
+        return False
+
+    return True
+
+
+def iter_segment_rows(after_id=0, article_id=None, reviewer_id=None):
+    # SEGMENTLER BELLEĞE ALINMADAN SATIR SATIR OKUNUR
+    for first_id, last_id, name in list_segments():
+        if last_id <= after_id:
+            continue
+
+        for row in _read_segment(name):
+            if row['id'] > after_id and _row_matches(row, article_id, reviewer_id):
+                yield row
+
+
+def iter_segment_rows_desc(before_id=None, article_id=None, reviewer_id=None, timestamp_from=None,
+                           timestamp_to=None):
+    # YENİDEN ESKİYE (id AZALAN) SIRA; TERS ÇEVRİLMEK İÇİN BİR SEGMENT (EN FAZLA LOG_SEGMENT_ROWS SATIR)
+    # BELLEĞE ALINIR. TABLODAKİ KAYITLARIN HEPSİ SEGMENTLERDEN YENİ OLDUĞU İÇİN TABLODAN SONRA OKUNUR
+    for first_id, last_id, name in reversed(list_segments()):
+        if before_id is not None and first_id >= before_id:
+            continue
+
+        rows = [row for row in _read_segment(name)
+                if (before_id is None or row['id'] < before_id) and
+                _row_matches(row, article_id, reviewer_id, timestamp_from, timestamp_to)]
+        yield from reversed(rows)
+
+
+def segment_log_stats(article_id=None, reviewer_id=None, timestamp_from=None, timestamp_to=None):
+    # /log_stats İÇİN SEGMENTLERDEKİ KAYITLARIN (olay_tipi, aktör) VE (gün, olay_tipi) SAYILARI;
+    # event_type'I OLMAYAN ESKİ KAYITLAR TABLODAKİ GİBİ SAYILMAZ
+    counts = Counter()
+    timeline = Counter()
+    for first_id, last_id, name in list_segments():
+        for row in _read_segment(name):
+            if row['event_type'] and _row_matches(row, article_id, reviewer_id, timestamp_from, timestamp_to):
+                counts[(row['event_type'], row['actor'])] += 1
+                if row['timestamp']:
+                    timeline[(row['timestamp'].date().isoformat(), row['event_type'])] += 1
+
+    return counts, timeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eski logları sıkıştırılmış segmentlere taşır")
+    parser.add_argument("--older-than-days", type=int, default=LOG_HOT_DAYS)
+    parser.add_argument("--segment-rows", type=int, default=LOG_SEGMENT_ROWS)
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        compact_logs(datetime.utcnow() - timedelta(days=args.older_than_days), args.segment_rows)
+
+
+if __name__ == "__main__":
+    main()
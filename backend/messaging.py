@@ -0,0 +1,77 @@
+from sqlalchemy import func
+from models import db, Article, Message
+from crypto import decrypt_data, decrypt_many, email_blind_index
+
+AUTHOR = "author"
+REVIEWER = "reviewer"
+
+# MESAJI OKUYACAK TARAF: YAZARIN MESAJINI HAKEM, HAKEMİN MESAJINI YAZAR OKUR
+RECIPIENTS = {AUTHOR: REVIEWER, REVIEWER: AUTHOR}
+UNREAD_COLUMNS = {AUTHOR: Article.author_unread, REVIEWER: Article.reviewer_unread}
+
+
+def sender_role_for(article, sender_email):
+    if article.email_index:
+        is_author = email_blind_index(sender_email) == article.email_index
+    else:
+        is_author = sender_email == decrypt_data(article.email)
+
+    return AUTHOR if is_author else REVIEWER
+
+
+def record_message(article_id, sender_role):
+    # ALICININ SAYACI VERİTABANINDA ATOMİK OLARAK ARTIRILIR, ÇAĞIRAN TARAF COMMIT EDER
+    column = UNREAD_COLUMNS[RECIPIENTS[sender_role]]
+    Article.query.filter_by(id=article_id).update({column: column + 1}, synchronize_session=False)
+
+
+def mark_read(article_id, sender_role):
+    # sender_role TARAFININ OKUNMAMIŞ MESAJLARI TEK UPDATE İLE OKUNDU YAPILIR, ALICININ SAYACI SIFIRLANIR
+    updated = (Message.query.filter_by(article_id=article_id, sender_role=sender_role, is_read=False)
+               .update({Message.is_read: True}, synchronize_session=False))
+    Article.query.filter_by(id=article_id).update({UNREAD_COLUMNS[RECIPIENTS[sender_role]]: 0},
+                                                  synchronize_session=False)
+    return updated
+
+
+def recount_unread(article_id):
+    counts = dict(db.session.query(Message.sender_role, func.count(Message.id))
+                  .filter(Message.article_id == article_id, Message.is_read.is_(False))
+                  .group_by(Message.sender_role).all())
+    Article.query.filter_by(id=article_id).update({
+        Article.author_unread: counts.get(REVIEWER, 0),
+        Article.reviewer_unread: counts.get(AUTHOR, 0),
+    }, synchronize_session=False)
+
+
+def backfill_sender_roles(article):
+    # ROLÜ OLMAYAN ESKİ MESAJLARIN GÖNDERENİ BİR KEZ ÇÖZÜLÜR, ROL VE SAYAÇLAR KAYDEDİLİR
+    legacy_messages = Message.query.filter_by(article_id=article.id, sender_role=None).all()
+    if not legacy_messages:
+        return False
+
+    email = decrypt_data(article.email)
+    senders = decrypt_many([msg.sender_email for msg in legacy_messages])
+    for msg, sender in zip(legacy_messages, senders):
+        msg.sender_role = AUTHOR if sender == email else REVIEWER
+
+    db.session.flush()
+    recount_unread(article.id)
+    return True
+
+
+def backfill_articles(article_ids):
+    legacy_ids = [article_id for article_id, in db.session.query(Message.article_id)
+                  .filter(Message.article_id.in_(article_ids), Message.sender_role.is_(None)).distinct()]
+    for article in Article.query.filter(Article.id.in_(legacy_ids)).all():
+        backfill_sender_roles(article)
+
+    return len(legacy_ids)
+
+
+def unread_counts(article_ids):
+    # SADECE SAYAÇ SÜTUNLARI OKUNUR
+    rows = (db.session.query(Article.id, Article.author_unread, Article.reviewer_unread)
+            .filter(Article.id.in_(article_ids)).all())
+    return {article_id: {AUTHOR: author_unread, REVIEWER: reviewer_unread}
+            for article_id, author_unread, reviewer_unread in rows}
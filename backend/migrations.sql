@@ -0,0 +1,45 @@
+-- MEVCUT (ESKİ ŞEMAYLA OLUŞTURULMUŞ) MySQL VERİTABANINI GÜNCEL MODELLERE TAŞIR.
+-- YENİ TABLOLAR (pdf_version, job) ÖNCE init-db İLE OLUŞTURULUR, SONRA BU DOSYA ÇALIŞTIRILIR:
+--   flask --app app init-db
+--   flask --app app migrate-db
+-- ZATEN VAR OLAN SÜTUN VE İNDEKSLER migrate-db TARAFINDAN ATLANIR, DOSYA TEKRAR ÇALIŞTIRILABİLİR.
+
+-- article: BLIND INDEX, GÜNCEL PDF SÜRÜMÜ, OKUNMAMIŞ MESAJ SAYAÇLARI
+ALTER TABLE article ADD COLUMN email_index VARCHAR(64) NULL;
+ALTER TABLE article ADD COLUMN current_version_id INTEGER NULL;
+ALTER TABLE article ADD COLUMN author_unread INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE article ADD COLUMN reviewer_unread INTEGER NOT NULL DEFAULT 0;
+CREATE INDEX ix_article_email_index ON article (email_index);
+CREATE INDEX ix_article_created_at_id ON article (created_at, id);
+CREATE INDEX ix_article_status_created_at ON article (status, created_at);
+CREATE INDEX ix_article_editor_id_created_at ON article (editor_id, created_at);
+
+-- reviewer: İSİM BLIND INDEX'İ
+ALTER TABLE reviewer ADD COLUMN name_index VARCHAR(64) NULL;
+CREATE INDEX ix_reviewer_name_index ON reviewer (name_index);
+
+-- message: GÖNDEREN ROLÜ
+ALTER TABLE message ADD COLUMN sender_role VARCHAR(10) NULL;
+CREATE INDEX ix_message_article_id_sender_role_is_read ON message (article_id, sender_role, is_read);
+
+-- keyword
+CREATE INDEX ix_keyword_keyword_article_id ON keyword (keyword, article_id);
+
+-- log: YAPILANDIRILMIŞ OLAYLAR; ESKİ ŞİFRELİ CÜMLE SÜTUNU BOŞ BIRAKILABİLİR
+ALTER TABLE log MODIFY COLUMN event TEXT NULL;
+ALTER TABLE log ADD COLUMN event_type ENUM('article_uploaded', 'reviewer_added', 'reviewer_assigned',
+    'anonymity_updated', 'message_sent', 'review_submitted', 'article_revised') NULL;
+ALTER TABLE log ADD COLUMN actor ENUM('author', 'reviewer', 'editor', 'system') NULL;
+ALTER TABLE log ADD COLUMN payload TEXT NULL;
+CREATE INDEX ix_log_article_id_id ON log (article_id, id);
+CREATE INDEX ix_log_reviewer_id_id ON log (reviewer_id, id);
+CREATE INDEX ix_log_timestamp ON log (timestamp);
+CREATE INDEX ix_log_event_type_timestamp ON log (event_type, timestamp);
+
+-- blur_data: DİKDÖRTGEN SAYISAL SÜTUNLARDA; ESKİ METİN SÜTUNU BOŞ BIRAKILABİLİR
+ALTER TABLE blur_data MODIFY COLUMN rect TEXT NULL;
+ALTER TABLE blur_data ADD COLUMN x0 FLOAT NULL;
+ALTER TABLE blur_data ADD COLUMN y0 FLOAT NULL;
+ALTER TABLE blur_data ADD COLUMN x1 FLOAT NULL;
+ALTER TABLE blur_data ADD COLUMN y1 FLOAT NULL;
+CREATE INDEX ix_blur_data_article_id_page ON blur_data (article_id, page);
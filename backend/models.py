@@ -1,13 +1,46 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import OperationalError
 from datetime import datetime
+import json
+import re
 
 db = SQLAlchemy()
 
 def init_db(app):
     db.init_app(app)
+
+
+def create_schema(app):
     with app.app_context():
         db.create_all()
 
+
+# MySQL HATA KODLARI: 1060 SÜTUN ZATEN VAR, 1061 İNDEKS ZATEN VAR
+MIGRATION_SKIP_ERRORS = (1060, 1061)
+
+
+def run_migrations(app, path):
+    # migrations.sql'DEKİ KOMUTLAR SIRAYLA ÇALIŞTIRILIR; DAHA ÖNCE UYGULANMIŞ OLANLAR ATLANIR
+    with open(path, encoding='utf-8') as f:
+        sql = "".join(line for line in f if not line.lstrip().startswith("--"))
+    statements = [statement.strip() for statement in sql.split(";") if statement.strip()]
+
+    applied = 0
+    with app.app_context():
+        for statement in statements:
+            try:
+                db.session.execute(db.text(statement))
+                db.session.commit()
+                applied += 1
+            except OperationalError as e:
+                db.session.rollback()
+                code = e.orig.args[0] if e.orig.args else None
+                if code not in MIGRATION_SKIP_ERRORS:
+                    raise
+                print(f"Zaten uygulanmış, atlandı: {statement.splitlines()[0]}")
+
+    return applied
+
 class User(db.Model):
     __tablename__ = 'user'
     id = db.Column(db.Integer, primary_key=True)
@@ -16,8 +49,14 @@ class User(db.Model):
 
 class Article(db.Model):
     __tablename__ = 'article'
+    __table_args__ = (
+        db.Index('ix_article_created_at_id', 'created_at', 'id'),
+        db.Index('ix_article_status_created_at', 'status', 'created_at'),
+        db.Index('ix_article_editor_id_created_at', 'editor_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), nullable=False)
+    email_index = db.Column(db.String(64), nullable=True, index=True)
     pdf_path = db.Column(db.String(255), nullable=False)
     status = db.Column(db.Enum("Beklemede", "İncelemede", "Kabul Edildi", "Reddedildi"), default="Beklemede")
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -29,19 +68,32 @@ class Article(db.Model):
     is_authors_anonymous = db.Column(db.Boolean, default=False, nullable=False)
     institution = db.Column(db.String(255), nullable=False)
     is_institution_anonymous = db.Column(db.Boolean, default=False, nullable=False)
+    current_version_id = db.Column(db.Integer, nullable=True)
+    # TARAF BAŞINA OKUNMAMIŞ MESAJ SAYAÇLARI; ROZETLER İÇİN MESAJLAR YÜKLENMEZ
+    author_unread = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+    reviewer_unread = db.Column(db.Integer, default=0, server_default='0', nullable=False)
+
+    # editor_id ATANAN HAKEMİN reviewer.id DEĞERİNİ TUTAR
+    reviewer = db.relationship('Reviewer', primaryjoin='Article.editor_id == Reviewer.id',
+                               foreign_keys=[editor_id], viewonly=True)
+    keywords = db.relationship('Keyword', backref='article', lazy='select')
 
 class Message(db.Model):
     __tablename__ = 'message'
+    __table_args__ = (db.Index('ix_message_article_id_sender_role_is_read', 'article_id', 'sender_role', 'is_read'),)
     id = db.Column(db.Integer, primary_key=True)
     article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)
     reviewer_id = db.Column(db.Integer, db.ForeignKey('reviewer.id'), nullable=False)
     sender_email = db.Column(db.String(120), nullable=False)
+    # "author" VEYA "reviewer"; GÖNDERENİ KARŞILAŞTIRMAK İÇİN sender_email ÇÖZÜLMEZ
+    sender_role = db.Column(db.String(10), nullable=True)
     message = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     is_read = db.Column(db.Boolean, default=False, nullable=False)
 
 class Keyword(db.Model):
     __tablename__ = 'keyword'
+    __table_args__ = (db.Index('ix_keyword_keyword_article_id', 'keyword', 'article_id'),)
     id = db.Column(db.Integer, primary_key=True)
     article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)
     keyword = db.Column(db.String(50), nullable=False)
@@ -50,6 +102,7 @@ class Reviewer(db.Model):
     __tablename__ = 'reviewer'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
+    name_index = db.Column(db.String(64), nullable=True, index=True)
     interests = db.Column(db.String(255), nullable=False)
 
 class Review(db.Model):
@@ -60,19 +113,92 @@ class Review(db.Model):
     comments = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+LOG_EVENT_TYPES = ("article_uploaded", "reviewer_added", "reviewer_assigned", "anonymity_updated",
+                   "message_sent", "review_submitted", "article_revised")
+LOG_ACTORS = ("author", "reviewer", "editor", "system")
+
+
 class Log(db.Model):
     __tablename__ = 'log'
+    __table_args__ = (
+        db.Index('ix_log_article_id_id', 'article_id', 'id'),
+        db.Index('ix_log_reviewer_id_id', 'reviewer_id', 'id'),
+        db.Index('ix_log_timestamp', 'timestamp'),
+        db.Index('ix_log_event_type_timestamp', 'event_type', 'timestamp'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=True)
     reviewer_id = db.Column(db.Integer, db.ForeignKey('reviewer.id'), nullable=True)
-    event = db.Column(db.Text, nullable=False)
+    # ESKİ KAYITLARDA ŞİFRELİ CÜMLE; YENİ KAYITLARDA BOŞ, CÜMLE OKUMA SIRASINDA event_type'TAN ÜRETİLİR
+    event = db.Column(db.Text, nullable=True)
+    event_type = db.Column(db.Enum(*LOG_EVENT_TYPES, name="log_event_type"), nullable=True)
+    actor = db.Column(db.Enum(*LOG_ACTORS, name="log_actor"), nullable=True)
+    # SADECE HASSAS ALANLAR (BAŞLIK, İSİM VB.) ŞİFRELİ JSON OLARAK SAKLANIR
+    payload = db.Column(db.Text, nullable=True)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
 
 
 class BlurData(db.Model):
+    __table_args__ = (db.Index('ix_blur_data_article_id_page', 'article_id', 'page'),)
     id = db.Column(db.Integer, primary_key=True)
     article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)
     page = db.Column(db.Integer, nullable=False)
-    rect = db.Column(db.Text, nullable=False)
+    # ESKİ KAYITLARDA DİKDÖRTGEN "Rect(x0, y0, x1, y1)" METNİ OLARAK TUTULUYORDU
+    rect = db.Column(db.Text, nullable=True)
+    x0 = db.Column(db.Float, nullable=True)
+    y0 = db.Column(db.Float, nullable=True)
+    x1 = db.Column(db.Float, nullable=True)
+    y1 = db.Column(db.Float, nullable=True)
     original_text = db.Column(db.Text, nullable=False)
-    blurred_text = db.Column(db.Text, nullable=False)
\ No newline at end of file
+    blurred_text = db.Column(db.Text, nullable=False)
+
+    @property
+    def rect_tuple(self):
+        if self.x0 is not None:
+            return self.x0, self.y0, self.x1, self.y1
+
+        return tuple(float(value) for value in re.findall(r"-?\d+(?:\.\d+)?(?:e-?\d+)?", self.rect))
+
+
+class PdfVersion(db.Model):
+    __tablename__ = 'pdf_version'
+    __table_args__ = (db.Index('ix_pdf_version_article_id_id', 'article_id', 'id'),)
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)
+    parent_id = db.Column(db.Integer, db.ForeignKey('pdf_version.id'), nullable=True)
+    source_id = db.Column(db.Integer, nullable=True)
+    operation = db.Column(db.String(20), nullable=False)
+    # KAYNAK PDF'İN HANGİ ALANLARI ANONİMLEŞTİRİLMİŞ HALİ OLDUĞU (ÖRN. "is_mail_anonymous"),
+    # KAYNAKTAN TÜRETİLEMEYEN SÜRÜMLERDE (HAKEM YORUMU EKLENMİŞ VB.) None
+    anonymized_fields = db.Column(db.String(100), nullable=True)
+    sha256 = db.Column(db.String(64), nullable=False, index=True)
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class Job(db.Model):
+    __tablename__ = 'job'
+    __table_args__ = (db.Index('ix_job_status_run_after', 'status', 'run_after'),)
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    article_id = db.Column(db.Integer, db.ForeignKey('article.id'), nullable=False)
+    status = db.Column(db.Enum("queued", "running", "done", "dead", name="job_status"), default="queued",
+                       nullable=False)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    max_attempts = db.Column(db.Integer, default=3, nullable=False)
+    payload = db.Column(db.Text, nullable=True)
+    result = db.Column(db.Text, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    locked_by = db.Column(db.String(100), nullable=True)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    run_after = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def payload_data(self):
+        return json.loads(self.payload) if self.payload else {}
+
+    @property
+    def result_data(self):
+        return json.loads(self.result) if self.result else {}
@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import fitz
+import pytesseract
+from PIL import Image
+
+OCR_DPI = int(os.environ.get("OCR_DPI", 300))
+OCR_GRAYSCALE = os.environ.get("OCR_GRAYSCALE", "1") != "0"
+OCR_LANG = os.environ.get("OCR_LANG", "eng")
+# HAVUZ SÜREÇ BAŞINADIR: SUNUCU VE HER worker.py SÜRECİ KENDİ HAVUZUNU AÇAR, TOPLAM OCR SÜRECİ
+# OCR_WORKERS x SÜREÇ SAYISIDIR. worker.py BU DEĞERİ ÇEKİRDEKLERİ SÜREÇLERE BÖLEREK AYARLAR
+OCR_WORKERS = int(os.environ.get("OCR_WORKERS", 2))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _init_worker():
+    # HER WORKER TEK TESSERACT SÜRECİ ÇALIŞTIRIR; TESSERACT'IN KENDİ THREAD'LERİ KAPATILIR,
+    # YOKSA N WORKER x N THREAD ÇEKİRDEKLERİ BOĞAR
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=OCR_WORKERS, initializer=_init_worker,
+                                            mp_context=multiprocessing.get_context("spawn"))
+
+        return _executor
+
+
+def render_page(page, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    # SAYFA DOĞRUDAN İSTENEN ÇÖZÜNÜRLÜK VE RENK UZAYINDA ÇİZİLİR; GÖRÜNTÜ pixmap BELLEĞİNİ
+    # KOPYALAMADAN KULLANIR, BU YÜZDEN pix GÖRÜNTÜYLE BİRLİKTE TUTULMALIDIR
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    mode = "L" if grayscale else "RGB"
+    img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1)
+
+    return img, pix
+
+
+def ocr_page(page, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    # TEK TESSERACT ÇAĞRISIYLA HEM METİN HEM KELİME KUTULARI ALINIR
+    img, pix = render_page(page, dpi, grayscale)
+    data = pytesseract.image_to_data(img, lang=OCR_LANG, output_type=pytesseract.Output.DICT)
+
+    # PİKSEL KOORDİNATLARI SAYFA KOORDİNATLARINA ÇEVRİLİR
+    scale_x = page.rect.width / pix.width
+    scale_y = page.rect.height / pix.height
+
+    words = []
+    lines = {}
+    for i, word in enumerate(data["text"]):
+        if not word.strip():
+            continue
+
+        line = (data["block_num"][i], data["par_num"][i] * 1000 + data["line_num"][i])
+        x0 = data["left"][i] * scale_x
+        y0 = data["top"][i] * scale_y
+        x1 = (data["left"][i] + data["width"][i]) * scale_x
+        y1 = (data["top"][i] + data["height"][i]) * scale_y
+        words.append((x0, y0, x1, y1, word, line[0], line[1], data["word_num"][i]))
+        lines.setdefault(line, []).append(word)
+
+    text = "\n".join(" ".join(line_words) for line_words in lines.values())
+    return text, words
+
+
+def _ocr_document_page(pdf_path, page_num, dpi, grayscale):
+    doc = fitz.open(pdf_path)
+    try:
+        print(f"Sayfa {page_num + 1} için OCR çalıştırılıyor...")
+        return ocr_page(doc[page_num], dpi, grayscale)
+    except Exception as e:
+        print(f"OCR sırasında hata oluştu (sayfa {page_num + 1}): {e}")
+        return None
+    finally:
+        doc.close()
+
+
+def ocr_pages(pdf_path, page_nums, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE):
+    # SAYFALAR SINIRLI SAYIDA WORKER'A TEK TEK DAĞITILIR, SONUÇLAR page_nums SIRASIYLA DÖNER.
+    # HATALI SAYFA İÇİN None DÖNER
+    if not page_nums:
+        return []
+
+    if OCR_WORKERS <= 1 or len(page_nums) == 1:
+        return [_ocr_document_page(pdf_path, page_num, dpi, grayscale) for page_num in page_nums]
+
+    executor = _get_executor()
+    futures = [executor.submit(_ocr_document_page, pdf_path, page_num, dpi, grayscale) for page_num in page_nums]
+
+    return [future.result() for future in futures]
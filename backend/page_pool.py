@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import fitz
+
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", 1))
+MIN_PAGES_PER_WORKER = 4
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def page_ranges(page_count, workers, min_pages=MIN_PAGES_PER_WORKER):
+    # SAYFALAR ARDIŞIK ARALIKLARA BÖLÜNÜR, KÜÇÜK BELGELER İÇİN GEREKSİZ WORKER AÇILMAZ
+    workers = max(1, min(workers, page_count // min_pages or 1))
+    size, extra = divmod(page_count, workers)
+
+    ranges = []
+    start = 0
+    for i in range(workers):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def _get_executor(workers):
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers < workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            # FLASK İSTEK THREAD'LERİNDEN FORK GÜVENLİ OLMADIĞI İÇİN spawn KULLANILIR
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _executor_workers = workers
+
+        return _executor
+
+
+def _map_range(pdf_path, start, end, page_func, args):
+    # HER WORKER KENDİ fitz BELGE NESNESİNİ AÇAR
+    doc = fitz.open(pdf_path)
+    try:
+        return [page_func(doc[page_num], *args) for page_num in range(start, end)]
+    finally:
+        doc.close()
+
+
+def map_pages(pdf_path, page_func, *args, workers=None):
+    # page_func(page, *args) HER SAYFA İÇİN ÇALIŞTIRILIR, SONUÇLAR SAYFA SIRASIYLA DÖNER.
+    # page_func VE args PICKLE EDİLEBİLİR OLMALIDIR (MODÜL SEVİYESİNDE FONKSİYON)
+    workers = workers or PDF_WORKERS
+
+    doc = fitz.open(pdf_path)
+    page_count = len(doc)
+    doc.close()
+
+    ranges = page_ranges(page_count, workers)
+    if len(ranges) <= 1:
+        return _map_range(pdf_path, 0, page_count, page_func, args)
+
+    executor = _get_executor(len(ranges))
+    futures = [executor.submit(_map_range, pdf_path, start, end, page_func, args) for start, end in ranges]
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+
+    return results
@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def page_size_from(args):
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise ValueError("limit bir sayı olmalıdır")
+
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(*values):
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except Exception:
+        raise ValueError("Geçersiz cursor")
+
+
+def parse_datetime(value):
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Geçersiz tarih: {value}")
+
+
+def paginate(query, limit, cursor_values):
+    # limit + 1 SATIR ÇEKİLİR, FAZLADAN SATIR VARSA SONRAKİ SAYFANIN CURSOR'I ÜRETİLİR
+    rows = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(*cursor_values(rows[limit - 1])) if len(rows) > limit else None
+
+    return rows[:limit], next_cursor
@@ -0,0 +1,41 @@
+import hashlib
+import os
+from flask import send_file
+from record_cache import LRUCache
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# İÇERİK ÖZETLERİ (YOL, DEĞİŞTİRİLME ZAMANI, BOYUT) ANAHTARIYLA SAKLANIR,
+# DOSYA DEĞİŞMEDİKÇE TEKRAR OKUNMAZ
+_content_hashes = LRUCache(maxsize=4096, ttl=24 * 60 * 60)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def content_hash(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    digest = _content_hashes.get(key)
+    if digest is None:
+        digest = file_sha256(path)
+        _content_hashes.set(key, digest)
+
+    return digest
+
+
+def send_pdf(path):
+    # DOSYA PARÇA PARÇA AKITILIR; conditional=True Range (206) VE If-None-Match (304) İSTEKLERİNİ KARŞILAR
+    response = send_file(path, mimetype='application/pdf', as_attachment=False, conditional=True,
+                         etag=content_hash(path))
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+
+    return response
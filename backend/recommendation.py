@@ -0,0 +1,138 @@
+import threading
+import numpy as np
+from sqlalchemy import func
+from models import db, Article, Keyword, Reviewer
+from crypto import decrypt_many
+from keyword_matcher import get_keyword_matcher, normalize_term
+
+LOAD_PENALTY = 0.25
+
+
+class RecommendationIndex:
+    # HAKEM x KATEGORİ VE MAKALE x KATEGORİ MATRİSLERİ BELLEKTE TUTULUR; YALNIZ SON YENİLEMEDEN
+    # SONRA EKLENEN HAKEM VE ANAHTAR KELİME SATIRLARI OKUNUR. SİLME OLURSA BAŞTAN KURULUR
+    def __init__(self, categories):
+        self.categories = list(categories.keys())
+        self.category_positions = {category: i for i, category in enumerate(self.categories)}
+        self.normalized_categories = {normalize_term(category): category for category in self.categories}
+        self.matcher = get_keyword_matcher(categories)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.reviewer_ids = []
+        self.reviewer_matrix = np.zeros((0, len(self.categories)), dtype=np.float32)
+        self.article_vectors = {}
+        self.last_reviewer_id = 0
+        self.last_keyword_id = 0
+        self.keyword_count = 0
+
+    def interest_vector(self, interests):
+        vector = np.zeros(len(self.categories), dtype=np.float32)
+
+        # HAKEM İLGİ ALANI SERBEST METİN: KATEGORİ ADI VEYA KATEGORİ TERİMLERİ GEÇİYORSA SAYILIR
+        for part in (interests or "").split(","):
+            category = self.normalized_categories.get(normalize_term(part))
+            if category:
+                vector[self.category_positions[category]] = 1.0
+        for category in self.matcher.match([(0, interests or "")]):
+            vector[self.category_positions[category]] = 1.0
+
+        return vector
+
+    def refresh(self):
+        with self.lock:
+            # DAHA ÖNCE OKUNAN ARALIKTA SATIR SAYISI DEĞİŞTİYSE (SİLME) ARTIMLI GÜNCELLEME YETMEZ
+            known_reviewers = (db.session.query(func.count(Reviewer.id))
+                               .filter(Reviewer.id <= self.last_reviewer_id).scalar())
+            known_keywords = (db.session.query(func.count(Keyword.id))
+                              .filter(Keyword.id <= self.last_keyword_id).scalar())
+            if known_reviewers != len(self.reviewer_ids) or known_keywords != self.keyword_count:
+                print("Öneri matrisleri yeniden oluşturuluyor...")
+                self.reset()
+
+            new_reviewers = Reviewer.query.filter(Reviewer.id > self.last_reviewer_id).order_by(Reviewer.id).all()
+            if new_reviewers:
+                interests = decrypt_many([reviewer.interests for reviewer in new_reviewers])
+                rows = np.array([self.interest_vector(text) for text in interests], dtype=np.float32)
+                self.reviewer_matrix = np.vstack([self.reviewer_matrix, rows])
+                self.reviewer_ids.extend(reviewer.id for reviewer in new_reviewers)
+                self.last_reviewer_id = new_reviewers[-1].id
+
+            new_keywords = (db.session.query(Keyword.id, Keyword.article_id, Keyword.keyword)
+                            .filter(Keyword.id > self.last_keyword_id).order_by(Keyword.id).all())
+            for keyword_id, article_id, keyword in new_keywords:
+                vector = self.article_vectors.setdefault(article_id, np.zeros(len(self.categories),
+                                                                              dtype=np.float32))
+                if keyword in self.category_positions:
+                    vector[self.category_positions[keyword]] = 1.0
+                self.last_keyword_id = keyword_id
+            self.keyword_count += len(new_keywords)
+
+            return self.reviewer_ids, self.reviewer_matrix
+
+    def article_matrix(self, article_ids):
+        empty = np.zeros(len(self.categories), dtype=np.float32)
+        return np.array([self.article_vectors.get(article_id, empty) for article_id in article_ids],
+                        dtype=np.float32).reshape(len(article_ids), len(self.categories))
+
+
+def _normalized(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def score_matrix(article_matrix, reviewer_matrix):
+    # TÜM MAKALE-HAKEM ÇİFTLERİ TEK MATRİS ÇARPIMIYLA KOSİNÜS BENZERLİĞİ OLARAK PUANLANIR
+    return _normalized(article_matrix) @ _normalized(reviewer_matrix).T
+
+
+def top_k(scores, k):
+    k = min(k, scores.shape[1])
+    if k == 0:
+        return np.zeros((scores.shape[0], 0), dtype=np.intp)
+
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def balanced_assignment(scores, loads, load_penalty=LOAD_PENALTY):
+    # EN GÜÇLÜ EŞLEŞMEYE SAHİP MAKALEDEN BAŞLANIR; HER ATAMA HAKEMİN YÜKÜNÜ ARTIRIR VE
+    # PUANDAN YÜK x load_penalty DÜŞÜLÜR. UYGUN HAKEMİ OLMAYAN MAKALE İÇİN -1 DÖNER
+    loads = np.asarray(loads, dtype=np.float32).copy()
+    assignment = np.full(scores.shape[0], -1, dtype=np.intp)
+    if scores.shape[1] == 0:
+        return assignment
+
+    for i in np.argsort(-scores.max(axis=1), kind="stable"):
+        adjusted = np.where(scores[i] > 0, scores[i] - load_penalty * loads, -np.inf)
+        j = int(np.argmax(adjusted))
+        if np.isfinite(adjusted[j]):
+            assignment[i] = j
+            loads[j] += 1
+
+    return assignment
+
+
+def reviewer_loads(reviewer_ids):
+    # HAKEMİN ÜZERİNDEKİ AÇIK (HENÜZ SONUÇLANMAMIŞ) MAKALE SAYISI
+    counts = dict(db.session.query(Article.editor_id, func.count(Article.id))
+                  .filter(Article.editor_id.isnot(None), Article.status == 'İncelemede')
+                  .group_by(Article.editor_id).all())
+    return np.array([counts.get(reviewer_id, 0) for reviewer_id in reviewer_ids], dtype=np.float32)
+
+
+_recommendation_index = None
+_recommendation_index_lock = threading.Lock()
+
+
+def get_recommendation_index(categories):
+    global _recommendation_index
+
+    if _recommendation_index is None:
+        with _recommendation_index_lock:
+            if _recommendation_index is None:
+                _recommendation_index = RecommendationIndex(categories)
+
+    return _recommendation_index
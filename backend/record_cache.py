@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from crypto import decrypt_many
+
+RECORD_CACHE_SIZE = 1024
+RECORD_CACHE_TTL = 300  # SANİYE
+
+
+class LRUCache:
+    def __init__(self, maxsize=RECORD_CACHE_SIZE, ttl=RECORD_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+ARTICLE_FIELDS = ('title', 'authors', 'email', 'institution')
+REVIEWER_FIELDS = ('name', 'interests')
+
+article_cache = LRUCache()
+reviewer_cache = LRUCache()
+
+
+def _decrypted_records(cache, rows, fields):
+    records = [cache.get(row.id) for row in rows]
+    missing = [i for i, record in enumerate(records) if record is None]
+
+    # ÖNBELLEKTE OLMAYAN SATIRLARIN ALANLARI SÜTUN SÜTUN TOPLU OLARAK DEŞİFRE EDİLİR
+    columns = {field: decrypt_many([getattr(rows[i], field) for i in missing]) for field in fields}
+    for position, i in enumerate(missing):
+        records[i] = {field: columns[field][position] for field in fields}
+        cache.set(rows[i].id, records[i])
+
+    return records
+
+
+def decrypted_articles(articles):
+    return _decrypted_records(article_cache, articles, ARTICLE_FIELDS)
+
+
+def decrypted_article(article):
+    return decrypted_articles([article])[0]
+
+
+def decrypted_reviewers(reviewers):
+    return _decrypted_records(reviewer_cache, reviewers, REVIEWER_FIELDS)
+
+
+def decrypted_reviewer(reviewer):
+    return decrypted_reviewers([reviewer])[0]
+
+
+def invalidate_article(article_id):
+    article_cache.invalidate(article_id)
+
+
+def invalidate_reviewer(reviewer_id):
+    reviewer_cache.invalidate(reviewer_id)
+
+
+def cache_stats():
+    return {
+        'articles': article_cache.stats(),
+        'reviewers': reviewer_cache.stats(),
+    }
@@ -0,0 +1,146 @@
+import re
+from bisect import bisect_right
+import fitz
+
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+INSTITUTION_PATTERN = (
+    r'(?:[A-Z][a-z]+(?:\s[A-Z][a-z]+)*\s(?:University of|Institute|College|Academy|Center|School|Laboratory|'
+    r'Foundation|Organization|Corporation|Society|Group|Association|Lab|Dept|Division|Campus|Faculty|Henley))'
+)
+
+
+def page_words(page):
+    # get_text("words") İLE AYNI (x0, y0, x1, y1, kelime, blok, satır, kelime_no) BİÇİMİ; EK OLARAK SON ELEMAN
+    # KELİMEDEKİ HER KARAKTERİN [x0, x1] KUTUSUDUR. KISMİ EŞLEŞMELER BU KUTULARLA KESİN OLARAK KIRPILIR
+    words = []
+    for block_num, block in enumerate(page.get_text("rawdict")["blocks"]):
+        for line_num, line in enumerate(block.get("lines", [])):
+            chars = [char for span in line["spans"] for char in span["chars"]]
+            current = []
+            for char in chars + [None]:
+                if char is not None and not char["c"].isspace():
+                    current.append(char)
+                    continue
+                if current:
+                    x0 = min(c["bbox"][0] for c in current)
+                    y0 = min(c["bbox"][1] for c in current)
+                    x1 = max(c["bbox"][2] for c in current)
+                    y1 = max(c["bbox"][3] for c in current)
+                    text = "".join(c["c"] for c in current)
+                    char_boxes = [[c["bbox"][0], c["bbox"][2]] for c in current]
+                    words.append((x0, y0, x1, y1, text, block_num, line_num, len(words), char_boxes))
+                    current = []
+
+    return words
+
+
+class RedactionEngine:
+    # HER ALAN (E-POSTA, HER YAZAR, KURUM) AYRI DESENLE ARANIR, BÖYLECE BİR ALANIN EŞLEŞMESİ DİĞERİNİ
+    # GİZLEMEZ (ÖRN. "Ada Lovelace Institute" İÇİNDEKİ YAZAR ADI). SAYFA KELİMELERİ BİR KEZ ÇIKARILIR
+    def __init__(self, email=False, authors=None, institution=False):
+        self.patterns = []
+        if email:
+            self.patterns.append(("email", re.compile(EMAIL_PATTERN, re.IGNORECASE)))
+        for i, author in enumerate(a.strip() for a in (authors or [])):
+            if author:
+                self.patterns.append((f"author{i}", re.compile(rf"\b{re.escape(author)}\b", re.IGNORECASE)))
+        if institution:
+            self.patterns.append(("institution", re.compile(INSTITUTION_PATTERN, re.IGNORECASE)))
+
+    @staticmethod
+    def words_text(words):
+        spans = []
+        position = 0
+
+        for word in words:
+            spans.append((position, position + len(word[4])))
+            position += len(word[4]) + 1
+
+        return " ".join(word[4] for word in words), spans
+
+    @staticmethod
+    def match_rects(words, spans, starts, start, end):
+        # EŞLEŞMENİN KAPSADIĞI KELİME KUTULARI SATIR BAZINDA BİRLEŞTİRİLİR,
+        # KELİMENİN BİR KISMI EŞLEŞTİYSE KUTU KARAKTER KUTULARINA GÖRE KIRPILIR
+        line_rects = {}
+        i = max(bisect_right(starts, start) - 1, 0)
+
+        while i < len(words) and spans[i][0] < end:
+            word_start, word_end = spans[i]
+            a, b = max(start, word_start), min(end, word_end)
+
+            if a < b:
+                x0, y0, x1, y1 = words[i][:4]
+                if len(words[i]) > 8 and len(words[i][8]) == word_end - word_start:
+                    char_boxes = words[i][8]
+                    rect = fitz.Rect(char_boxes[a - word_start][0], y0, char_boxes[b - word_start - 1][1], y1)
+                else:
+                    # KARAKTER KUTUSU YOKSA (OCR KELİMELERİ) KUTU KARAKTER ORANINA GÖRE KIRPILIR
+                    char_width = (x1 - x0) / (word_end - word_start)
+                    rect = fitz.Rect(x0 + (a - word_start) * char_width, y0, x0 + (b - word_start) * char_width, y1)
+                line = (words[i][5], words[i][6])
+                line_rects[line] = line_rects[line] | rect if line in line_rects else rect
+
+            i += 1
+
+        return list(line_rects.values())
+
+    def find_in_words(self, words):
+        # words: page_words VEYA get_text("words") BİÇİMİNDE LİSTE.
+        # SONUÇ PICKLE EDİLEBİLİR OLSUN DİYE DİKDÖRTGENLER TUPLE OLARAK DÖNER
+        if not self.patterns:
+            return []
+
+        text, spans = self.words_text(words)
+        starts = [span[0] for span in spans]
+        matches = []
+
+        # ÇAKIŞAN EŞLEŞMELER FARKLI ALANLARDAN GELEBİLİR, HEPSİ AYRI AYRI GİZLENİR
+        for kind, pattern in self.patterns:
+            for match in pattern.finditer(text):
+                rects = self.match_rects(words, spans, starts, match.start(), match.end())
+                if not rects:
+                    print(f"Eşleşme konumu bulunamadı: {match.group(0)}")
+                    continue
+                matches.append((kind, match.group(0), [tuple(rect) for rect in rects]))
+
+        return matches
+
+    def find(self, page):
+        return self.find_in_words(page_words(page))
+
+    def redact_page(self, page, page_num, matches=None):
+        blur_data = []
+        if matches is None:
+            matches = self.find(page)
+
+        for kind, found_text, rects in matches:
+            blurred_text = "*" * len(found_text)
+            for rect in map(fitz.Rect, rects):
+                print(f"Redaksiyon uygulanıyor ({kind}): {rect}")
+                page.add_redact_annot(rect, text=blurred_text, fill=(1, 1, 1))
+                blur_data.append({
+                    "page": page_num,
+                    "rect": tuple(rect),
+                    "original_text": found_text,
+                    "blurred_text": blurred_text
+                })
+
+        if blur_data:
+            page.apply_redactions()
+
+        return blur_data
+
+    def redact_document(self, doc, matches_by_page=None):
+        # matches_by_page VERİLİRSE (app.stored_matches: text_store'DAKİ SAYFA KELİMELERİ ÜZERİNDE find_in_words
+        # İLE BULUNMUŞ) SADECE UYGULAMA YAPILIR; VERİLMEZSE HER SAYFA find İLE BURADA TARANIR
+        blur_data = []
+        for page_num in range(len(doc)):
+            matches = matches_by_page[page_num] if matches_by_page is not None else None
+            blur_data.extend(self.redact_page(doc[page_num], page_num, matches))
+
+        return blur_data
+
+
+def find_page_matches(page, engine):
+    return engine.find(page)
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from crypto import encrypt_data, decrypt_data
+
+RENDITION_FOLDER = 'uploads/renditions'
+RENDITION_CACHE_BYTES = int(os.environ.get("RENDITION_CACHE_BYTES", 512 * 1024 * 1024))
+
+
+def fields_key(fields):
+    return ",".join(sorted(fields))
+
+
+def rendition_key(source_sha256, fields, targets_digest):
+    # AYNI KAYNAK PDF VE AYNI ANONİMLEŞTİRİLEN ALANLAR AYNI ANAHTARI ÜRETİR; targets_digest
+    # GİZLENEN DEĞERLERİN (YAZAR, E-POSTA, KURUM) ÖZETİDİR, FARKLI META VERİLİ AYNI PDF KARIŞMAZ
+    return hashlib.sha256(f"{source_sha256}|{fields_key(fields)}|{targets_digest}".encode()).hexdigest()
+
+
+def _paths(key):
+    folder = os.path.join(RENDITION_FOLDER, key[:2])
+    return os.path.join(folder, f"{key}.pdf"), os.path.join(folder, f"{key}.json")
+
+
+def get_rendition(key):
+    pdf_path, meta_path = _paths(key)
+
+    try:
+        with open(meta_path) as f:
+            blur_data = json.loads(decrypt_data(f.read()))
+        # LRU: KULLANILAN KAYDIN ZAMANI GÜNCELLENİR, EN ESKİ KULLANILAN ÖNCE SİLİNİR
+        os.utime(pdf_path)
+    except (OSError, ValueError):
+        return None
+
+    return pdf_path, blur_data
+
+
+def put_rendition(key, src_path, blur_data):
+    pdf_path, meta_path = _paths(key)
+    os.makedirs(os.path.dirname(pdf_path), exist_ok=True)
+
+    # YARIM YAZILMIŞ DOSYA OKUNMASIN DİYE ÖNCE GEÇİCİ DOSYAYA YAZILIR
+    tmp_suffix = f".{uuid.uuid4().hex}.tmp"
+    shutil.copyfile(src_path, pdf_path + tmp_suffix)
+    os.replace(pdf_path + tmp_suffix, pdf_path)
+    with open(meta_path + tmp_suffix, 'w') as f:
+        f.write(encrypt_data(json.dumps(blur_data)))
+    os.replace(meta_path + tmp_suffix, meta_path)
+
+    evict_renditions()
+    return pdf_path
+
+
+def evict_renditions(max_bytes=RENDITION_CACHE_BYTES):
+    entries = []
+    for root, _, files in os.walk(RENDITION_FOLDER):
+        for name in files:
+            if name.endswith(".pdf"):
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        for stale_path in (path, path[:-len(".pdf")] + ".json"):
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
+        total -= size
+        evicted += 1
+
+    return evicted
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import pytest
+
+# UYGULAMA İÇE AKTARILMADAN ÖNCE GEÇİCİ BİR SQLite VERİTABANI AYARLANIR
+TEST_DB_FOLDER = tempfile.mkdtemp(prefix="yazlab-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DB_FOLDER, 'test.db')}"
+os.environ.pop("APP_CONFIG_FILE", None)
+
+
+@pytest.fixture
+def app():
+    pytest.importorskip("flask_sqlalchemy")
+    pytest.importorskip("spacy")
+    pytest.importorskip("en_core_web_sm")
+    from app import app as flask_app
+    from models import db
+
+    flask_app.config.update(TESTING=True)
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def db_app():
+    # SADECE MODELLERİ KULLANAN TESTLER İÇİN; app MODÜLÜ (VE spaCy MODELİ) YÜKLENMEZ
+    flask = pytest.importorskip("flask")
+    pytest.importorskip("flask_sqlalchemy")
+    from config import configure_database
+    from models import db, init_db
+
+    flask_app = flask.Flask(__name__)
+    flask_app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    configure_database(flask_app)
+    init_db(flask_app)
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def query_counter(app):
+    # before_cursor_execute İLE VERİTABANINA GİDEN HER SORGU KAYDEDİLİR
+    from sqlalchemy import event
+    from models import db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", record)
@@ -0,0 +1,107 @@
+import os
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+pytest.importorskip("fitz")
+pytest.importorskip("pytesseract")
+
+import artifacts  # noqa: E402
+import text_store  # noqa: E402
+from artifacts import add_version, artifact_path, collect_garbage  # noqa: E402
+
+
+@pytest.fixture
+def stores(db_app, tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_FOLDER", str(tmp_path / "artifacts"))
+    monkeypatch.setattr(artifacts, "WORKING_FOLDER", str(tmp_path / "artifacts" / "tmp"))
+    monkeypatch.setattr(text_store, "TEXT_STORE_FOLDER", str(tmp_path / "text"))
+    return tmp_path
+
+
+def new_file(content):
+    path = artifacts.new_working_path()
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+def store_text(digest):
+    path = text_store._store_path(digest)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"")
+    return path
+
+
+def test_collect_garbage_removes_stale_files_and_their_text(stores):
+    from models import db, Article
+
+    article = Article(email="e", title="t", authors="a", institution="i", pdf_path="")
+    db.session.add(article)
+    db.session.flush()
+
+    versions = [add_version(article, new_file(b"orijinal"), "upload", anonymized_fields="")]
+    for content in (b"blur-1", b"blur-2", b"blur-3"):
+        versions.append(add_version(article, new_file(content), "blur", anonymized_fields="is_mail_anonymous"))
+    db.session.commit()
+    digests = [version.sha256 for version in versions]
+    text_paths = [store_text(digest) for digest in digests]
+
+    # GÜNCEL, BİR ÖNCEKİ VE ORİJİNAL SÜRÜM KALIR; İLK BLUR SÜRÜMÜ SİLİNİR
+    assert collect_garbage(article) == 1
+
+    assert not os.path.exists(artifact_path(digests[1]))
+    assert not os.path.exists(text_paths[1])
+    for i in (0, 2, 3):
+        assert os.path.exists(artifact_path(digests[i]))
+        assert os.path.exists(text_paths[i])
+
+
+def test_discard_document_removes_every_format_version(stores):
+    digest = "ab" * 32
+    current = store_text(digest)
+    legacy = os.path.join(os.path.dirname(current), f"{digest}.json.gz")
+    other = os.path.join(os.path.dirname(current), f"{'ab' + 'cd' * 31}.json.gz")
+    for path in (legacy, other):
+        open(path, 'wb').close()
+
+    assert text_store.discard_document(digest) == 2
+    assert os.listdir(os.path.dirname(current)) == [os.path.basename(other)]
+
+
+def test_evict_renditions_trims_oldest_accessed_first(tmp_path, monkeypatch):
+    import renditions
+    from renditions import evict_renditions, get_rendition, put_rendition
+
+    monkeypatch.setattr(renditions, "RENDITION_FOLDER", str(tmp_path / "renditions"))
+    source = tmp_path / "source.pdf"
+    source.write_bytes(b"%PDF-" + b"0" * 95)
+
+    keys = [f"{i:02d}" + "0" * 62 for i in range(4)]
+    for age, key in zip((400, 300, 200, 100), keys):
+        pdf_path = put_rendition(key, str(source), [{"page": 0}])
+        os.utime(pdf_path, (0, 1_000_000 - age))
+
+    # EN ESKİ İKİNCİ KAYIT YENİDEN KULLANILIR, EN YENİ KAYIT OLUR
+    assert get_rendition(keys[1])[1] == [{"page": 0}]
+
+    assert evict_renditions(max_bytes=250) == 2
+
+    assert get_rendition(keys[0]) is None
+    assert get_rendition(keys[2]) is None
+    assert get_rendition(keys[1]) is not None
+    assert get_rendition(keys[3]) is not None
+    remaining = [name for _, _, files in os.walk(tmp_path / "renditions") for name in files]
+    assert sorted(remaining) == sorted(f"{key}.{ext}" for key in (keys[1], keys[3]) for ext in ("pdf", "json"))
+
+
+def test_evict_renditions_within_budget_keeps_everything(tmp_path, monkeypatch):
+    import renditions
+    from renditions import evict_renditions, put_rendition
+
+    monkeypatch.setattr(renditions, "RENDITION_FOLDER", str(tmp_path / "renditions"))
+    source = tmp_path / "source.pdf"
+    source.write_bytes(b"%PDF-" + b"0" * 95)
+    put_rendition("ab" * 32, str(source), [])
+
+    assert evict_renditions(max_bytes=100) == 0
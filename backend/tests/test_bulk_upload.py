@@ -0,0 +1,54 @@
+import io
+import json
+import os
+import pytest
+
+
+@pytest.fixture
+def folders(app, tmp_path, monkeypatch):
+    import artifacts
+
+    monkeypatch.setattr(artifacts, "ARTIFACT_FOLDER", str(tmp_path / "artifacts"))
+    monkeypatch.setattr(artifacts, "WORKING_FOLDER", str(tmp_path / "artifacts" / "tmp"))
+    return tmp_path
+
+
+def post(client, items, files):
+    data = {"metadata": json.dumps(items),
+            "files": [(io.BytesIO(content), name) for name, content in files.items()]}
+    return client.post('/bulk_upload', data=data, content_type='multipart/form-data')
+
+
+ITEM = {"file": "a.pdf", "email": "yazar@example.com", "title": "Başlık", "institution": "Kurum"}
+
+
+def test_non_string_fields_are_reported_per_item(client, folders):
+    response = post(client, [dict(ITEM, title=["liste"])], {"a.pdf": b"%PDF-a"})
+
+    assert response.status_code == 400
+    (result,) = response.get_json()["results"]
+    assert result["status"] == "error"
+    assert "title" in result["message"]
+    assert os.listdir(folders / "artifacts" / "tmp") == []
+
+
+def test_unreferenced_files_are_not_staged(client, folders):
+    from models import Article
+
+    response = post(client, [ITEM], {"a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b"})
+
+    assert response.status_code == 201
+    assert Article.query.count() == 1
+    assert os.listdir(folders / "artifacts" / "tmp") == []
+
+
+def test_created_articles_are_published(client, folders):
+    from events import get_broker
+
+    after_id = get_broker().last_id
+    response = post(client, [ITEM, dict(ITEM, file="b.pdf")], {"a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b"})
+
+    codes = {result["tracking_code"] for result in response.get_json()["results"]}
+    events, _ = get_broker().wait(["admin"], after_id, 0)
+    assert {event["type"] for event in events} == {"article_created"}
+    assert {str(event["data"]["article_id"]) for event in events} == codes
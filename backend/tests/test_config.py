@@ -0,0 +1,67 @@
+import json
+import pytest
+
+from config import DB_SETTINGS, DEFAULT_DATABASE_URL, engine_options, load_db_config
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    monkeypatch.delenv("APP_CONFIG_FILE", raising=False)
+    for env_name, _, _ in DB_SETTINGS.values():
+        monkeypatch.delenv(env_name, raising=False)
+    return monkeypatch
+
+
+def test_defaults(clean_env):
+    config = load_db_config()
+
+    assert config["database_url"] == DEFAULT_DATABASE_URL
+    assert config["pool_size"] == 5
+    assert config["pool_pre_ping"] is True
+
+
+def test_environment_overrides_config_file(clean_env, tmp_path):
+    path = tmp_path / "db.json"
+    path.write_text(json.dumps({"database_url": "mysql+pymysql://app@db/yazlab2_1", "pool_size": 10}))
+    clean_env.setenv("DB_POOL_SIZE", "20")
+    clean_env.setenv("DB_POOL_PRE_PING", "off")
+
+    config = load_db_config(str(path))
+
+    assert config["database_url"] == "mysql+pymysql://app@db/yazlab2_1"
+    assert config["pool_size"] == 20
+    assert config["pool_pre_ping"] is False
+
+
+def test_mysql_engine_options(clean_env):
+    clean_env.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+    options = engine_options(load_db_config())
+
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 10
+    assert options["pool_recycle"] == 1800
+    assert options["connect_args"] == {"init_command": "SET SESSION max_execution_time=5000"}
+
+
+def test_postgresql_statement_timeout(clean_env):
+    clean_env.setenv("DATABASE_URL", "postgresql://app@db/yazlab2_1")
+    clean_env.setenv("DB_STATEMENT_TIMEOUT_MS", "5000")
+
+    options = engine_options(load_db_config())
+
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+
+def test_sqlite_skips_pool_sizing(clean_env):
+    clean_env.setenv("DATABASE_URL", "sqlite:///bench.db")
+
+    options = engine_options(load_db_config())
+
+    assert "pool_size" not in options
+    assert "max_overflow" not in options
+    assert options["connect_args"]["check_same_thread"] is False
+
+
+def test_no_statement_timeout_by_default(clean_env):
+    assert "connect_args" not in engine_options(load_db_config())
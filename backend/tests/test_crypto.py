@@ -0,0 +1,34 @@
+import base64
+import pytest
+
+pytest.importorskip("cryptography")
+
+from crypto import blind_index, decrypt_data, decrypt_many, email_blind_index, encrypt_data, encrypt_many  # noqa: E402
+
+
+@pytest.mark.parametrize("value", ["", "a", "x" * 15, "x" * 16, "Kocaeli Üniversitesi"])
+def test_round_trip(value):
+    encrypted = encrypt_data(value)
+
+    assert len(base64.b64decode(encrypted)) % 16 == 0
+    assert decrypt_data(encrypted) == value
+
+
+def test_encryption_uses_a_random_iv():
+    assert encrypt_data("aynı metin") != encrypt_data("aynı metin")
+
+
+def test_batched_helpers_keep_none():
+    assert decrypt_many(encrypt_many(["a", None, "b"])) == ["a", None, "b"]
+
+
+def test_tampered_padding_is_rejected():
+    data = bytearray(base64.b64decode(encrypt_data("metin")))
+    data[-17] ^= 0xFF  # IV'NİN SON BYTE'I DEĞİŞİNCE ÇÖZÜLEN SON BYTE (PADDING) BOZULUR
+
+    with pytest.raises(ValueError):
+        decrypt_data(base64.b64encode(bytes(data)).decode())
+
+
+def test_email_blind_index_ignores_case_and_spaces():
+    assert email_blind_index(" Yazar@Example.com ") == blind_index("yazar@example.com")
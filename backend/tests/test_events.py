@@ -0,0 +1,111 @@
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+
+import events
+from events import InProcessBroker, format_sse, publish_article_event
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = InProcessBroker(buffer_size=5)
+    monkeypatch.setattr(events, "_broker", broker)
+    return broker
+
+
+def test_wait_replays_events_newer_than_the_cursor(broker):
+    first = broker.publish(["article:1"], "article_updated", {"n": 1})
+    broker.publish(["article:2"], "article_updated", {"n": 2})
+    third = broker.publish(["article:1", "admin"], "message_created", {"n": 3})
+
+    found, last_id = broker.wait(["article:1"], 0, 0)
+    assert [event["id"] for event in found] == [first, third]
+    assert last_id == third
+
+    found, last_id = broker.wait(["article:1"], first, 0)
+    assert [event["data"] for event in found] == [{"n": 3}]
+
+
+def test_wait_times_out_with_no_events(broker):
+    last = broker.publish(["admin"], "article_created", {})
+
+    start = time.monotonic()
+    found, last_id = broker.wait(["admin"], last, 0.05)
+
+    assert found == []
+    assert last_id == last
+    assert time.monotonic() - start >= 0.05
+
+
+def test_wait_without_cursor_only_sees_new_events(broker):
+    broker.publish(["admin"], "article_created", {"n": 1})
+
+    assert broker.wait(["admin"], None, 0) == ([], 1)
+
+
+def test_cursor_from_a_previous_process_is_reset(broker):
+    broker.publish(["admin"], "article_created", {})
+
+    assert broker.wait(["admin"], 999, 0) == ([], 1)
+
+
+def test_publish_wakes_a_waiting_client(broker):
+    timer = threading.Timer(0.05, broker.publish, (["article:7"], "article_updated", {"status": "Kabul Edildi"}))
+    timer.start()
+
+    start = time.monotonic()
+    found, last_id = broker.wait(["article:7"], 0, 5)
+    timer.join()
+
+    assert [event["type"] for event in found] == ["article_updated"]
+    assert time.monotonic() - start < 5
+
+
+def test_only_the_newest_events_are_buffered(broker):
+    for n in range(8):
+        broker.publish(["admin"], "article_created", {"n": n})
+
+    found, last_id = broker.wait(["admin"], 0, 0)
+
+    assert [event["data"]["n"] for event in found] == [3, 4, 5, 6, 7]
+    assert last_id == 8
+
+
+def test_publish_article_event_uses_article_channels(broker):
+    article = SimpleNamespace(id=12, status="İncelemede", editor_id=3)
+
+    publish_article_event(article, "article_updated", changed="status")
+
+    (event,), _ = broker.wait(["reviewer:3"], 0, 0)
+    assert event["data"] == {"changed": "status", "article_id": 12, "status": "İncelemede"}
+    assert broker.wait(["article:12"], 0, 0)[0] == broker.wait(["admin"], 0, 0)[0]
+
+
+def test_format_sse():
+    event = {"id": 4, "type": "message_created", "data": {"article_id": 1}}
+
+    assert format_sse(event) == 'id: 4\nevent: message_created\ndata: {"article_id": 1}\n\n'
+
+
+def test_poll_route_returns_events_after_the_cursor(client, broker):
+    first = broker.publish(["article:1"], "article_updated", {"n": 1})
+    second = broker.publish(["article:1"], "article_updated", {"n": 2})
+
+    data = client.get(f"/events/poll?channels=article:1&after={first}&timeout=0").get_json()
+
+    assert [event["id"] for event in data["events"]] == [second]
+    assert data["last_id"] == second
+
+
+def test_poll_route_times_out_empty(client, broker):
+    broker.publish(["article:1"], "article_updated", {})
+
+    data = client.get("/events/poll?channels=article:2&after=0&timeout=0.05").get_json()
+
+    assert data == {"events": [], "last_id": 0}
+
+
+@pytest.mark.parametrize("query", ["", "channels=user:1", "channels=admin&timeout=abc"])
+def test_poll_route_rejects_bad_parameters(client, broker, query):
+    assert client.get(f"/events/poll?{query}").status_code == 400
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+
+def seed_articles(count, start=0):
+    from crypto import encrypt_data, email_blind_index
+    from models import db, Article, Keyword, Reviewer
+
+    reviewer = Reviewer(name=encrypt_data(f"Hakem {start}"), interests=encrypt_data("Cybersecurity"))
+    db.session.add(reviewer)
+    db.session.flush()
+
+    now = datetime.utcnow()
+    for i in range(start, start + count):
+        email = f"yazar{i}@example.com"
+        article = Article(email=encrypt_data(email), email_index=email_blind_index(email),
+                          title=encrypt_data(f"Makale {i}"), authors=encrypt_data(f"Yazar {i}"),
+                          institution=encrypt_data("Kocaeli Üniversitesi"), pdf_path=f"uploads/{i}.pdf",
+                          created_at=now - timedelta(minutes=i), editor_id=reviewer.id)
+        db.session.add(article)
+        db.session.flush()
+        db.session.add(Keyword(article_id=article.id, keyword="Cybersecurity"))
+
+    db.session.commit()
+    db.session.remove()
+
+
+def papers_queries(client, query_counter):
+    query_counter.clear()
+    response = client.get('/get_papers')
+    assert response.status_code == 200
+    return len(response.get_json()['papers']), len(query_counter)
+
+
+def test_get_papers_query_count_does_not_grow_with_articles(client, query_counter):
+    seed_articles(1)
+    papers, single_queries = papers_queries(client, query_counter)
+    assert papers == 1
+
+    seed_articles(49, start=1)
+    papers, many_queries = papers_queries(client, query_counter)
+    assert papers == 50
+
+    assert many_queries == single_queries
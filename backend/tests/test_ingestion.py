@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import zipfile
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+pytest.importorskip("fitz")
+pytest.importorskip("pytesseract")
+
+import artifacts  # noqa: E402
+import ingestion  # noqa: E402
+from ingestion import referenced_files, stage_multipart_files, stage_zip_archive, validate_item  # noqa: E402
+
+
+@pytest.fixture
+def working_folder(tmp_path, monkeypatch):
+    folder = str(tmp_path / "tmp")
+    monkeypatch.setattr(artifacts, "WORKING_FOLDER", folder)
+    return folder
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+ITEM = {"file": "a.pdf", "email": "yazar@example.com", "title": "Başlık", "institution": "Kurum"}
+
+
+def test_validate_item_accepts_a_complete_item():
+    assert validate_item(ITEM, {"a.pdf": "/tmp/a.pdf"}) is None
+
+
+@pytest.mark.parametrize("field, value", [("email", ["x"]), ("title", 5), ("authors", {"ad": 1}), ("file", ["a"])])
+def test_validate_item_rejects_non_string_fields(field, value):
+    error = validate_item(dict(ITEM, **{field: value}), {"a.pdf": "/tmp/a.pdf"})
+
+    assert error and field in error
+
+
+def test_validate_item_reports_missing_fields_and_files():
+    assert "title" in validate_item(dict(ITEM, title=""), {"a.pdf": "/tmp/a.pdf"})
+    assert validate_item(ITEM, {}) == "PDF dosyası bulunamadı"
+
+
+def test_referenced_files_ignores_invalid_names_and_respects_the_limit(monkeypatch):
+    assert referenced_files([ITEM, {"file": 3}, {}]) == {"a.pdf"}
+
+    monkeypatch.setattr(ingestion, "BULK_UPLOAD_MAX_ITEMS", 1)
+    assert referenced_files([ITEM, ITEM]) == set()
+
+
+def test_zip_stages_only_referenced_pdfs(working_folder):
+    metadata = json.dumps([ITEM])
+    archive = make_zip({"metadata.json": metadata, "dir/a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b", "c.txt": b"x"})
+
+    staged, items = stage_zip_archive(archive)
+
+    assert items == [ITEM]
+    assert list(staged) == ["a.pdf"]
+    with open(staged["a.pdf"], 'rb') as f:
+        assert f.read() == b"%PDF-a"
+    assert os.listdir(working_folder) == [os.path.basename(staged["a.pdf"])]
+
+
+def test_form_metadata_overrides_the_archive(working_folder):
+    archive = make_zip({"metadata.json": json.dumps([ITEM]), "a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b"})
+
+    staged, items = stage_zip_archive(archive, json.dumps([dict(ITEM, file="b.pdf")]))
+
+    assert list(staged) == ["b.pdf"]
+
+
+def test_zip_over_the_item_limit_stages_nothing(working_folder, monkeypatch):
+    monkeypatch.setattr(ingestion, "BULK_UPLOAD_MAX_ITEMS", 1)
+    archive = make_zip({"metadata.json": json.dumps([ITEM, dict(ITEM, file="b.pdf")]),
+                        "a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b"})
+
+    staged, items = stage_zip_archive(archive)
+
+    assert staged == {}
+    assert len(items) == 2
+
+
+TWO_ITEMS = json.dumps([ITEM, dict(ITEM, file="b.pdf")])
+
+
+def test_zip_entry_over_the_file_limit_is_rejected(working_folder, monkeypatch):
+    monkeypatch.setattr(ingestion, "BULK_UPLOAD_MAX_FILE_BYTES", 100)
+    archive = make_zip({"metadata.json": TWO_ITEMS, "a.pdf": b"%PDF-a", "b.pdf": b"%PDF-" + b"0" * 200})
+
+    with pytest.raises(ValueError, match="b.pdf"):
+        stage_zip_archive(archive)
+
+    assert os.listdir(working_folder) == []
+
+
+def test_zip_over_the_total_limit_is_rejected(working_folder, monkeypatch):
+    monkeypatch.setattr(ingestion, "BULK_UPLOAD_MAX_TOTAL_BYTES", 150)
+    archive = make_zip({"metadata.json": TWO_ITEMS, "a.pdf": b"%PDF-" + b"0" * 100, "b.pdf": b"%PDF-" + b"0" * 100})
+
+    with pytest.raises(ValueError):
+        stage_zip_archive(archive)
+
+    assert os.listdir(working_folder) == []
+
+
+def test_written_bytes_are_limited_without_a_declared_size(working_folder, monkeypatch):
+    class Upload:
+        def __init__(self, filename, content):
+            self.filename = filename
+            self.stream = io.BytesIO(content)
+
+    monkeypatch.setattr(ingestion, "COPY_CHUNK_SIZE", 16)
+    monkeypatch.setattr(ingestion, "BULK_UPLOAD_MAX_FILE_BYTES", 100)
+
+    assert list(stage_multipart_files([Upload("a.pdf", b"%PDF-" + b"0" * 90)])) == ["a.pdf"]
+    with pytest.raises(ValueError):
+        stage_multipart_files([Upload("b.pdf", b"%PDF-" + b"0" * 200)])
+    assert len(os.listdir(working_folder)) == 1
+
+
+def test_entries_without_a_pdf_header_are_rejected(working_folder):
+    archive = make_zip({"metadata.json": json.dumps([ITEM]), "a.pdf": b"MZ-executable"})
+
+    with pytest.raises(ValueError, match="PDF"):
+        stage_zip_archive(archive)
+
+    assert os.listdir(working_folder) == []
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+
+import jobs  # noqa: E402
+from jobs import claim_next_job, enqueue_job, run_job  # noqa: E402
+
+
+@pytest.fixture
+def article(db_app):
+    from models import db, Article
+
+    article = Article(email="e", title="t", authors="a", institution="i", pdf_path="uploads/test.pdf")
+    db.session.add(article)
+    db.session.commit()
+    return article
+
+
+def make_due(job):
+    from models import db
+
+    job.run_after = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+
+def failing_handler(job):
+    raise RuntimeError("işlem başarısız")
+
+
+def test_successful_job_is_marked_done(article, monkeypatch):
+    from models import db
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test", lambda job: {"pages": 3})
+    job = enqueue_job("test", article.id)
+    db.session.commit()
+
+    claimed = claim_next_job("worker-1")
+    assert claimed.id == job.id
+    assert (claimed.status, claimed.attempts, claimed.locked_by) == ("running", 1, "worker-1")
+
+    assert run_job(claimed)
+    assert claimed.status == "done"
+    assert claimed.result_data == {"pages": 3}
+    assert claimed.locked_by is None
+
+
+def test_failed_job_is_retried_with_backoff(article, monkeypatch):
+    from models import db
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test", failing_handler)
+    job = enqueue_job("test", article.id, max_attempts=3)
+    db.session.commit()
+
+    assert not run_job(claim_next_job("worker-1"))
+    assert job.status == "queued"
+    assert "işlem başarısız" in job.last_error
+    assert job.run_after > datetime.utcnow() + timedelta(seconds=jobs.JOB_RETRY_DELAY - 5)
+
+    # BEKLEME SÜRESİ DOLMADAN TEKRAR ALINMAZ
+    assert claim_next_job("worker-1") is None
+
+    make_due(job)
+    assert not run_job(claim_next_job("worker-1"))
+    assert job.attempts == 2
+    assert job.run_after > datetime.utcnow() + timedelta(seconds=2 * jobs.JOB_RETRY_DELAY - 5)
+
+
+def test_job_moves_to_dead_letter_after_max_attempts(article, monkeypatch):
+    from models import db
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test", failing_handler)
+    job = enqueue_job("test", article.id, max_attempts=2)
+    db.session.commit()
+
+    for _ in range(2):
+        make_due(job)
+        assert not run_job(claim_next_job("worker-1"))
+
+    assert (job.status, job.attempts) == ("dead", 2)
+    make_due(job)
+    assert claim_next_job("worker-1") is None
+
+
+def test_single_attempt_job_is_never_retried(article, monkeypatch):
+    from models import db
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "test", failing_handler)
+    job = enqueue_job("test", article.id, max_attempts=1)
+    db.session.commit()
+
+    assert not run_job(claim_next_job("worker-1"))
+    assert job.status == "dead"
+
+
+def test_unknown_job_kind_fails(article):
+    from models import db
+
+    job = enqueue_job("bilinmeyen", article.id, max_attempts=1)
+    db.session.commit()
+
+    assert not run_job(claim_next_job("worker-1"))
+    assert job.status == "dead"
+    assert "Bilinmeyen iş türü" in job.last_error
+
+
+def test_jobs_of_a_busy_article_wait(article):
+    from models import db, Article
+
+    other = Article(email="e", title="t", authors="a", institution="i", pdf_path="uploads/other.pdf")
+    db.session.add(other)
+    db.session.commit()
+
+    first = enqueue_job("test", article.id)
+    db.session.commit()
+    second = enqueue_job("test", article.id)
+    third = enqueue_job("test", other.id)
+    db.session.commit()
+    first_id, third_id = first.id, third.id
+
+    assert claim_next_job("worker-1").id == first_id
+    assert claim_next_job("worker-2").id == third_id
+    assert claim_next_job("worker-3") is None
+    assert second.status == "queued"
+
+
+def test_stale_running_job_is_requeued(article):
+    from models import db
+
+    job = enqueue_job("test", article.id)
+    db.session.commit()
+    claimed = claim_next_job("worker-1")
+    claimed.locked_at = datetime.utcnow() - timedelta(seconds=jobs.JOB_LOCK_TIMEOUT + 1)
+    db.session.commit()
+
+    assert jobs.requeue_stale_jobs() == 1
+    assert claimed.status == "queued"
+    assert "worker-1" in claimed.last_error
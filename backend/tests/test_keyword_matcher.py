@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("rapidfuzz")
+pytest.importorskip("unidecode")
+
+from keyword_matcher import AhoCorasick, KeywordMatcher, normalize_term  # noqa: E402
+
+CATEGORIES = {
+    "Artificial Intelligence": ["deep learning", "cnn", "machine learning"],
+    "Cybersecurity": ["encryption", "network security", "security"],
+}
+
+
+def test_aho_corasick_finds_overlapping_terms():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+
+    found = sorted((end, ["he", "she", "his", "hers"][term]) for end, term in automaton.iter("ushers"))
+
+    assert found == [(3, "he"), (3, "she"), (5, "hers")]
+
+
+def test_normalize_term_folds_turkish_characters():
+    assert normalize_term("  ınteraction   Design ") == "interaction design"
+
+
+def test_exact_matches_respect_word_boundaries():
+    matcher = KeywordMatcher(CATEGORIES)
+
+    terms = {matcher.terms[term] for term, _, _, _ in matcher.match_page("CNN models; cnnx is not a match")}
+
+    assert terms == {"cnn"}
+
+
+def test_shared_suffix_terms_are_scored_for_each_category():
+    matcher = KeywordMatcher(CATEGORIES)
+
+    results = matcher.match([(0, "Network security and encryption.")])
+
+    assert set(results) == {"Cybersecurity"}
+    assert results["Cybersecurity"]["score"] == pytest.approx(3.0)
+    assert {match["term"] for match in results["Cybersecurity"]["matches"]} == {
+        "network security", "security", "encryption"}
+
+
+def test_fuzzy_match_scores_by_similarity():
+    matcher = KeywordMatcher(CATEGORIES)
+
+    results = matcher.match([(2, "We study machine learnng methods.")])
+
+    (match,) = results["Artificial Intelligence"]["matches"]
+    assert match["term"] == "machine learning"
+    assert match["page"] == 2
+    assert 90 <= match["score"] < 100
+    assert results["Artificial Intelligence"]["score"] == pytest.approx(match["score"] / 100)
+
+
+def test_short_terms_are_not_fuzzy_matched():
+    matcher = KeywordMatcher(CATEGORIES)
+
+    assert matcher.match([(0, "The cnm layer")]) == {}
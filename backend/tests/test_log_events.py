@@ -0,0 +1,64 @@
+import json
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+pytest.importorskip("cryptography")
+
+from crypto import decrypt_data, encrypt_data  # noqa: E402
+from log_events import log_event, log_events, render_events  # noqa: E402
+
+# ESKİ KODUN ŞİFRELEYİP SAKLADIĞI CÜMLELER
+BASELINE = {
+    "article_uploaded": "12345678 kodlu ve Derin Öğrenme başlıklı bir makale yüklendi. Yazarlar: Ada Lovelace.",
+    "reviewer_added": "Grace Hopper adlı hakem kaydı yapıldı.",
+    "reviewer_assigned": "12345678 kodlu makaleye Grace Hopper adlı hakem ataması yapıldı.",
+    "anonymity_updated": "12345678 kodlu makalenin anonimlik bilgisi güncellendi.",
+    "message_sent": "Mesaj gönderildi.",
+    "review_submitted": "12345678 kodlu makalenin değerlendirmesi tamamlandı.",
+    "article_revised": "12345678 kodlu makalenin revizesi yapıldı.",
+}
+FIELDS = {
+    "article_uploaded": {"title": "Derin Öğrenme", "authors": "Ada Lovelace"},
+    "reviewer_added": {"name": "Grace Hopper"},
+    "reviewer_assigned": {"reviewer_name": "Grace Hopper"},
+}
+
+
+def legacy_row(sentence):
+    return {'event': encrypt_data(sentence), 'event_type': None, 'actor': None, 'payload': None,
+            'article_id': 12345678, 'reviewer_id': None}
+
+
+def test_legacy_and_structured_rows_render_like_the_baseline(db_app):
+    logs = [log_event(event_type, article_id=12345678, **FIELDS.get(event_type, {})) for event_type in BASELINE]
+    rows = [legacy_row(sentence) for sentence in BASELINE.values()]
+    mixed = [row for pair in zip(rows, logs) for row in pair]
+
+    rendered = render_events(mixed)
+
+    expected = [sentence for sentence in BASELINE.values() for _ in range(2)]
+    assert rendered == expected
+
+
+def test_structured_rows_store_only_the_sensitive_fields_encrypted(db_app):
+    log = log_event("reviewer_assigned", article_id=12345678, reviewer_id=3, reviewer_name="Grace Hopper")
+
+    assert log.event is None
+    assert (log.event_type, log.actor, log.reviewer_id) == ("reviewer_assigned", "editor", 3)
+    assert "Grace" not in log.payload
+    assert json.loads(decrypt_data(log.payload)) == {"reviewer_name": "Grace Hopper"}
+
+
+def test_events_without_sensitive_fields_have_no_payload(db_app):
+    logs = log_events("review_submitted", [{'article_id': 1}, {'article_id': 2}], actor="system")
+
+    assert [log.payload for log in logs] == [None, None]
+    assert [log.actor for log in logs] == ["system", "system"]
+    assert render_events(logs) == ["1 kodlu makalenin değerlendirmesi tamamlandı.",
+                                   "2 kodlu makalenin değerlendirmesi tamamlandı."]
+
+
+def test_missing_template_fields_render_as_placeholders(db_app):
+    (log,) = log_events("reviewer_added", [{}])
+
+    assert render_events([log]) == ["? adlı hakem kaydı yapıldı."]
@@ -0,0 +1,83 @@
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+
+import log_segments  # noqa: E402
+from log_segments import compact_logs, iter_segment_rows, list_segments, segment_path  # noqa: E402
+
+
+@pytest.fixture
+def segment_folder(db_app, tmp_path, monkeypatch):
+    folder = str(tmp_path / "log_segments")
+    monkeypatch.setattr(log_segments, "LOG_SEGMENT_FOLDER", folder)
+    return folder
+
+
+def add_logs(ages_in_days, article_id=None):
+    from models import db, Log
+
+    now = datetime.utcnow()
+    logs = [Log(article_id=article_id, event_type="message_sent", actor="author", payload=None,
+                timestamp=now - timedelta(days=age)) for age in ages_in_days]
+    db.session.add_all(logs)
+    db.session.commit()
+    return [log.id for log in logs]
+
+
+def test_old_logs_move_to_segments(segment_folder):
+    from models import Log
+
+    old_ids = add_logs([40, 39, 38, 37, 36])
+    recent_ids = add_logs([1, 0])
+
+    written = compact_logs(datetime.utcnow() - timedelta(days=30), segment_rows=2)
+
+    assert len(written) == 3
+    assert [log.id for log in Log.query.order_by(Log.id)] == recent_ids
+    assert [(first, last) for first, last, _ in list_segments()] == [
+        (old_ids[0], old_ids[1]), (old_ids[2], old_ids[3]), (old_ids[4], old_ids[4])]
+
+    for path in written:
+        assert not os.stat(path).st_mode & 0o222
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        assert all(row['event_type'] == "message_sent" for row in rows)
+
+
+def test_segments_never_overlap_rows_left_in_the_table(segment_folder):
+    from models import Log
+
+    ids = add_logs([40, 1, 40])
+
+    compact_logs(datetime.utcnow() - timedelta(days=30))
+
+    # SINIRDAN SONRAKİ ESKİ KAYIT TABLODA KALIR, TAIL SIRASI BOZULMAZ
+    assert [log.id for log in Log.query.order_by(Log.id)] == ids[1:]
+    assert [(first, last) for first, last, _ in list_segments()] == [(ids[0], ids[0])]
+
+
+def test_compact_logs_without_old_rows_writes_nothing(segment_folder):
+    add_logs([1])
+
+    assert compact_logs(datetime.utcnow() - timedelta(days=30)) == []
+    assert list_segments() == []
+
+
+def test_iter_segment_rows_filters_and_resumes(segment_folder):
+    first_ids = add_logs([40, 40], article_id=1)
+    other_ids = add_logs([40], article_id=2)
+    compact_logs(datetime.utcnow() - timedelta(days=30))
+
+    assert [row['id'] for row in iter_segment_rows()] == first_ids + other_ids
+    assert [row['id'] for row in iter_segment_rows(after_id=first_ids[0])] == first_ids[1:] + other_ids
+    assert [row['id'] for row in iter_segment_rows(article_id=2)] == other_ids
+    assert isinstance(next(iter_segment_rows())['timestamp'], datetime)
+
+
+def test_segment_path_rejects_other_names(segment_folder):
+    with pytest.raises(ValueError):
+        segment_path("../app.py")
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+import pytest
+
+
+@pytest.fixture
+def segment_folder(app, tmp_path, monkeypatch):
+    import log_segments
+
+    folder = str(tmp_path / "log_segments")
+    monkeypatch.setattr(log_segments, "LOG_SEGMENT_FOLDER", folder)
+    return folder
+
+
+def add_logs(ages_in_days):
+    from models import db
+    from log_events import log_event
+
+    now = datetime.utcnow()
+    logs = [log_event("review_submitted", article_id=i + 1) for i in range(len(ages_in_days))]
+    for log, age in zip(logs, ages_in_days):
+        log.timestamp = now - timedelta(days=age)
+    db.session.commit()
+    return [log.id for log in logs]
+
+
+def all_pages(client, url):
+    ids, cursor = [], None
+    while True:
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        data = response.get_json()
+        ids.extend(log['id'] for log in data['logs'])
+        cursor = data['next_cursor']
+        if not cursor:
+            return ids, data
+
+
+def test_get_logs_continues_into_segments(client, segment_folder):
+    from log_segments import compact_logs, list_segments
+
+    ids = add_logs([40, 40, 40, 40, 1, 1])
+    compact_logs(datetime.utcnow() - timedelta(days=30), segment_rows=3)
+    assert len(list_segments()) == 2
+
+    for limit in (1, 2, 4, 10):
+        pages, _ = all_pages(client, f"/get_logs?limit={limit}")
+        assert pages == ids[::-1]
+
+    response = client.get("/get_logs?limit=10").get_json()
+    assert response['logs'][-1]['event'] == "1 kodlu makalenin değerlendirmesi tamamlandı."
+    assert 'payload' not in response['logs'][-1]
+
+
+def test_get_logs_filters_archived_rows(client, segment_folder):
+    from log_segments import compact_logs
+
+    ids = add_logs([40, 40, 1])
+    compact_logs(datetime.utcnow() - timedelta(days=30))
+
+    logs = client.get("/get_logs?article_id=2").get_json()['logs']
+    assert [log['id'] for log in logs] == [ids[1]]
+
+    since = (datetime.utcnow() - timedelta(days=2)).isoformat()
+    logs = client.get(f"/get_logs?from={since}").get_json()['logs']
+    assert [log['id'] for log in logs] == [ids[2]]
+
+
+def test_log_stats_include_archived_rows(client, segment_folder):
+    from log_segments import compact_logs
+
+    add_logs([40, 40, 1])
+    compact_logs(datetime.utcnow() - timedelta(days=30))
+
+    stats = client.get("/log_stats").get_json()
+
+    assert stats['counts'] == [{'event_type': "review_submitted", 'actor': "reviewer", 'count': 3}]
+    assert sum(entry['count'] for entry in stats['timeline']) == 3
+    assert [entry['date'] for entry in stats['timeline']] == sorted(entry['date'] for entry in stats['timeline'])
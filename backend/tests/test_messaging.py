@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("flask_sqlalchemy")
+pytest.importorskip("cryptography")
+
+from messaging import AUTHOR, REVIEWER, mark_read, record_message, recount_unread, unread_counts  # noqa: E402
+
+
+@pytest.fixture
+def article(db_app):
+    from models import db, Article, Reviewer
+
+    reviewer = Reviewer(name="r", interests="i")
+    article = Article(email="e", title="t", authors="a", institution="i", pdf_path="uploads/test.pdf")
+    db.session.add_all([reviewer, article])
+    db.session.commit()
+    return article
+
+
+def send(article, sender_role, count=1):
+    from models import db, Message, Reviewer
+
+    reviewer_id = Reviewer.query.first().id
+    for _ in range(count):
+        db.session.add(Message(article_id=article.id, reviewer_id=reviewer_id, sender_email="x",
+                               sender_role=sender_role, message="m"))
+        record_message(article.id, sender_role)
+    db.session.commit()
+
+
+def test_record_message_increments_the_recipient_counter(article):
+    send(article, AUTHOR, 2)
+    send(article, REVIEWER)
+
+    assert unread_counts([article.id]) == {article.id: {AUTHOR: 1, REVIEWER: 2}}
+
+
+def test_mark_read_updates_messages_and_resets_the_counter(article):
+    from models import db, Message
+
+    send(article, AUTHOR, 3)
+    send(article, REVIEWER)
+
+    assert mark_read(article.id, AUTHOR) == 3
+    db.session.commit()
+
+    assert unread_counts([article.id]) == {article.id: {AUTHOR: 1, REVIEWER: 0}}
+    assert Message.query.filter_by(sender_role=AUTHOR, is_read=False).count() == 0
+    assert Message.query.filter_by(sender_role=REVIEWER, is_read=False).count() == 1
+
+
+def test_mark_read_without_unread_messages(article):
+    assert mark_read(article.id, REVIEWER) == 0
+    assert unread_counts([article.id]) == {article.id: {AUTHOR: 0, REVIEWER: 0}}
+
+
+def test_recount_unread_repairs_counters(article):
+    from models import db, Article
+
+    send(article, AUTHOR, 2)
+    Article.query.filter_by(id=article.id).update({Article.reviewer_unread: 7, Article.author_unread: 5})
+
+    recount_unread(article.id)
+    db.session.commit()
+
+    assert unread_counts([article.id]) == {article.id: {AUTHOR: 0, REVIEWER: 2}}
@@ -0,0 +1,67 @@
+from datetime import datetime
+import pytest
+
+from pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, page_size_from, \
+    paginate, parse_datetime
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requested = None
+
+    def limit(self, limit):
+        self.requested = limit
+        return self
+
+    def all(self):
+        return self.rows[:self.requested]
+
+
+def test_page_size_is_clamped():
+    assert page_size_from({}) == DEFAULT_PAGE_SIZE
+    assert page_size_from({'limit': '0'}) == 1
+    assert page_size_from({'limit': str(MAX_PAGE_SIZE + 1)}) == MAX_PAGE_SIZE
+
+    with pytest.raises(ValueError):
+        page_size_from({'limit': 'on'})
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 3, 3, 12, 30)
+
+    values = decode_cursor(encode_cursor(created_at, 42))
+
+    assert parse_datetime(values[0]) == created_at
+    assert values[1] == 42
+
+
+@pytest.mark.parametrize("value", ["bozuk", "bm90LWpzb24="])
+def test_invalid_cursor_is_rejected(value):
+    with pytest.raises(ValueError):
+        decode_cursor(value)
+
+
+def test_parse_datetime():
+    assert parse_datetime(None) is None
+    assert parse_datetime("2025-03-28") == datetime(2025, 3, 28)
+
+    with pytest.raises(ValueError):
+        parse_datetime("28.03.2025")
+
+
+def test_paginate_fetches_one_extra_row_for_the_next_cursor():
+    query = FakeQuery(list(range(10)))
+
+    rows, next_cursor = paginate(query, 3, lambda row: (row,))
+
+    assert query.requested == 4
+    assert rows == [0, 1, 2]
+    assert decode_cursor(next_cursor) == [2]
+
+
+def test_paginate_last_page_has_no_cursor():
+    rows, next_cursor = paginate(FakeQuery([1, 2]), 3, lambda row: (row,))
+
+    assert rows == [1, 2]
+    assert next_cursor is None
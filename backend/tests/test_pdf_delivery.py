@@ -0,0 +1,88 @@
+import hashlib
+import pytest
+
+flask = pytest.importorskip("flask")
+pytest.importorskip("cryptography")
+
+from pdf_delivery import send_pdf  # noqa: E402
+
+CONTENT = b"%PDF-1.4\n" + bytes(range(256)) * 4
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "makale.pdf"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@pytest.fixture
+def pdf_client(pdf_file):
+    pdf_app = flask.Flask(__name__)
+    pdf_app.add_url_rule('/pdf', 'pdf', lambda: send_pdf(pdf_file))
+    return pdf_app.test_client()
+
+
+def test_full_response_carries_the_content_hash_etag(pdf_client):
+    response = pdf_client.get('/pdf')
+
+    assert response.status_code == 200
+    assert response.data == CONTENT
+    assert response.headers['Content-Type'] == 'application/pdf'
+    assert response.headers['Accept-Ranges'] == 'bytes'
+    assert response.get_etag() == (hashlib.sha256(CONTENT).hexdigest(), False)
+    assert 'no-cache' in response.headers['Cache-Control']
+    assert 'private' in response.headers['Cache-Control']
+
+
+def test_if_none_match_returns_304(pdf_client):
+    etag = pdf_client.get('/pdf').headers['ETag']
+
+    response = pdf_client.get('/pdf', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_changed_file_is_sent_again(pdf_client, pdf_file):
+    etag = pdf_client.get('/pdf').headers['ETag']
+    with open(pdf_file, 'ab') as f:
+        f.write(b"%%EOF")
+
+    response = pdf_client.get('/pdf', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.parametrize("header, start, end", [("bytes=0-99", 0, 99), ("bytes=100-", 100, len(CONTENT) - 1),
+                                                ("bytes=-10", len(CONTENT) - 10, len(CONTENT) - 1)])
+def test_range_returns_206_with_content_range(pdf_client, header, start, end):
+    response = pdf_client.get('/pdf', headers={'Range': header})
+
+    assert response.status_code == 206
+    assert response.headers['Content-Range'] == f"bytes {start}-{end}/{len(CONTENT)}"
+    assert response.data == CONTENT[start:end + 1]
+
+
+def test_unsatisfiable_range_returns_416(pdf_client):
+    response = pdf_client.get('/pdf', headers={'Range': f"bytes={len(CONTENT) + 10}-"})
+
+    assert response.status_code == 416
+
+
+def test_article_pdf_route_supports_conditional_and_range_requests(client, pdf_file):
+    from models import db, Article
+
+    article = Article(email="e", title="t", authors="a", institution="i", pdf_path=pdf_file)
+    db.session.add(article)
+    db.session.commit()
+    url = f'/get_article_pdf/{article.id}'
+
+    etag = client.get(url).headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    response = client.get(url, headers={'Range': "bytes=0-3"})
+    assert response.status_code == 206
+    assert response.headers['Content-Range'] == f"bytes 0-3/{len(CONTENT)}"
+    assert response.data == b"%PDF"
@@ -0,0 +1,47 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("flask_sqlalchemy")
+pytest.importorskip("cryptography")
+pytest.importorskip("rapidfuzz")
+
+from recommendation import balanced_assignment, score_matrix, top_k  # noqa: E402
+
+
+def test_score_matrix_is_cosine_similarity():
+    articles = np.array([[1, 0], [1, 1], [0, 0]], dtype=np.float32)
+    reviewers = np.array([[2, 0], [0, 3]], dtype=np.float32)
+
+    scores = score_matrix(articles, reviewers)
+
+    np.testing.assert_allclose(scores, [[1, 0], [2 ** -0.5, 2 ** -0.5], [0, 0]], atol=1e-6)
+
+
+def test_top_k_orders_best_reviewers_first():
+    scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.3, 0.2, 0.1]], dtype=np.float32)
+
+    assert top_k(scores, 2).tolist() == [[1, 3], [0, 1]]
+    assert top_k(scores, 10).shape == (2, 4)
+    assert top_k(scores[:, :0], 3).shape == (2, 0)
+
+
+def test_balanced_assignment_spreads_equal_matches():
+    scores = np.array([[1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0]], dtype=np.float32)
+
+    assignment = balanced_assignment(scores, [0, 0])
+
+    assert sorted(assignment.tolist()) == [0, 0, 1, 1]
+
+
+def test_balanced_assignment_accounts_for_existing_load():
+    scores = np.array([[0.9, 0.8]], dtype=np.float32)
+
+    assert balanced_assignment(scores, [2, 0]).tolist() == [1]
+    assert balanced_assignment(scores, [0, 0]).tolist() == [0]
+
+
+def test_balanced_assignment_skips_articles_without_a_match():
+    scores = np.array([[0.0, 0.0], [0.0, 0.5]], dtype=np.float32)
+
+    assert balanced_assignment(scores, [0, 0]).tolist() == [-1, 1]
+    assert balanced_assignment(scores[:, :0], []).tolist() == [-1, -1]
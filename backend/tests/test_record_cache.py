@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("cryptography")
+
+import record_cache  # noqa: E402
+from record_cache import LRUCache  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(record_cache, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+
+    assert cache.get(1) == "a"
+    cache.set(3, "c")
+
+    assert cache.get(2) is None
+    assert (cache.get(1), cache.get(3)) == ("a", "c")
+
+
+def test_overwriting_refreshes_recency(clock):
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.set(1, "a2")
+    cache.set(3, "c")
+
+    assert cache.get(1) == "a2"
+    assert cache.get(2) is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+
+    clock[0] += 60
+    assert cache.get(1) == "a"
+
+    clock[0] += 0.001
+    assert cache.get(1) is None
+    assert cache.stats() == {'size': 0, 'maxsize': 2, 'ttl': 60, 'hits': 1, 'misses': 1}
+
+
+def test_invalidate_and_clear(clock):
+    cache = LRUCache()
+    cache.set(1, "a")
+    cache.set(2, "b")
+
+    cache.invalidate(1)
+    cache.invalidate(99)
+    assert (cache.get(1), cache.get(2)) == (None, "b")
+
+    cache.clear()
+    assert cache.get(2) is None
+
+
+def test_decrypted_records_are_cached_until_invalidated(clock, monkeypatch):
+    from crypto import encrypt_data
+
+    monkeypatch.setattr(record_cache, "article_cache", LRUCache())
+    article = SimpleNamespace(id=7, title=encrypt_data("Eski"), authors=encrypt_data("Yazar"),
+                              email=encrypt_data("yazar@example.com"), institution=encrypt_data("Kurum"))
+
+    assert record_cache.decrypted_article(article)['title'] == "Eski"
+    article.title = encrypt_data("Yeni")
+    assert record_cache.decrypted_article(article)['title'] == "Eski"
+
+    record_cache.invalidate_article(7)
+    assert record_cache.decrypted_article(article)['title'] == "Yeni"
+
+
+def test_revision_invalidates_the_cached_title(client, monkeypatch):
+    from crypto import encrypt_data
+    from models import db, Article
+
+    monkeypatch.setattr(record_cache, "article_cache", LRUCache())
+    article = Article(email=encrypt_data("yazar@example.com"), title=encrypt_data("Eski"), authors=encrypt_data("A"),
+                      institution=encrypt_data("Kurum"), pdf_path="uploads/test.pdf")
+    db.session.add(article)
+    db.session.commit()
+    article_id = article.id
+
+    assert client.get('/get_papers').get_json()['papers'][0]['title'] == "Eski"
+    assert client.patch(f'/revise_article/{article_id}', data={'title': "Yeni"}).status_code == 200
+    assert client.get('/get_papers').get_json()['papers'][0]['title'] == "Yeni"
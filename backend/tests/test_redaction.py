@@ -0,0 +1,56 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from redaction import RedactionEngine, page_words  # noqa: E402
+
+
+def make_page(*lines):
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, line in enumerate(lines):
+        page.insert_text((72, 72 + i * 20), line, fontsize=11)
+    return doc, page
+
+
+def test_overlapping_fields_are_all_matched():
+    doc, page = make_page("Ada Lovelace Institute")
+    engine = RedactionEngine(authors=["Ada Lovelace"], institution=True)
+
+    matches = {kind: rects for kind, _, rects in engine.find(page)}
+
+    assert set(matches) == {"author0", "institution"}
+    assert matches["institution"][0][2] > matches["author0"][0][2]
+
+
+def test_redacted_page_keeps_no_overlapping_text():
+    doc, page = make_page("Ada Lovelace Institute")
+    engine = RedactionEngine(authors=["Ada Lovelace"], institution=True)
+
+    engine.redact_page(page, 0)
+
+    text = page.get_text("text")
+    assert "Lovelace" not in text
+    assert "Institute" not in text
+
+
+def test_partial_word_match_uses_character_boxes():
+    doc, page = make_page("contact:ada@example.org")
+    engine = RedactionEngine(email=True)
+
+    (kind, found, rects), = engine.find(page)
+    expected = page.search_for("ada@example.org")[0]
+
+    assert kind == "email"
+    assert found == "ada@example.org"
+    assert rects[0][0] == pytest.approx(expected.x0, abs=0.5)
+    assert rects[0][2] == pytest.approx(expected.x1, abs=0.5)
+
+
+def test_page_words_carry_one_box_per_character():
+    doc, page = make_page("Ada Lovelace")
+
+    words = page_words(page)
+
+    assert [word[4] for word in words] == ["Ada", "Lovelace"]
+    assert all(len(word[8]) == len(word[4]) for word in words)
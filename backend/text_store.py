@@ -0,0 +1,77 @@
+import gzip
+import json
+import os
+import uuid
+from ocr import ocr_pages
+from page_pool import map_pages
+from redaction import page_words
+from pdf_delivery import content_hash
+
+TEXT_STORE_FOLDER = 'uploads/text'
+# KAYIT BİÇİMİ DEĞİŞTİĞİNDE ARTIRILIR, ESKİ KAYITLAR YENİDEN ÇIKARILIR
+TEXT_STORE_VERSION = 2
+
+
+def extract_page(page):
+    # SAYFA METNİ VE KELİME KUTULARI; METİN KATMANI OLMAYAN SAYFALAR "ocr" İLE İŞARETLENİR
+    try:
+        text = page.get_text("text")
+        words = page_words(page)
+    except Exception as e:
+        print(f"Metin çıkarılırken hata oluştu: {e}")
+        return None
+
+    return {"text": text, "words": words, "ocr": not text.strip()}
+
+
+def _store_path(digest):
+    return os.path.join(TEXT_STORE_FOLDER, digest[:2], f"{digest}.v{TEXT_STORE_VERSION}.json.gz")
+
+
+def discard_document(digest):
+    # İÇERİĞİ DEPODAN SİLİNEN PDF'İN METİN KAYITLARI (ESKİ BİÇİM SÜRÜMLERİ DAHİL) SİLİNİR
+    folder = os.path.join(TEXT_STORE_FOLDER, digest[:2])
+    if not os.path.isdir(folder):
+        return 0
+
+    removed = 0
+    for name in os.listdir(folder):
+        if name.startswith(f"{digest}."):
+            os.remove(os.path.join(folder, name))
+            removed += 1
+
+    return removed
+
+
+def document_pages(pdf_path):
+    # AYNI İÇERİKLİ PDF İÇİN METİN ÇIKARMA VE OCR BİR KEZ YAPILIR, SONUÇ DİSKTE SAKLANIR.
+    # HATALI SAYFALAR None OLARAK DÖNER
+    store_path = _store_path(content_hash(pdf_path))
+
+    try:
+        with gzip.open(store_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    pages = map_pages(pdf_path, extract_page)
+
+    # METİN KATMANI OLMAYAN SAYFALAR AYRI OCR HAVUZUNDA SAYFA SAYFA İŞLENİR
+    ocr_page_nums = [page_num for page_num, page in enumerate(pages) if page and page["ocr"]]
+    for page_num, result in zip(ocr_page_nums, ocr_pages(pdf_path, ocr_page_nums)):
+        if result is None:
+            pages[page_num] = None
+        else:
+            pages[page_num]["text"], pages[page_num]["words"] = result
+
+    if any(page is None for page in pages):
+        # GEÇİCİ BİR HATA KALICI HALE GELMESİN DİYE EKSİK SONUÇ SAKLANMAZ
+        return pages
+
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    tmp_path = f"{store_path}.{uuid.uuid4().hex}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump(pages, f)
+    os.replace(tmp_path, store_path)
+
+    return pages
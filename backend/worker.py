@@ -0,0 +1,45 @@
+import argparse
+import multiprocessing
+import os
+import socket
+
+# SINIFLANDIRMA İŞLERİNİ FLASK UYGULAMASINDAN AYRI ÇALIŞTIRIR:
+#   python worker.py --processes 4
+
+
+def run_worker(index, poll_interval):
+    # HER İŞLEM app'İ KENDİSİ YÜKLER, BÖYLECE nlp MODELİ İŞLEM BAŞINA BİR KEZ YÜKLENİR
+    from app import app
+    from jobs import work_forever
+
+    worker_name = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    with app.app_context():
+        work_forever(worker_name, poll_interval=poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Makale sınıflandırma kuyruğu worker'ları")
+    parser.add_argument("--processes", type=int, default=int(os.environ.get("WORKER_PROCESSES", 2)))
+    parser.add_argument("--poll-interval", type=float, default=2.0)
+    args = parser.parse_args()
+
+    # HER İŞLEMİN OCR HAVUZU ÇEKİRDEKLERİN BİR PAYINI ALIR, TOPLAM OCR SÜRECİ ÇEKİRDEK SAYISINI AŞMAZ
+    os.environ.setdefault("OCR_WORKERS", str(max(1, (os.cpu_count() or 1) // max(args.processes, 1))))
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=run_worker, args=(i, args.poll_interval))
+               for i in range(args.processes)]
+
+    for worker in workers:
+        worker.start()
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -48,6 +48,7 @@ interface Paper {
 
 const AdminDashboard: React.FC = () => {
   const [papers, setPapers] = useState<Paper[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedPaper, setSelectedPaper] = useState<Paper | null>(null);
   const [openDialog, setOpenDialog] = useState(false);
@@ -60,21 +61,22 @@ const AdminDashboard: React.FC = () => {
   const [openModal, setOpenModal] = useState(false);
   const [openPdfModal, setOpenPdfModal] = useState(false);
 
-  useEffect(() => {
-    const fetchPapers = async () => {
-      try {
-        const response = await fetch('/get_papers');
-        if (!response.ok) {
-          throw new Error('Makaleler alınırken hata oluştu.');
-        }
-        const data = await response.json();
-        setPapers(data);
-      } catch (error) {
-        console.error('Makaleler alınırken hata oluştu', error);
-        setMessage({ type: 'error', text: 'Makaleler alınırken hata oluştu.' });
+  const fetchPapers = async (cursor: string | null = null) => {
+    try {
+      const response = await fetch(cursor ? `/get_papers?cursor=${encodeURIComponent(cursor)}` : '/get_papers');
+      if (!response.ok) {
+        throw new Error('Makaleler alınırken hata oluştu.');
       }
-    };
+      const data = await response.json();
+      setPapers((prevPapers) => (cursor ? [...prevPapers, ...data.papers] : data.papers));
+      setNextCursor(data.next_cursor);
+    } catch (error) {
+      console.error('Makaleler alınırken hata oluştu', error);
+      setMessage({ type: 'error', text: 'Makaleler alınırken hata oluştu.' });
+    }
+  };
 
+  useEffect(() => {
     fetchPapers();
   }, []);
 
@@ -211,22 +213,54 @@ const AdminDashboard: React.FC = () => {
     paper.email.toLowerCase().includes(searchQuery.toLowerCase())
   );
 
-  const handleBlurPdf = async (paperId: number, field: 'is_authors_anonymous' | 'is_mail_anonymous' | 'is_institution_anonymous') => {
-    try {
-      const response = await fetch(`/blur_article_pdf/${paperId}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ field }),
-      });
-  
+  // ARKA PLAN İŞİ SADECE worker.py ÇALIŞIYORSA İLERLER; SÜRE DOLARSA BEKLEMEYİ BIRAKIR
+  const JOB_POLL_TIMEOUT_MS = 120000;
+
+  const waitForJob = async (jobId: number) => {
+    const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      const response = await fetch(`/job_status/${jobId}`);
       if (!response.ok) {
-        throw new Error('PDF blurlanırken hata oluştu.');
+        throw new Error('İş durumu alınamadı.');
       }
-      
-      const data = await response.json();
+
+      const job = await response.json();
+      if (job.status === 'done') {
+        return job;
+      }
+      if (job.status === 'dead') {
+        throw new Error('İş başarısız oldu.');
+      }
+
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+    }
+    throw new Error('İş zaman aşımına uğradı. worker.py çalışıyor mu?');
+  };
+
+  const runPdfJob = async (endpoint: 'blur_article_pdf' | 'unblur_article_pdf', paperId: number | string, field: string) => {
+    const response = await fetch(`/${endpoint}/${paperId}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ field }),
+    });
+
+    if (!response.ok) {
+      throw new Error('PDF işlemi başarısız oldu.');
+    }
+
+    // VARSAYILAN OLARAK İŞLEM İSTEK İÇİNDE YAPILIR; SUNUCU İŞİ KUYRUĞA ALIRSA (202) SONUCU BEKLENİR
+    const data = await response.json();
+    return response.status === 202 ? waitForJob(data.job_id) : data;
+  };
+
+  const handleBlurPdf = async (paperId: number, field: 'is_authors_anonymous' | 'is_mail_anonymous' | 'is_institution_anonymous') => {
+    try {
+      await runPdfJob('blur_article_pdf', paperId, field);
+
+      // PDF İÇERİĞİ SADECE GÖRÜNTÜLENİRKEN /get_article_pdf ÜZERİNDEN İNDİRİLİR
       setPapers((prevPapers) =>
         prevPapers.map((paper) =>
-          Number(paper.id) === paperId ? { ...paper, pdf_data: data.pdf_data } : paper
+          Number(paper.id) === paperId ? { ...paper, pdf_data: '' } : paper
         )
       );
   
@@ -239,20 +273,11 @@ const AdminDashboard: React.FC = () => {
 
   const handleUnblurPdf = async (paperId: number, field: 'is_authors_anonymous' | 'is_mail_anonymous' | 'is_institution_anonymous') => {
     try {
-      const response = await fetch(`/unblur_article_pdf/${paperId}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ field }),
-      });
-  
-      if (!response.ok) {
-        throw new Error('PDF unblurlanırken hata oluştu.');
-      }
-  
-      const data = await response.json();
+      await runPdfJob('unblur_article_pdf', paperId, field);
+
       setPapers((prevPapers) =>
         prevPapers.map((paper) =>
-          Number(paper.id) === paperId ? { ...paper, pdf_data: data.pdf_data } : paper
+          Number(paper.id) === paperId ? { ...paper, pdf_data: '' } : paper
         )
       );
   
@@ -304,18 +329,10 @@ const AdminDashboard: React.FC = () => {
       const fields = ["is_authors_anonymous", "is_mail_anonymous", "is_institution_anonymous"];
   
       for (const field of fields) {
-        const unblurResponse = await fetch(`/unblur_article_pdf/${selectedPaper.id}`, {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify({ field }),
-        });
-  
-        const unblurResult = await unblurResponse.json();
-  
-        if (!unblurResponse.ok) {
-          alert(`Unblur işlemi başarısız (${field}): ${unblurResult.error}`);
+        try {
+          await runPdfJob('unblur_article_pdf', selectedPaper.id, field);
+        } catch (error) {
+          alert(`Unblur işlemi başarısız (${field}): ${error}`);
           return;
         }
       }
@@ -516,6 +533,14 @@ const AdminDashboard: React.FC = () => {
           </Table>
         </TableContainer>
 
+        {nextCursor && (
+          <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+            <Button variant="outlined" onClick={() => fetchPapers(nextCursor)}>
+              Daha Fazla Yükle
+            </Button>
+          </Box>
+        )}
+
         {/* Hakem Ekleme Dialog */}
         <Dialog open={openReviewerDialog} onClose={() => setOpenReviewerDialog(false)} maxWidth="sm" fullWidth>
           <DialogTitle>Yeni Hakem Ekle</DialogTitle>
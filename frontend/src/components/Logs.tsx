@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { Container, TextField, Table, TableBody, TableCell, TableContainer, TableHead, TableRow, Paper, Typography } from '@mui/material';
+import { Box, Button, Container, TextField, Table, TableBody, TableCell, TableContainer, TableHead, TableRow, Paper, Typography } from '@mui/material';
 
 interface Log {
   id: number;
@@ -12,12 +12,20 @@ interface Log {
 const Logs: React.FC = () => {
   const [logs, setLogs] = useState<Log[]>([]);
   const [searchQuery, setSearchQuery] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
 
-  useEffect(() => {
-    fetch('/get_logs')
+  const fetchLogs = (cursor: string | null = null) => {
+    fetch(cursor ? `/get_logs?cursor=${encodeURIComponent(cursor)}` : '/get_logs')
       .then(response => response.json())
-      .then(data => setLogs(data))
+      .then(data => {
+        setLogs(prevLogs => (cursor ? [...prevLogs, ...data.logs] : data.logs));
+        setNextCursor(data.next_cursor);
+      })
       .catch(error => console.error('Logları çekerken hata oluştu:', error));
+  };
+
+  useEffect(() => {
+    fetchLogs();
   }, []);
 
   const filteredLogs = logs.filter(log =>
@@ -62,6 +70,13 @@ const Logs: React.FC = () => {
           </TableBody>
         </Table>
       </TableContainer>
+      {nextCursor && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', mt: 2 }}>
+          <Button variant="outlined" onClick={() => fetchLogs(nextCursor)}>
+            Daha Fazla Yükle
+          </Button>
+        </Box>
+      )}
       </Paper>
     </Container>
   );
@@ -78,6 +78,29 @@ const PaperStatus: React.FC = () => {
     }
   };
 
+  // MAKALE KANALINDAKİ DEĞİŞİKLİKLER SSE İLE DİNLENİR, LİSTELER TEKRAR TEKRAR SORGULANMAZ
+  useEffect(() => {
+    if (!openModal || !trackingNumber) {
+      return;
+    }
+
+    const source = new EventSource(`/events?channels=article:${trackingNumber}`);
+    const refreshMessages = () => fetchMessages();
+    const updateStatus = (event: MessageEvent) => {
+      const data = JSON.parse(event.data);
+      setPaperDetails((prev) => (prev ? { ...prev, status: data.status } : prev));
+    };
+
+    source.addEventListener('message', refreshMessages);
+    source.addEventListener('messages_read', refreshMessages);
+    ['reviewer_assigned', 'review_submitted', 'article_revised'].forEach((type) =>
+      source.addEventListener(type, updateStatus as EventListener)
+    );
+
+    return () => source.close();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [openModal, trackingNumber]);
+
   useEffect(() => {
     if (!trackingNumber || !(paperDetails?.status === "Kabul Edildi" || paperDetails?.status === "Reddedildi")) {
       return;
@@ -16,6 +16,7 @@ import {
   MenuItem,
   Select,
   SelectChangeEvent,
+  Badge,
 } from '@mui/material';
 import CloseIcon from '@mui/icons-material/Close';
 
@@ -86,6 +87,7 @@ const ReviewerDashboard: React.FC = () => {
       }
       const data = await response.json();
       setMessages(data.messages);
+      setPapers((prev) => prev.map((paper) => (paper.id === paperId ? { ...paper, unread_messages: 0 } : paper)));
     } catch (error) {
       console.error('Mesajlar alınırken hata oluştu', error);
       setSearch('Mesajlar alınırken bir hata oluştu.');
@@ -210,7 +212,11 @@ const ReviewerDashboard: React.FC = () => {
             <TableBody>
               {papers.map((paper) => (
                 <TableRow key={paper.id} onClick={() => handleViewDetails(paper)} style={{ cursor: 'pointer' }}>
-                  <TableCell>{paper.title}</TableCell>
+                  <TableCell>
+                    <Badge color="error" badgeContent={paper.unread_messages} invisible={!paper.unread_messages}>
+                      {paper.title}
+                    </Badge>
+                  </TableCell>
                   <TableCell>{paper.authors}</TableCell>
                   <TableCell>{paper.email}</TableCell>
                   <TableCell>{paper.institution}</TableCell>